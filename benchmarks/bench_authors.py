@@ -0,0 +1,125 @@
+"""
+Author lookups on a synthetic corpus: autocomplete latency from the in-memory
+prefix index, and "papers by author" through the inverted author index vs
+the old ILIKE over Paper.authors.
+
+    python -m benchmarks.bench_authors --papers 200000
+"""
+import argparse
+import itertools
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_search import CONFERENCES, SYLLABLES
+from benchmarks.fixtures import FIRST, fake_title
+from database import Base, Paper
+from database.authors import find_author, load_author_index, papers_by_author
+from database.normalize import index_authors
+from database.pagination import paginate
+
+PAGE_SIZE = 100
+
+
+def author_pool(size=150000, seed=0):
+    """Distinct "First Last" names; a few prolific authors, a long tail (Zipf-like)."""
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < size:
+        last = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        names.add(f"{rng.choice(FIRST)} {last}")
+    names = sorted(names)
+    rng.shuffle(names)
+    return names, list(itertools.accumulate(1.0 / (rank + 1) ** 0.8 for rank in range(len(names))))
+
+
+def load_corpus(engine, n, seed=0):
+    rng = random.Random(seed)
+    names, cum_weights = author_pool(seed=seed)
+    rows = [
+        {
+            "title": f"{fake_title(rng)} {i}",
+            "authors": ", ".join(rng.choices(names, cum_weights=cum_weights, k=rng.randint(1, 6))),
+            "conference": rng.choice(CONFERENCES),
+            "year": rng.randint(2018, 2025),
+            "url": f"https://example.org/{i}",
+        }
+        for i in range(n)
+    ]
+    Session = sessionmaker(bind=engine)
+    for start in range(0, n, 10000):
+        with Session() as session:
+            ids = session.execute(insert(Paper).returning(Paper.id, Paper.authors), rows[start:start + 10000]).all()
+            index_authors(session, ids, replace=False)
+            session.commit()
+    return names
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:<38} p50 {statistics.median(samples):8.3f} ms   p99 {p99:8.3f} ms   max {samples[-1]:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_authors_")
+    engine = create_engine(f"sqlite:///{workdir}/bench.db")
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    names = load_corpus(engine, args.papers)
+    print(f"corpus: {args.papers} papers, indexed in {time.perf_counter() - started:.1f}s")
+
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = load_author_index(session)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"author index: {len(index)} authors, {len(index.prefix.rows)} entries, "
+          f"built in {elapsed:.2f}s (peak {peak / 2**20:.0f} MB while building)")
+
+    rng = random.Random(1)
+    for length in (1, 2, 3, 5):
+        prefixes = [rng.choice(rng.choice(names).split())[:length] for _ in range(args.queries)]
+        queue = iter(prefixes)
+        report(f"autocomplete, {length}-character prefix", timed(lambda: index.complete(next(queue), 10), len(prefixes)))
+
+    # Papers by author: the old substring scan vs the index
+    picked = [rng.choice(index.names) for _ in range(20)]
+    columns = (Paper.id, Paper.title, Paper.authors, Paper.conference, Paper.year, Paper.url)
+    queue = iter(picked)
+    report("papers by author, ILIKE", timed(lambda: session.execute(
+        select(*columns).where(Paper.authors.ilike(f"%{next(queue)}%")).order_by(Paper.id.desc()).limit(PAGE_SIZE)
+    ).all(), len(picked)))
+    queue = iter(picked)
+
+    def indexed():
+        author = find_author(session, next(queue))
+        paginate(papers_by_author(session.query(*columns), author.id), PAGE_SIZE)
+    report("papers by author, author index", timed(indexed, len(picked)))
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Load test: concurrent requests against a real uvicorn server (one worker) on a
+temporary database of generated papers. Slow ranked searches are mixed with
+cheap listing pages, so a server whose queries block the event loop shows up as
+high latency for the cheap pages as well as low throughput.
+
+    python -m benchmarks.bench_concurrency --papers 100000 --clients 16 --requests 400
+
+The response cache is turned off so every request reaches the database.
+"""
+import argparse
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from benchmarks.bench_search import SYLLABLES, load_corpus
+from database import Base
+from database.search import setup_search
+from database.stats import rebuild_stats
+
+FAST_PATHS = ["/?limit=20", "/api/papers?limit=50", "/?conferences=CVPR&min_year=2022", "/api/jobs"]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(url, timeout=5).status_code < 500:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+def workload(n, slow_share, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        if rng.random() < slow_share:
+            out.append(("slow", f"/?q={rng.choice(SYLLABLES)}&limit=50"))
+        else:
+            out.append(("fast", rng.choice(FAST_PATHS)))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=100000)
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent connections")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--slow-share", type=float, default=0.25, help="Share of ranked searches")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_concurrency_")
+    url = f"sqlite:///{os.path.join(workdir, 'papers.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    load_corpus(engine, args.papers)
+    setup_search(engine)
+    with Session(engine) as session:
+        rebuild_stats(session)
+        session.commit()
+    engine.dispose()
+
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=url, SCAN_WORKER="external", RESPONSE_CACHE="off",
+               DATA_GENERATION_FILE=os.path.join(workdir, "generation"), VECTOR_DIR=os.path.join(workdir, "vectors"))
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+                               "--log-level", "warning"], env=env)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(base + "/api/jobs")
+        jobs = workload(args.requests, args.slow_share)
+        local = threading.local()  # one keep-alive session per client thread
+
+        def one(job):
+            kind, path = job
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+            started = time.perf_counter()
+            response = local.session.get(base + path, timeout=120)
+            response.raise_for_status()
+            return kind, time.perf_counter() - started
+
+        for kind, path in jobs[:20]:  # warm up
+            requests.get(base + path, timeout=120)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            results = list(pool.map(one, jobs))
+        wall = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{len(results)} requests, {args.clients} clients, {args.papers} papers: "
+          f"{len(results) / wall:.1f} req/s")
+    for kind in ("fast", "slow"):
+        latencies = sorted(t for k, t in results if k == kind)
+        if latencies:
+            print(f"  {kind:<5} n={len(latencies):<5} p50={statistics.median(latencies) * 1000:8.1f} ms  "
+                  f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
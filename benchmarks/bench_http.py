@@ -0,0 +1,54 @@
+"""
+Many small page fetches against the local fixture server, the way enrichment
+hits one host with thousands of detail pages: a fresh connection per request
+(module-level requests.get, as scrapers did before) vs the pooled HTTPClient.
+
+    python -m benchmarks.bench_http --pages 500 --workers 8 --latency 0.01
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.fixtures import cvf_page
+from scrapers.http import DEFAULT_HEADERS, HTTPClient, format_stats
+
+
+def run(fetch, urls, workers):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        sizes = list(pool.map(fetch, urls))
+    return time.perf_counter() - started, sum(sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated server latency (s)")
+    args = parser.parse_args()
+
+    pages = {f"/detail/{i}.html": cvf_page(5, seed=i) for i in range(args.pages)}
+    with FixtureServer(pages, latency=args.latency, compress=True) as server:
+        urls = [server.url(path) for path in pages]
+
+        def one_off(url):
+            response = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
+            return len(response.content)
+
+        elapsed, size = run(one_off, urls, args.workers)
+        print(f"requests.get  wall={elapsed:6.2f}s  connections={len(urls)} (one per request)  "
+              f"{size / 1e6:.1f} MB decoded")
+
+        client = HTTPClient()
+        elapsed, size = run(lambda url: len(client.get(url).content), urls, args.workers)
+        stats = client.stats.snapshot()
+        print(f"HTTPClient    wall={elapsed:6.2f}s  {format_stats(stats)}, "
+              f"{stats['bytes_decoded'] / 1e6:.1f} MB decoded")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
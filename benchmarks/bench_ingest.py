@@ -0,0 +1,87 @@
+"""
+Ingest throughput of Scanner._save_papers for one synthetic conference-year.
+
+    python -m benchmarks.bench_ingest --papers 50000
+    BENCH_POSTGRES_URL=postgresql://user:pw@localhost/bench python -m benchmarks.bench_ingest
+
+Each backend is measured twice: a cold ingest into an empty table and a
+re-ingest of the same papers, where every row is a duplicate. The
+near-duplicate pass Scanner runs after a scan (index_new_titles) is timed
+separately.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.fixtures import fake_authors, fake_title
+from database import Base
+from database.normalize import index_new_titles
+from scanner import Scanner
+from scrapers.base import PaperData
+
+
+def synthetic_papers(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        PaperData(
+            title=f"{fake_title(rng)} {i}",
+            authors=", ".join(fake_authors(rng)),
+            url=f"https://example.org/paper/{i}",
+            pdf_url=f"https://example.org/paper/{i}.pdf",
+        )
+        for i in range(n)
+    ]
+
+
+def bench_backend(name, url, papers):
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    scanner = Scanner.__new__(Scanner)  # only _save_papers is needed, skip config loading
+
+    for label in ("cold", "re-ingest"):
+        session = Session()
+        started = time.perf_counter()
+        added = scanner._save_papers(session, papers, "BENCH", 2024, "https://example.org/")
+        session.commit()
+        elapsed = time.perf_counter() - started
+        session.close()
+        print(f"{name:<10} {label:<10} papers={len(papers):<7} added={added:<7} "
+              f"{elapsed:7.2f}s {len(papers) / elapsed:10.0f} rows/s")
+
+    session = Session()
+    started = time.perf_counter()
+    marked = index_new_titles(session)
+    elapsed = time.perf_counter() - started
+    session.close()
+    print(f"{name:<10} {'titles':<10} papers={len(papers):<7} marked={marked:<6} "
+          f"{elapsed:7.2f}s {len(papers) / elapsed:10.0f} rows/s")
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=50000)
+    args = parser.parse_args()
+
+    papers = synthetic_papers(args.papers)
+    workdir = tempfile.mkdtemp(prefix="bench_ingest_")
+    bench_backend("sqlite", f"sqlite:///{workdir}/bench.db", papers)
+
+    pg_url = os.getenv("BENCH_POSTGRES_URL")
+    if pg_url:
+        bench_backend("postgresql", pg_url, papers)
+    else:
+        print("postgresql skipped (set BENCH_POSTGRES_URL to a scratch database)")
+
+
+if __name__ == "__main__":
+    main()
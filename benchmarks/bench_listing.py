@@ -0,0 +1,84 @@
+"""
+Cost of the listing page's bookkeeping queries (filtered total + conference
+facet): COUNT / SELECT DISTINCT over papers vs the materialized paper_stats.
+
+    python -m benchmarks.bench_listing --papers 200000
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_search import CONFERENCES, load_corpus
+from database import Base, Paper
+from database.stats import conference_names, count_papers, invalidate_stats, rebuild_stats
+
+
+def filters(n, seed=1):
+    rng = random.Random(seed)
+    out = [(None, None, None)]  # the unfiltered landing page
+    for _ in range(n - 1):
+        lo = rng.choice([None, 2019, 2021, 2023])
+        confs = rng.sample(CONFERENCES, rng.randint(1, 3)) if rng.random() < 0.5 else None
+        out.append((lo, None, confs))
+    return out
+
+
+def scan_path(session, min_year, max_year, confs):
+    query = session.query(Paper)
+    if min_year is not None:
+        query = query.filter(Paper.year >= min_year)
+    if max_year is not None:
+        query = query.filter(Paper.year <= max_year)
+    if confs:
+        query = query.filter(Paper.conference.in_(confs))
+    total = query.count()
+    [c for (c,) in session.query(Paper.conference).distinct() if c]
+    return total
+
+
+def stats_path(session, min_year, max_year, confs):
+    total = count_papers(session, min_year, max_year, confs)
+    conference_names(session)
+    return total
+
+
+def time_path(session, path, cases):
+    latencies = []
+    for case in cases:
+        started = time.perf_counter()
+        path(session, *case)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=200000)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_listing_")
+    engine = create_engine(f"sqlite:///{workdir}/bench.db")
+    Base.metadata.create_all(bind=engine)
+    load_corpus(engine, args.papers)
+    session = sessionmaker(bind=engine)()
+    rebuild_stats(session)
+    session.commit()
+    invalidate_stats()
+
+    cases = filters(args.requests)
+    for case in cases[:5]:
+        assert scan_path(session, *case) == stats_path(session, *case), case
+    for label, path in (("count+distinct", scan_path), ("paper_stats", stats_path)):
+        p50, p99 = time_path(session, path, cases)
+        print(f"{label:<15} requests={len(cases):<5} p50={p50 * 1000:8.2f} ms  p99={p99 * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
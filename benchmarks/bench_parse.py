@@ -0,0 +1,91 @@
+"""
+Per-page parse time and peak memory of every scraper under each HTML parser
+backend, with and without the scraper's partial-parse strainer. Times cover
+scrape() end to end (parse + extraction) with the download stubbed out.
+
+    python -m benchmarks.bench_parse
+    python -m benchmarks.bench_parse --repeat 5 --only ACMCCS NDSS
+
+Pages come from benchmarks.fixtures. To measure a real saved page instead,
+pass --page TYPE URL FILE (e.g. --page ACMCCS https://dblp.org/db/conf/ccs/ccs2024.html ccs2024.html).
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from benchmarks.fixtures import FIXTURE_CASES
+from scanner import Scanner
+
+
+def available_parsers():
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+def run_once(scraper, content, url):
+    """Time scrape() end to end with the download replaced by the fixture bytes."""
+    scraper.fetch = lambda url: content
+    started = time.perf_counter()
+    papers = scraper.scrape(url)
+    return time.perf_counter() - started, len(papers)
+
+
+def measure(scanner, scraper_type, url, content, parser, partial, repeat):
+    def make_scraper():
+        scraper = scanner.get_scraper(scraper_type, scraper_type, 2024)
+        scraper.parser = parser
+        if not partial:
+            scraper.parse_only = lambda url: None
+        return scraper
+
+    times = []
+    for _ in range(repeat):
+        elapsed, count = run_once(make_scraper(), content, url)
+        times.append(elapsed)
+
+    # Separate run for memory: tracemalloc slows everything down
+    tracemalloc.start()
+    run_once(make_scraper(), content, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak, count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="Scraper types to include")
+    parser.add_argument("--page", nargs=3, action="append", metavar=("TYPE", "URL", "FILE"),
+                        help="Benchmark a saved page instead of the generated fixtures")
+    args = parser.parse_args()
+
+    if args.page:
+        cases = [(t, url, open(path, "rb").read(), None) for t, url, path in args.page]
+    else:
+        cases = [(t, url, make_page().encode("utf-8"), expected) for t, url, make_page, expected in FIXTURE_CASES]
+    if args.only:
+        cases = [case for case in cases if case[0] in args.only]
+
+    scanner = Scanner(use_cache=False)
+    print(f"{'scraper':<8} {'page':<42} {'KB':>6} {'parser':<12} {'mode':<8} "
+          f"{'scrape ms':>10} {'peak MB':>8} {'papers':>7}")
+    for scraper_type, url, content, expected in cases:
+        has_strainer = scanner.get_scraper(scraper_type, scraper_type, 2024).parse_only(url) is not None
+        for backend in available_parsers():
+            for partial in ([False, True] if has_strainer else [False]):
+                elapsed, peak, count = measure(
+                    scanner, scraper_type, url, content, backend, partial, args.repeat)
+                flag = "" if expected is None or count == expected else f"  (expected {expected})"
+                print(f"{scraper_type:<8} {url[-42:]:<42} {len(content) // 1024:>6} {backend:<12} "
+                      f"{'partial' if partial else 'full':<8} {elapsed * 1000:10.1f} "
+                      f"{peak / 2**20:8.1f} {count:>7}{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Listing page and /api/papers latency with the response cache off, in memory
+and in SQLite, against a temporary database of generated papers.
+
+    python -m benchmarks.bench_response_cache --papers 20000 --requests 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+QUERIES = ["/", "/?q=ka", "/?conferences=CVPR&conferences=ICCV&min_year=2023",
+           "/api/papers?limit=100", "/api/papers?q=ro"]
+
+
+def timed(client, path, n):
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        client.get(path)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per URL and backend")
+    args = parser.parse_args()
+
+    # Must be set before the app (and its engine) is imported
+    workdir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'papers.db')}"
+    os.environ["DATA_GENERATION_FILE"] = os.path.join(workdir, "generation")
+    os.environ["VECTOR_DIR"] = os.path.join(workdir, "vectors")
+    os.environ["SCAN_WORKER"] = "external"
+
+    from fastapi.testclient import TestClient
+
+    import main as app_module
+    from benchmarks.bench_search import load_corpus
+    from database import SessionLocal, engine, init_db
+    from database.stats import rebuild_stats
+    from response_cache import ResponseCache, SQLiteBackend, make_cache
+
+    init_db()
+    load_corpus(engine, args.papers)
+    with SessionLocal() as session:
+        rebuild_stats(session)
+        session.commit()
+
+    backends = {
+        "off": make_cache("off"),
+        "memory": make_cache("memory"),
+        "sqlite": ResponseCache(SQLiteBackend(os.path.join(workdir, "responses.db"))),
+    }
+    client = TestClient(app_module.app)
+    print(f"{'backend':<8} {'url':<55} {'median ms':>10} {'p95 ms':>8}")
+    for name, cache in backends.items():
+        app_module.page_cache = cache
+        for path in QUERIES:
+            samples = sorted(timed(client, path, args.requests))
+            print(f"{name:<8} {path:<55} {statistics.median(samples) * 1000:>10.2f} "
+                  f"{samples[int(len(samples) * 0.95)] * 1000:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Wall time of a full Scanner.run against the local fixture server,
+sequential vs concurrent.
+
+    python -m benchmarks.bench_scan --years 6 --latency 0.5 --workers 6
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--years", type=int, default=6, help="Conference-years per fake host")
+    parser.add_argument("--papers", type=int, default=300, help="Papers per page")
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated server latency (s)")
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--host-limit", type=int, default=2)
+    parser.add_argument("--host-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_scan_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/papers.db"
+    # The scan embeds papers and bumps the data generation; keep both in workdir
+    os.environ["VECTOR_DIR"] = os.path.join(workdir, "vectors")
+    os.environ["DATA_GENERATION_FILE"] = os.path.join(workdir, "generation")
+
+    # Imported after DATABASE_URL is set so the engine points at the temp DB
+    from benchmarks.fixtures import cvf_page, dblp_page
+    from benchmarks.fixture_server import FixtureServer
+    from database import Base, engine
+    from scanner import Scanner
+
+    pages = {}
+    for i in range(args.years):
+        pages[f"/dblp/ccs{2000 + i}.html"] = dblp_page(args.papers, seed=i)
+        pages[f"/openaccess.thecvf.com/CVPR{2000 + i}"] = cvf_page(args.papers, seed=100 + i)
+
+    with FixtureServer(pages, latency=args.latency) as server:
+        # 127.0.0.1 and localhost act as two separate hosts for the throttle.
+        # CVPRScraper branches on "openaccess.thecvf.com" in the URL, hence the path prefix.
+        config = {
+            "ACM CCS": {"scraper": "ACMCCS", "years": {
+                str(2000 + i): server.url(f"/dblp/ccs{2000 + i}.html") for i in range(args.years)}},
+            "CVPR": {"scraper": "CVPR", "years": {
+                str(2000 + i): server.url(f"/openaccess.thecvf.com/CVPR{2000 + i}", host="localhost")
+                for i in range(args.years)}},
+        }
+        config_path = os.path.join(workdir, "conferences.json")
+        with open(config_path, "w") as f:
+            json.dump(config, f)
+
+        limits = {"127.0.0.1": args.host_limit, "localhost": args.host_limit}
+        for workers in (1, args.workers):
+            Base.metadata.drop_all(bind=engine)
+            scanner = Scanner(config_path, max_workers=workers, host_limits=limits,
+                              host_delay=args.host_delay, use_cache=False)
+            started = time.perf_counter()
+            scanner.run()
+            elapsed = time.perf_counter() - started
+            print(f"workers={workers:<3} pages={len(pages):<4} wall={elapsed:6.2f}s")
+
+        # Same pages again: every body hashes to what scan_state recorded, so nothing is parsed or stored
+        scanner = Scanner(config_path, max_workers=args.workers, host_limits=limits,
+                          host_delay=args.host_delay, use_cache=False)
+        started = time.perf_counter()
+        scanner.run()
+        print(f"rescan, pages unchanged: wall={time.perf_counter() - started:6.2f}s")
+
+        # Past years unchanged for FROZEN_AFTER_DAYS are not even fetched
+        from database import SessionLocal, ScanState
+        from scanner import FROZEN_AFTER_DAYS
+        from datetime import timedelta
+        session = SessionLocal()
+        for state in session.query(ScanState):
+            state.last_changed_at -= timedelta(days=FROZEN_AFTER_DAYS)
+        session.commit()
+        session.close()
+        started = time.perf_counter()
+        scanner.run()
+        print(f"rescan, past years frozen: wall={time.perf_counter() - started:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
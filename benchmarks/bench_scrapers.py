@@ -0,0 +1,187 @@
+"""
+Regression and performance suite for the scrapers: every fixture case is
+served by the local HTTP stand-in and scraped through get_soup end to end.
+
+Checks per case: paper count, titles clean, URLs absolute (failures), plus
+the share of papers with real authors / PDF links. Records fetch and parse
+time, papers/second and peak memory.
+
+    python -m benchmarks.bench_scrapers                               # run and check
+    python -m benchmarks.bench_scrapers --save baseline.json          # store a baseline
+    python -m benchmarks.bench_scrapers --baseline baseline.json      # flag regressions
+    python -m benchmarks.bench_scrapers --baseline baseline.json --threshold 0.5 --only CVPR
+
+Exits with status 1 on a failed check or a regression, so it can gate a CI job.
+Timings depend on the machine; compare against a baseline saved on the same one.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from urllib.parse import urlsplit
+
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.fixtures import FIXTURE_CASES
+from enricher import PLACEHOLDER_AUTHORS
+from scanner import Scanner
+
+# Quality shares may drop by this much before it counts as a regression
+QUALITY_TOLERANCE = 0.01
+
+
+def local_path(url):
+    """
+    Path on the fixture server that still contains the original host, e.g.
+    https://dblp.org/db/x.html -> /dblp.org/db/x.html. Scrapers pick their
+    branch from substrings like "dblp.org" in the URL.
+    """
+    parts = urlsplit(url)
+    return f"/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+def quality(papers):
+    """Share of papers passing each field check (1.0 when there are no papers)."""
+    n = len(papers) or 1
+    return {
+        "clean_titles": sum(1 for p in papers if p.title and p.title == p.title.strip()
+                            and "<" not in p.title and ">" not in p.title) / n,
+        "absolute_urls": sum(1 for p in papers if p.url and p.url.startswith("http")) / n,
+        "real_authors": sum(1 for p in papers if p.authors and p.authors not in PLACEHOLDER_AUTHORS) / n,
+        "pdf_links": sum(1 for p in papers if p.pdf_url) / n,
+    }
+
+
+def scrape_once(scanner, scraper_type, url):
+    """(papers, seconds in total, seconds spent fetching) for one fresh scraper."""
+    scraper = scanner.get_scraper(scraper_type, scraper_type, 2024)
+    scraper.throttle = None # Measure the scraper, not the politeness delay
+    fetch = scraper.fetch
+    fetch_time = [0.0]
+
+    def timed_fetch(page_url):
+        started = time.perf_counter()
+        try:
+            return fetch(page_url)
+        finally:
+            fetch_time[0] += time.perf_counter() - started
+
+    scraper.fetch = timed_fetch
+    started = time.perf_counter()
+    papers = scraper.scrape(url)
+    return papers, time.perf_counter() - started, fetch_time[0]
+
+
+def run_case(scanner, scraper_type, url, expected, repeat):
+    totals, fetches = [], []
+    for _ in range(repeat):
+        papers, total, fetched = scrape_once(scanner, scraper_type, url)
+        totals.append(total)
+        fetches.append(fetched)
+
+    # Separate run for memory: tracemalloc slows everything down
+    tracemalloc.start()
+    scrape_once(scanner, scraper_type, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = statistics.median(totals)
+    fetch = statistics.median(fetches)
+    result = {
+        "papers": len(papers),
+        "expected": expected,
+        "total_ms": round(total * 1000, 2),
+        "fetch_ms": round(fetch * 1000, 2),
+        "parse_ms": round((total - fetch) * 1000, 2),
+        "papers_per_s": round(len(papers) / total, 1) if total else 0.0,
+        "peak_mb": round(peak / 2**20, 2),
+        "quality": {k: round(v, 4) for k, v in quality(papers).items()},
+    }
+    result["failures"] = check(result)
+    return result
+
+
+def check(result):
+    failures = []
+    if result["expected"] is not None and result["papers"] != result["expected"]:
+        failures.append(f"found {result['papers']} papers, expected {result['expected']}")
+    if result["papers"] == 0:
+        failures.append("no papers found")
+    for key in ("clean_titles", "absolute_urls"):
+        if result["quality"][key] < 1.0:
+            failures.append(f"{key} {result['quality'][key]:.1%}")
+    return failures
+
+
+def compare(result, base, threshold):
+    """Regressions of result against the baseline entry base."""
+    regressions = []
+    if result["papers"] != base["papers"]:
+        regressions.append(f"papers {base['papers']} -> {result['papers']}")
+    for key in ("parse_ms", "peak_mb"):
+        if base[key] > 0 and result[key] > base[key] * (1 + threshold):
+            regressions.append(f"{key} {base[key]} -> {result[key]} (+{result[key] / base[key] - 1:.0%})")
+    for key, value in result["quality"].items():
+        old = base["quality"].get(key)
+        if old is not None and value < old - QUALITY_TOLERANCE:
+            regressions.append(f"{key} {old:.1%} -> {value:.1%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Scraper types to include")
+    parser.add_argument("--page", nargs=3, action="append", metavar=("TYPE", "URL", "FILE"),
+                        help="Check a saved page as well (no expected count)")
+    parser.add_argument("--save", metavar="FILE", help="Write the results as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relative slowdown / memory growth counted as a regression")
+    args = parser.parse_args()
+
+    cases = [(t, url, make_page(), expected) for t, url, make_page, expected in FIXTURE_CASES]
+    for scraper_type, url, path in args.page or []:
+        with open(path, "rb") as f:
+            cases.append((scraper_type, url, f.read(), None))
+    if args.only:
+        cases = [case for case in cases if case[0] in args.only]
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    pages = {local_path(url): content for _, url, content, _ in cases}
+    scanner = Scanner(use_cache=False)
+    results = {}
+    bad = 0
+    print(f"{'case':<60} {'papers':>7} {'parse ms':>9} {'fetch ms':>9} {'papers/s':>10} "
+          f"{'peak MB':>8} {'authors':>8} {'pdf':>6}")
+    with FixtureServer(pages) as server:
+        for scraper_type, url, _, expected in cases:
+            name = f"{scraper_type} {url}"
+            result = run_case(scanner, scraper_type, server.url(local_path(url)), expected, args.repeat)
+            results[name] = result
+            print(f"{name[:60]:<60} {result['papers']:>7} {result['parse_ms']:>9.1f} {result['fetch_ms']:>9.1f} "
+                  f"{result['papers_per_s']:>10.0f} {result['peak_mb']:>8.1f} "
+                  f"{result['quality']['real_authors']:>8.0%} {result['quality']['pdf_links']:>6.0%}")
+            problems = ["FAIL " + f for f in result["failures"]]
+            if name in baseline:
+                problems += ["REGRESSION " + r for r in compare(result, baseline[name], args.threshold)]
+            elif args.baseline:
+                print("    (not in baseline)")
+            for problem in problems:
+                print(f"    {problem}")
+            bad += bool(problems)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save}")
+    print(f"{len(results) - bad}/{len(results)} cases passed")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
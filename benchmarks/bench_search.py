@@ -0,0 +1,133 @@
+"""
+Search latency on a synthetic corpus: the old triple-ILIKE filter vs the
+full-text index, using the same count + first-page queries as read_root.
+
+    python -m benchmarks.bench_search --papers 200000
+    BENCH_POSTGRES_URL=postgresql://user:pw@localhost/bench python -m benchmarks.bench_search
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, or_
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.fixtures import FIRST, LAST, WORDS, fake_authors
+from database import Base, Paper
+from database.search import apply_search, search_backend, setup_search
+
+CONFERENCES = ["CVPR", "ICCV", "ECCV", "NeurIPS", "ICML", "ICLR", "NDSS", "USENIX Security", "IEEE S&P", "ACM CCS"]
+SYLLABLES = "ka ro mi to se na lu ve qui dra po tex ler gan sor vim".split()
+
+
+def vocabulary(size=20000, seed=0):
+    """Real titles draw on a large vocabulary with a few very common words (Zipf-like)."""
+    rng = random.Random(seed)
+    words = list(WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    # Cumulative weights so random.choices does not rebuild them on every call
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(words))))
+    return words, cum_weights
+
+
+def zipf_title(rng, words, cum_weights):
+    return " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(5, 11))).capitalize()
+
+
+def load_corpus(engine, n, seed=0):
+    rng = random.Random(seed)
+    words, cum_weights = vocabulary()
+    rows = [
+        {
+            "title": f"{zipf_title(rng, words, cum_weights)} {i}",
+            "authors": ", ".join(fake_authors(rng)),
+            "conference": rng.choice(CONFERENCES),
+            "year": rng.randint(2018, 2025),
+            "url": f"https://example.org/{i}",
+        }
+        for i in range(n)
+    ]
+    with engine.begin() as conn:
+        for start in range(0, n, 10000):
+            conn.execute(insert(Paper), rows[start:start + 10000])
+
+
+def ilike(query, q):
+    search = f"%{q}%"
+    return query.filter(or_(
+        Paper.title.ilike(search), Paper.authors.ilike(search), Paper.conference.ilike(search)
+    )).order_by(Paper.id.desc())
+
+
+def queries(n, seed=1):
+    rng = random.Random(seed)
+    words, cum_weights = vocabulary()
+    pick = lambda: rng.choices(words, cum_weights=cum_weights)[0]
+    out = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.4:
+            out.append(pick())
+        elif kind < 0.6:
+            out.append(pick()[:4])  # prefix, as typed
+        elif kind < 0.8:
+            out.append(f"{pick()} {pick()}")
+        else:
+            out.append(rng.choice(FIRST + LAST))
+    return out
+
+
+def time_path(Session, search, qs, limit=10):
+    latencies = []
+    session = Session()
+    for q in qs:
+        started = time.perf_counter()
+        query = search(session.query(Paper), q)
+        query.order_by(None).count()
+        query.limit(limit).all()
+        latencies.append(time.perf_counter() - started)
+    session.close()
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def bench_backend(name, url, n, n_queries):
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    load_corpus(engine, n)
+    setup_search(engine)
+    print(f"{name}: loaded and indexed {n} papers in {time.perf_counter() - started:.1f}s "
+          f"(search backend: {search_backend(engine)})")
+
+    Session = sessionmaker(bind=engine)
+    qs = queries(n_queries)
+    for label, search in (("ilike", ilike), ("fulltext", apply_search)):
+        p50, p99 = time_path(Session, search, qs)
+        print(f"{name:<10} {label:<9} queries={len(qs):<5} p50={p50 * 1000:8.1f} ms  p99={p99 * 1000:8.1f} ms")
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_search_")
+    bench_backend("sqlite", f"sqlite:///{workdir}/bench.db", args.papers, args.queries)
+    pg_url = os.getenv("BENCH_POSTGRES_URL")
+    if pg_url:
+        bench_backend("postgresql", pg_url, args.papers, args.queries)
+    else:
+        print("postgresql skipped (set BENCH_POSTGRES_URL to a scratch database)")
+
+
+if __name__ == "__main__":
+    main()
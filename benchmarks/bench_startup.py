@@ -0,0 +1,95 @@
+"""
+Cold start of the web app: `python -X importtime -c "import main"` (what
+uvicorn does first), repeated in fresh interpreters, and optionally the time
+until a real `uvicorn main:app` answers its first request.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --uvicorn --runs 5
+
+Also lists the slowest top-level imports and whether scraper code (requests,
+bs4, scrapers.*) was loaded.
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+SCRAPER_MODULES = re.compile(r"^(requests|bs4|scrapers\.\w+)$")
+
+
+def import_profile(env) -> dict:
+    """{module: cumulative microseconds} of one `import main` in a new interpreter."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            env=env, capture_output=True, text=True, check=True)
+    modules, top_level = {}, {}
+    for line in result.stderr.splitlines():
+        m = IMPORT_LINE.match(line)
+        if m:
+            modules[m.group(4)] = int(m.group(2))
+            # Imported directly by main (one level of indentation)
+            if len(m.group(3)) == 3:
+                top_level[m.group(4)] = int(m.group(2))
+    return {"modules": modules, "top_level": top_level}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def uvicorn_start(env) -> float:
+    """Seconds from launching uvicorn until GET /api/logs answers."""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+                              env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/api/logs", timeout=1).read()
+                return time.perf_counter() - started
+            except OSError:
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited during startup")
+                time.sleep(0.01)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    parser.add_argument("--uvicorn", action="store_true", help="Also time uvicorn until the first response")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_startup_")
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{workdir}/bench.db", SCAN_WORKER="external",
+               DATA_GENERATION_FILE=os.path.join(workdir, "generation"), VECTOR_DIR=os.path.join(workdir, "vectors"))
+    import_profile(env) # compiles .pyc files once, outside the measurement
+    profiles = [import_profile(env) for _ in range(args.runs)]
+    totals = [p["modules"]["main"] / 1000 for p in profiles]
+    print(f"import main: median {statistics.median(totals):.0f} ms, min {min(totals):.0f} ms over {args.runs} runs")
+
+    last = profiles[-1]
+    for name, micros in sorted(last["top_level"].items(), key=lambda item: -item[1])[:args.top]:
+        print(f"    {name:<32} {micros / 1000:7.1f} ms")
+    scraper_code = sorted(name for name in last["modules"] if SCRAPER_MODULES.match(name))
+    print(f"scraper code imported: {', '.join(scraper_code) or 'none'}")
+
+    if args.uvicorn:
+        times = [uvicorn_start(env) for _ in range(args.runs)]
+        print(f"uvicorn main:app to first response: median {statistics.median(times):.2f}s, min {min(times):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
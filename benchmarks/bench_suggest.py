@@ -0,0 +1,82 @@
+"""
+Search-as-you-type index (database/suggest.py) on a synthetic corpus: build
+time and memory, suggestion latency by prefix length, and the incremental
+refresh after a scan adds a conference-year of papers.
+
+    python -m benchmarks.bench_suggest --papers 200000
+"""
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_authors import report, timed
+from benchmarks.bench_search import CONFERENCES, vocabulary, zipf_title
+from database import Base, Paper
+from database.normalize import title_key
+from database.suggest import Suggester
+
+
+def paper_rows(n, start=0, seed=0):
+    rng = random.Random(seed)
+    words, cum_weights = vocabulary()
+    rows = []
+    for i in range(start, start + n):
+        title = f"{zipf_title(rng, words, cum_weights)} {i}"
+        rows.append({"title": title, "title_key": title_key(title), "conference": rng.choice(CONFERENCES),
+                     "year": rng.randint(2018, 2025), "url": f"https://example.org/{i}"})
+    return rows
+
+
+def insert_rows(engine, rows):
+    with engine.begin() as conn:
+        for start in range(0, len(rows), 10000):
+            conn.execute(insert(Paper), rows[start:start + 10000])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--papers", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--scan-size", type=int, default=3000, help="Papers added before the incremental refresh")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_suggest_")
+    engine = create_engine(f"sqlite:///{workdir}/bench.db")
+    Base.metadata.create_all(bind=engine)
+    rows = paper_rows(args.papers)
+    insert_rows(engine, rows)
+    session = sessionmaker(bind=engine)()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    suggester = Suggester()
+    suggester.refresh(session)
+    elapsed = time.perf_counter() - started
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"build: {len(suggester)} titles, {len(suggester.keywords)} keywords in {elapsed:.2f}s; "
+          f"{size / 2**20:.1f} MB held, peak {peak / 2**20:.1f} MB while building")
+
+    rng = random.Random(1)
+    keys = [row["title_key"] for row in rows]
+    for length in (2, 4, 8, 16):
+        prefixes = [rng.choice(keys)[:length] for _ in range(args.queries)]
+        queue = iter(prefixes)
+        report(f"suggest, {length}-character prefix", timed(lambda: suggester.suggest(next(queue)), len(prefixes)))
+
+    # A scan committing new papers: only they are read and merged in
+    insert_rows(engine, paper_rows(args.scan_size, start=args.papers, seed=2))
+    suggester.generation = None
+    started = time.perf_counter()
+    added = suggester.refresh(session)
+    print(f"incremental refresh: {added} papers in {(time.perf_counter() - started) * 1000:.0f} ms")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
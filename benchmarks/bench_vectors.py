@@ -0,0 +1,84 @@
+"""
+Vector search latency vs corpus size: exact (full matrix product) vs the IVF
+approximate index, with the approximate index's recall of the exact top 10.
+
+    python -m benchmarks.bench_vectors --sizes 10000,50000,100000,200000
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_search import queries, vocabulary
+from database.embeddings import DEFAULT_NPROBE, VectorIndex, features
+
+
+TOPICS = 200
+
+
+def topical_title(rng, words, cum_weights, topics):
+    """Real titles cluster by field: most words come from the paper's topic, the rest from everywhere."""
+    topic = rng.choice(topics)
+    n = rng.randint(5, 11)
+    picked = [rng.choice(topic) for _ in range(n - n // 3)]
+    return " ".join(picked + rng.choices(words, cum_weights=cum_weights, k=n // 3))
+
+
+def build(directory, n, seed=0):
+    rng = random.Random(seed)
+    words, cum_weights = vocabulary()
+    topics = [rng.sample(words[20:], 40) for _ in range(TOPICS)]
+    titles = [topical_title(rng, words, cum_weights, topics) for _ in range(n)]
+    docs = [features(title) for title in titles]
+    index = VectorIndex(directory)
+    started = time.perf_counter()
+    index.fit(docs)
+    for start in range(0, n, 5000):
+        index.add(range(start + 1, min(start + 5000, n) + 1), docs[start:start + 5000])
+    embed_time = time.perf_counter() - started
+    started = time.perf_counter()
+    index.build_ivf()
+    return index, titles, embed_time, time.perf_counter() - started
+
+
+def time_search(index, vectors, k, exact, nprobe=DEFAULT_NPROBE):
+    latencies, results = [], []
+    for vector in vectors:
+        started = time.perf_counter()
+        results.append(index.search(vector, k, exact=exact, nprobe=nprobe))
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1], results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,50000,100000,200000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=DEFAULT_NPROBE, help="IVF cells scanned per query")
+    args = parser.parse_args()
+
+    for n in (int(s) for s in args.sizes.split(",")):
+        directory = tempfile.mkdtemp(prefix="bench_vectors_")
+        index, titles, embed_time, ivf_time = build(directory, n)
+        # Half free-text queries, half "more like this paper" lookups
+        rng = random.Random(1)
+        texts = queries(args.queries // 2) + [titles[rng.randrange(n)] for _ in range(args.queries // 2)]
+        vectors = [v for v in index.embed([features(t) for t in texts]) if np.any(v)]
+        print(f"n={n:<7} embedded in {embed_time:5.1f}s ({n / embed_time:,.0f} papers/s), "
+              f"IVF built in {ivf_time:4.1f}s ({len(index.ivf['centroids'])} cells)")
+        exact_p50, exact_p99, exact = time_search(index, vectors, args.k, exact=True)
+        ivf_p50, ivf_p99, approx = time_search(index, vectors, args.k, exact=False, nprobe=args.nprobe)
+        # Short queries tie on score, so a hit counts if it scores at least the exact k-th result
+        recall = statistics.mean(
+            sum(score >= e[-1][1] - 1e-6 for _, score in a) / len(e) for a, e in zip(approx, exact) if e)
+        print(f"  exact  p50={exact_p50 * 1000:7.2f} ms  p99={exact_p99 * 1000:7.2f} ms")
+        print(f"  ivf    p50={ivf_p50 * 1000:7.2f} ms  p99={ivf_p99 * 1000:7.2f} ms  recall@{args.k}={recall:.2f}")
+
+
+if __name__ == "__main__":
+    main()
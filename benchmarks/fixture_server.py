@@ -0,0 +1,88 @@
+"""
+Local HTTP stand-in that serves fixture pages to the real scrapers.
+
+    with FixtureServer({"/dblp/ccs2024.html": html}, latency=0.2) as server:
+        url = server.url("/dblp/ccs2024.html")
+"""
+import gzip
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FixtureServer:
+    def __init__(self, pages, latency=0.0, host="127.0.0.1", port=0, compress=False):
+        """
+        pages: { "/path": "html" or bytes }
+        latency: seconds each response is delayed, to mimic a remote host.
+        compress: gzip bodies for clients that send Accept-Encoding: gzip.
+
+        Responses carry an ETag and honour If-None-Match with a 304.
+        """
+        self.pages = {path: body.encode("utf-8") if isinstance(body, str) else body
+                      for path, body in pages.items()}
+        self.latency = latency
+        self.compress = compress
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; with Nagle on, every
+            # response on a kept-alive connection would stall ~40ms on delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                body = server.pages.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                if server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body, compresslevel=6)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = None
+
+    def url(self, path, host="127.0.0.1"):
+        # Using "localhost" vs "127.0.0.1" gives two distinct throttle budgets on one server
+        return f"http://{host}:{self.port}{path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
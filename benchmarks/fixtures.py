@@ -0,0 +1,166 @@
+"""
+Synthetic proceedings pages in the layout each scraper expects.
+
+Pages are generated deterministically so benchmarks and the local fixture
+server do not depend on the live conference sites.
+"""
+import random
+from html import escape
+
+WORDS = (
+    "learning neural robust efficient adversarial graph diffusion transformer attention "
+    "privacy secure federated vision language model detection segmentation generative "
+    "scalable sparse contrastive reinforcement policy kernel inference verification fuzzing "
+    "memory side-channel attack defense benchmark dataset representation optimization"
+).split()
+FIRST = "Alice Bob Carol Dave Erin Frank Grace Heidi Ivan Judy Mallory Niaj Olivia Peggy".split()
+LAST = "Smith Chen Wang Garcia Kumar Müller Rossi Tanaka Kim Nguyen Silva Novak Cohen".split()
+
+
+def _rng(seed):
+    return random.Random(seed)
+
+
+def fake_title(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 11))).capitalize()
+
+
+def fake_authors(rng, n=None):
+    n = n or rng.randint(1, 6)
+    return [f"{rng.choice(FIRST)} {rng.choice(LAST)}" for _ in range(n)]
+
+
+def dblp_page(n_papers, seed=0):
+    """dblp.org/db/conf/... table of contents."""
+    rng = _rng(seed)
+    items = []
+    for i in range(n_papers):
+        authors = "".join(
+            f'<span itemprop="author" itemscope itemtype="http://schema.org/Person">'
+            f'<a href="https://dblp.org/pid/{i}-{j}.html" itemprop="url"><span itemprop="name" title="{escape(a)}">{escape(a)}</span></a></span>, '
+            for j, a in enumerate(fake_authors(rng))
+        )
+        start = rng.randint(1, 3000)
+        pages = f"{start}-{start + rng.choice([4, 5, 12, 14, 15, 18])}"
+        items.append(
+            f'<li class="entry inproceedings" id="conf/x/P{i}" itemscope itemtype="http://schema.org/ScholarlyArticle">'
+            f'<div class="box"><img alt="" title="Conference and Workshop Papers" src="https://dblp.org/img/n.png"></div>'
+            f'<nav class="publ"><ul><li class="drop-down"><div class="head"><a href="https://doi.org/10.1145/{seed}.{i}">'
+            f'<img alt="" src="https://dblp.org/img/paper.dark.hollow.16x16.png"></a></div></li></ul></nav>'
+            f'<cite class="data tts-content" itemprop="headline">{authors}'
+            f'<span class="title" itemprop="name">{escape(fake_title(rng))}.</span> '
+            f'<a href="https://dblp.org/db/conf/x/x.html"><span itemprop="isPartOf"><span itemprop="name">Proc.</span></span></a> '
+            f'<span itemprop="pagination">{pages}</span></cite></li>'
+        )
+    return (
+        '<!DOCTYPE html><html><head><title>dblp</title></head><body><div id="main">'
+        '<header class="h2"><h2>Session</h2></header><ul class="publ-list">'
+        + "".join(items)
+        + "</ul></div></body></html>"
+    )
+
+
+def cvf_page(n_papers, seed=0):
+    """openaccess.thecvf.com/<CONF><YEAR>?day=all listing."""
+    rng = _rng(seed)
+    rows = []
+    for i in range(n_papers):
+        authors = "".join(
+            f'<form id="form-{i}-{j}" action="/CVPR2024_search" method="post" class="authsearch">'
+            f'<input type="hidden" name="query_author" value="{escape(a)}">'
+            f'<a href="#" onclick="document.getElementById(\'form-{i}-{j}\').submit();">{escape(a)}</a>,</form>'
+            for j, a in enumerate(fake_authors(rng))
+        )
+        rows.append(
+            f'<dt class="ptitle"><br><a href="/content/CVPR2024/html/Paper_{i}_CVPR_2024_paper.html">{escape(fake_title(rng))}</a></dt>'
+            f'<dd>{authors}</dd>'
+            f'<dd>[<a href="/content/CVPR2024/papers/Paper_{i}_CVPR_2024_paper.pdf">pdf</a>]</dd>'
+        )
+    return (
+        '<!DOCTYPE html><html><head><title>CVPR</title></head><body><div id="content"><dl>'
+        + "".join(rows)
+        + "</dl></div></body></html>"
+    )
+
+
+def eccv_page(papers_per_year, years=(2024, 2022, 2020), seed=0):
+    """ecva.net/papers.php: one page holding an accordion section per year."""
+    rng = _rng(seed)
+    sections = []
+    for year in years:
+        rows = "".join(
+            f'<dt class="ptitle"><br><a href="papers/eccv_{year}/papers_ECCV/html/{i}_ECCV_{year}_paper.php">{escape(fake_title(rng))}</a></dt>'
+            f'<dd>{escape(", ".join(fake_authors(rng)))}</dd>'
+            f'<dd>[<a href="papers/eccv_{year}/papers_ECCV/papers/{i}.pdf">pdf</a>]</dd>'
+            for i in range(papers_per_year)
+        )
+        sections.append(
+            f'<button class="accordion">ECCV {year} Papers</button>'
+            f'<div class="accordion-content"><div id="content"><dl>{rows}</dl></div></div>'
+        )
+    return "<!DOCTYPE html><html><body>" + "".join(sections) + "</body></html>"
+
+
+def neurips_page(n_papers, year=2023, seed=0):
+    """papers.nips.cc/paper_files/paper/<year> proceedings list."""
+    rng = _rng(seed)
+    items = "".join(
+        f'<li class="conference"><a title="paper title" href="/paper_files/paper/{year}/hash/{i:032x}-Abstract-Conference.html">'
+        f'{escape(fake_title(rng))}</a> <i>{escape(", ".join(fake_authors(rng)))}</i></li>'
+        for i in range(n_papers)
+    )
+    return (
+        '<!DOCTYPE html><html><body><nav class="navbar"><ul><li><a href="/">Home</a></li></ul></nav>'
+        f'<div class="container-fluid"><div class="col-sm-12"><ul class="paper-list">{items}</ul></div></div>'
+        "</body></html>"
+    )
+
+
+def miniconf_list_page(n_papers, year=2024, seed=0):
+    """iclr.cc / icml.cc /virtual/<year>/papers.html list view."""
+    rng = _rng(seed)
+    kinds = ("poster", "poster", "poster", "oral", "spotlight")
+    items = "".join(
+        f'<li><a href="/virtual/{year}/{rng.choice(kinds)}/{10000 + i}">{escape(fake_title(rng))}</a></li>'
+        for i in range(n_papers)
+    )
+    return (
+        '<!DOCTYPE html><html><body><nav><ul><li><a href="/virtual/">Schedule</a></li></ul></nav>'
+        f'<div class="container"><ul>{items}</ul></div></body></html>'
+    )
+
+
+def accepted_papers_page(n_papers, seed=0):
+    """cvpr.thecvf.com / iccv.thecvf.com Conferences/<year>/AcceptedPapers table."""
+    rng = _rng(seed)
+    rows = "".join(
+        f'<tr><td><a href="https://project-{i}.github.io/">{escape(fake_title(rng))}</a>'
+        f'<div class="indented"><i>{" · ".join(escape(a) for a in fake_authors(rng))}</i></div></td></tr>'
+        for i in range(n_papers)
+    )
+    return (
+        '<!DOCTYPE html><html><body><nav><a href="/">Home</a></nav>'
+        f'<main><table>{rows}</table></main></body></html>'
+    )
+
+
+# (scraper type, source URL, page generator, papers on the page).
+# The URLs only select the scraper's branch; pages are served locally.
+SIZES = {"dblp": 400, "cvf": 2700, "neurips": 4500, "miniconf": 2500, "accepted": 2400, "eccv": 1500}
+FIXTURE_CASES = [
+    ("CVPR", "https://openaccess.thecvf.com/CVPR2024?day=all", lambda: cvf_page(SIZES["cvf"], seed=1), SIZES["cvf"]),
+    ("CVPR", "https://cvpr.thecvf.com/Conferences/2025/AcceptedPapers",
+     lambda: accepted_papers_page(SIZES["accepted"], seed=2), SIZES["accepted"]),
+    ("ICCV", "https://dblp.org/db/conf/iccv/iccv2023.html", lambda: dblp_page(SIZES["dblp"], seed=3), SIZES["dblp"]),
+    ("ICCV", "https://iccv.thecvf.com/Conferences/2025/AcceptedPapers",
+     lambda: accepted_papers_page(SIZES["accepted"], seed=4), SIZES["accepted"]),
+    ("ECCV", "https://www.ecva.net/papers.php", lambda: eccv_page(SIZES["eccv"], seed=5), SIZES["eccv"]),
+    ("NeurIPS", "https://papers.nips.cc/paper_files/paper/2023",
+     lambda: neurips_page(SIZES["neurips"], seed=6), SIZES["neurips"]),
+    ("ICML", "https://icml.cc/virtual/2024/papers.html", lambda: miniconf_list_page(SIZES["miniconf"], seed=7), SIZES["miniconf"]),
+    ("ICLR", "https://iclr.cc/virtual/2024/papers.html", lambda: miniconf_list_page(SIZES["miniconf"], seed=8), SIZES["miniconf"]),
+    ("NDSS", "https://dblp.org/db/conf/ndss/ndss2024.html", lambda: dblp_page(SIZES["dblp"], seed=9), SIZES["dblp"]),
+    ("USENIX", "https://dblp.org/db/conf/uss/uss2024.html", lambda: dblp_page(SIZES["dblp"], seed=10), SIZES["dblp"]),
+    ("IEEESP", "https://dblp.org/db/conf/sp/sp2024.html", lambda: dblp_page(SIZES["dblp"], seed=11), SIZES["dblp"]),
+    ("ACMCCS", "https://dblp.org/db/conf/ccs/ccs2024.html", lambda: dblp_page(SIZES["dblp"], seed=12), SIZES["dblp"]),
+]
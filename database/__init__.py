@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy import create_engine, inspect, text, BigInteger, Boolean, Column, Float, ForeignKey, Index, Integer, String, Text, DateTime, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -27,23 +27,214 @@ class Paper(Base):
     # Tags
     tags = Column(String, nullable=True) # e.g. "Short Paper"
 
-    # Avoid duplicate papers for same conference and year
-    __table_args__ = (UniqueConstraint('title', 'conference', 'year', name='_title_conf_year_uc'),)
+    # Filled in from the paper's detail page by enricher.py
+    abstract = Column(Text, nullable=True)
+    enrichment_status = Column(String, nullable=True) # None = not tried yet, see enricher.py
+    enriched_at = Column(DateTime, nullable=True)
+
+    # Filled in at ingest by database/normalize.py
+    title_key = Column(String, nullable=True) # case / punctuation / Unicode folded title
+    duplicate_of = Column(Integer, nullable=True) # earliest paper with a (near-)identical title, set after the scan
+
+    __table_args__ = (
+        # Avoid duplicate papers for same conference and year. Conference and year
+        # lead, so the scanner's "titles of this conference-year" lookup reads the index.
+        UniqueConstraint('conference', 'year', 'title', name='_title_conf_year_uc'),
+        # Listing filters, newest first: a conference's papers come out of the
+        # index already in id order (see database/migrations.py for existing databases)
+        Index('ix_papers_conference_id', 'conference', 'id'),
+        Index('ix_papers_year_id', 'year', 'id'),
+        # Ingest dedup: title keys already stored for a conference-year
+        Index('ix_papers_conference_year_title_key', 'conference', 'year', 'title_key'),
+    )
+
+class Author(Base):
+    """A distinct author name (see database/normalize.py for name_key)."""
+    __tablename__ = 'authors'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False) # spelling first seen
+    name_key = Column(String, nullable=False, unique=True)
+
+class PaperAuthor(Base):
+    """Author list of a paper, split out of Paper.authors."""
+    __tablename__ = 'paper_authors'
+
+    paper_id = Column(Integer, ForeignKey('papers.id'), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    author_id = Column(Integer, ForeignKey('authors.id'), nullable=False)
+
+    __table_args__ = (
+        # "Papers by author": the paper ids come out of the index without
+        # touching the table (see database/migrations.py for existing databases)
+        Index('ix_paper_authors_author_paper', 'author_id', 'paper_id'),
+    )
+
+class TitleBand(Base):
+    """MinHash LSH bucket of a paper's title; papers sharing a bucket are near-duplicate candidates."""
+    __tablename__ = 'paper_title_bands'
+
+    paper_id = Column(Integer, ForeignKey('papers.id'), primary_key=True)
+    band_hash = Column(BigInteger, primary_key=True, index=True)
+
+class PaperStat(Base):
+    """Paper count per conference-year, maintained by Scanner (see database/stats.py)."""
+    __tablename__ = 'paper_stats'
+
+    conference = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    paper_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class ScanState(Base):
+    """What the last scan saw for one conference-year; lets Scanner skip unchanged pages."""
+    __tablename__ = 'scan_state'
+
+    conference = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    source_url = Column(String)
+    content_hash = Column(String, nullable=True) # sha256 of the page body last ingested
+    paper_count = Column(Integer, default=0) # papers found on that page
+    last_fetched_at = Column(DateTime, nullable=True)
+    last_changed_at = Column(DateTime, nullable=True) # when content_hash last changed
+
+class SchemaMigration(Base):
+    """A migration from database/migrations.py applied to this database."""
+    __tablename__ = 'schema_migrations'
+
+    version = Column(Integer, primary_key=True)
+    description = Column(String)
+    applied_at = Column(DateTime, default=datetime.utcnow)
+
+class ScanJob(Base):
+    """A requested refresh, executed by the scan worker (jobs.py)."""
+    __tablename__ = 'scan_jobs'
+
+    id = Column(Integer, primary_key=True)
+    status = Column(String, index=True) # queued / running / done / failed
+    conferences = Column(String, nullable=True) # comma-separated names, None = all
+    full = Column(Boolean, default=False)
+    enrich = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True) # refreshed while running; stale = worker died
+    worker_pid = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+
+class ScanJobItem(Base):
+    """Progress of one conference-year within a scan job."""
+    __tablename__ = 'scan_job_items'
+
+    job_id = Column(Integer, ForeignKey('scan_jobs.id'), primary_key=True)
+    conference = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    status = Column(String) # pending / done / unchanged / skipped / failed
+    papers_found = Column(Integer, nullable=True)
+    papers_added = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class Event(Base):
+    """A progress or log event (events.py), shared by the web servers, the scan worker and CLI runs."""
+    __tablename__ = 'events'
+    # Ids are never reused, even after old events are deleted: clients resume after the last id they saw
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    id = Column(Integer, primary_key=True)
+    time = Column(Float, nullable=False) # Unix time
+    kind = Column(String, nullable=False) # log / progress / scan / job
+    data = Column(Text, nullable=False) # JSON object with the kind's fields
 
 # Setup DB
 import os
 
 # Use PostgreSQL in production (Render), SQLite locally
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./database/papers.db")
+DEFAULT_DATABASE_URL = "sqlite:///./database/papers.db"
+DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
 
 # Render provides Postgres URLs starting with 'postgres://' but SQLAlchemy needs 'postgresql://'
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+def data_dir(url: str) -> str:
+    """
+    Directory for the files that belong with a database: the vector index and
+    the data generation token. cache/ for the default and server databases, a
+    "<name>_cache" directory next to any other SQLite file, so a scratch
+    database (tests, benchmarks, a second checkout) never touches cache/.
+    """
+    if url.startswith("sqlite"):
+        path = url.split(":///", 1)[1] if ":///" in url else ""
+        default_path = DEFAULT_DATABASE_URL.split(":///", 1)[1]
+        if path and path != ":memory:" and os.path.abspath(path) != os.path.abspath(default_path):
+            return os.path.splitext(path)[0] + "_cache"
+    return "cache"
+
+# VECTOR_DIR / DATA_GENERATION_FILE override the paths under it
+DATA_DIR = data_dir(DATABASE_URL)
+
+# Connection pool per process. Each uvicorn worker, the scan worker and CLI runs
+# hold their own pools (database/aio.py adds one more in the web server), so
+# pool_size + max_overflow times the process count must stay under the
+# server's connection limit (about 100 on small Postgres plans).
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Seconds to wait for a free connection before failing the request
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Reconnect before a hosted Postgres drops idle connections on its side
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+def pool_options(url: str) -> dict:
+    """create_engine / create_async_engine pool arguments for a database URL."""
+    if url.startswith("sqlite"):
+        if ":memory:" in url or url.rstrip("/").endswith("sqlite:"):
+            return {} # In-memory databases live in a single connection
+        return {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW, "pool_timeout": DB_POOL_TIMEOUT}
+    return {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW, "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE, "pool_pre_ping": True}
+
+def sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets the web server read while the scan worker process writes
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=10000")
+    # Pages read through a shared mapping: concurrent connections share the OS
+    # page cache instead of each warming its own
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 # SQLite needs check_same_thread, PostgreSQL doesn't
 connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **pool_options(DATABASE_URL))
+
+if DATABASE_URL.startswith("sqlite"):
+    from sqlalchemy import event
+    event.listen(engine, "connect", sqlite_pragmas)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
+    from .search import setup_search
+    from .migrations import migrate
+    from .stats import ensure_stats
     Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+    migrate(engine)
+    setup_search(engine)
+    ensure_stats(engine)
+
+def add_missing_columns(engine):
+    """
+    create_all only creates missing tables; add nullable columns introduced
+    since an existing table was created (e.g. papers.abstract).
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
@@ -0,0 +1,48 @@
+"""
+Asyncio access to the papers database for the FastAPI endpoints.
+
+Queries run on the SQLAlchemy asyncio engine (aiosqlite for SQLite, asyncpg
+for PostgreSQL), so a slow search waits on the driver instead of blocking the
+event loop and every other request in the worker. The query helpers shared
+with the scanner (filters, pagination, stats) are plain ORM code; endpoints
+run them through AsyncSession.run_sync, which issues their SQL over the async
+connection.
+
+Needs the async drivers from requirements.txt (sqlalchemy[asyncio], aiosqlite,
+asyncpg). Only the web server imports this module; the scan worker and the
+CLI keep the synchronous engine.
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from database import DATABASE_URL, pool_options, sqlite_pragmas
+
+
+def async_url(url: str) -> str:
+    """The asyncio driver URL for a synchronous one."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:") or url.startswith("postgresql+psycopg2:"):
+        parts = urlsplit(url)
+        # asyncpg takes ssl=require where psycopg2 takes sslmode=require
+        query = [("ssl" if name == "sslmode" else name, value) for name, value in parse_qsl(parts.query)]
+        return urlunsplit(parts._replace(scheme="postgresql+asyncpg", query=urlencode(query)))
+    return url
+
+
+async_engine = create_async_engine(async_url(DATABASE_URL), **pool_options(DATABASE_URL))
+
+if DATABASE_URL.startswith("sqlite"):
+    event.listen(async_engine.sync_engine, "connect", sqlite_pragmas)
+
+# expire_on_commit=False: objects stay readable after a commit without another
+# (implicit, and under asyncio impossible) load
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    """FastAPI dependency: one AsyncSession per request."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,115 @@
+"""
+Author lookups over the inverted index that database/normalize.py maintains
+at ingest (authors: one row per folded name, paper_authors: paper -> author).
+
+- papers_by_author(): restricts a Paper query to one author's papers, an
+  index probe on authors.name_key and paper_authors.author_id instead of a
+  LIKE over every Paper.authors string.
+- Autocomplete: every author name in a PrefixIndex (database/prefix.py) held
+  in memory, ranked by paper count. It is rebuilt from the database when the
+  data generation (database/generation.py) moves on, at most once per
+  AUTHOR_INDEX_MIN_AGE seconds so a running scan does not rebuild it on
+  every batch.
+"""
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import func, select
+
+from database import Author, Paper, PaperAuthor
+from database import generation
+from database.normalize import author_key
+from database.prefix import PrefixIndex
+
+# Seconds a loaded index is kept even though papers changed since
+AUTHOR_INDEX_MIN_AGE = 30.0
+# Seconds after which it is reloaded regardless (the generation file is per machine)
+AUTHOR_INDEX_TTL = 600.0
+
+# Loaded index per database URL: (loaded_at, generation, AuthorIndex)
+_snapshots = {}
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+class AuthorIndex:
+    """Author names with paper counts, searchable by the start of any name part."""
+    def __init__(self, names: List[str], keys: List[str], counts: List[int]):
+        self.names = names
+        self.counts = counts
+        self.prefix = PrefixIndex(keys, counts)
+
+    def __len__(self):
+        return len(self.names)
+
+    def complete(self, text: str, limit: int = 10) -> List[dict]:
+        """Authors with a name part starting with text ("he" finds "Kaiming He"), most papers first."""
+        rows = self.prefix.search(author_key(text), limit)
+        return [{"name": self.names[row], "papers": self.counts[row]} for row in rows]
+
+
+def load_author_index(session) -> AuthorIndex:
+    """Build the index from authors / paper_authors (one GROUP BY)."""
+    names, keys, counts = [], [], []
+    for name, key, count in session.execute(
+            select(Author.name, Author.name_key, func.count(PaperAuthor.paper_id))
+            .join(PaperAuthor, PaperAuthor.author_id == Author.id)
+            .group_by(Author.id, Author.name, Author.name_key)
+            .order_by(Author.name_key)):
+        names.append(name)
+        keys.append(key)
+        counts.append(count)
+    return AuthorIndex(names, keys, counts)
+
+
+def get_author_index(session) -> AuthorIndex:
+    """The in-memory index, reloaded when papers changed (see module docstring)."""
+    url = str(session.get_bind().engine.url)
+    now = time.monotonic()
+    current = generation.current()
+    with _lock:
+        snapshot = _snapshots.get(url)
+    if snapshot:
+        age = now - snapshot[0]
+        if age < AUTHOR_INDEX_TTL and (snapshot[1] == current or age < AUTHOR_INDEX_MIN_AGE):
+            return snapshot[2]
+        # Requests arriving during a rebuild get the previous index
+        if not _build_lock.acquire(blocking=False):
+            return snapshot[2]
+    else:
+        _build_lock.acquire()
+    try:
+        with _lock:
+            snapshot = _snapshots.get(url)
+        if snapshot and snapshot[0] >= now:
+            return snapshot[2] # Built by another thread meanwhile
+        index = load_author_index(session)
+        with _lock:
+            _snapshots[url] = (time.monotonic(), current, index)
+        return index
+    finally:
+        _build_lock.release()
+
+
+def invalidate_author_index():
+    with _lock:
+        _snapshots.clear()
+
+
+def complete_authors(session, text: str, limit: int = 10) -> List[dict]:
+    return get_author_index(session).complete(text, limit)
+
+
+def find_author(session, name: str) -> Optional[Author]:
+    """The author whose folded name matches name, if any."""
+    return session.query(Author).filter(Author.name_key == author_key(name)).first()
+
+
+def papers_by_author(query, author_id: int):
+    """Restrict a Paper query to papers listing the author; unordered, so it can be paginated."""
+    return query.filter(Paper.id.in_(select(PaperAuthor.paper_id).where(PaperAuthor.author_id == author_id)))
+
+
+def author_paper_count(session, author_id: int) -> int:
+    return session.query(func.count(PaperAuthor.paper_id)).filter(PaperAuthor.author_id == author_id).scalar()
@@ -0,0 +1,437 @@
+"""
+Vector similarity search over paper titles and abstracts, CPU only.
+
+Papers are embedded as hashed TF-IDF vectors: unigrams and bigrams of the
+title (counted twice) and abstract are hashed into EMBEDDING_DIM buckets with
+a sign bit, weighted by sublinear term frequency and inverse document
+frequency, and L2-normalized, so cosine similarity is a dot product.
+
+Vectors live outside the database in a float32 memory-mapped matrix
+(vectors.f32) with a parallel array of paper ids. Exact search is one
+matrix-vector product over the whole matrix. For large corpora an optional
+IVF index (k-means cells, only the nprobe closest cells are scanned) cuts
+query time by an order of magnitude at some cost in recall; build it with
+python -m database.embeddings --ivf. It is used from APPROX_MIN_ROWS papers
+on and retrained by later syncs as the corpus grows.
+
+IDF weights are fitted when the index is first built and kept for papers
+added later; rebuild (python -m database.embeddings --rebuild) refits them.
+"""
+import json
+import logging
+import os
+import threading
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import case
+
+from database import DATA_DIR
+from database.search import search_terms
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VECTOR_DIR = os.getenv("VECTOR_DIR", os.path.join(DATA_DIR, "vectors"))
+EMBEDDING_DIM = 256
+# Papers embedded per batch while syncing with the database
+EMBED_BATCH_SIZE = 2000
+# Use the IVF index (when built) from this many papers on; below it exact search is fast enough
+APPROX_MIN_ROWS = 100_000
+# Rebuild the IVF index once this fraction of rows was appended after it was trained
+IVF_REBUILD_GROWTH = 0.2
+IVF_TRAIN_SAMPLE = 50_000
+IVF_ITERATIONS = 8
+# Cells scanned per query; see benchmarks/bench_vectors.py for the recall / latency trade-off
+DEFAULT_NPROBE = 32
+# Candidates taken from the vector index for the semantic mode of the listing search
+SEMANTIC_MAX_RESULTS = 500
+# Cosine similarity below which semantic results are dropped
+SEMANTIC_MIN_SCORE = 0.05
+
+
+@lru_cache(maxsize=1 << 18)
+def _bucket(token: str) -> Tuple[int, float]:
+    # crc32 is stable across processes, unlike hash()
+    h = zlib.crc32(token.encode("utf-8"))
+    return h % EMBEDDING_DIM, (1.0 if h & 0x80000000 else -1.0)
+
+
+def features(title: str, abstract: Optional[str] = None) -> List[str]:
+    """Unigram and bigram tokens of a paper; title tokens appear twice."""
+    tokens = []
+    for text, weight in ((title or "", 2), (abstract or "", 1)):
+        words = search_terms(text)
+        grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        tokens.extend(grams * weight)
+    return tokens
+
+
+def term_frequencies(docs: Iterable[Sequence[str]], dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """(len(docs), dim) signed hashed sublinear term frequencies."""
+    docs = list(docs)
+    out = np.zeros((len(docs), dim), dtype=np.float32)
+    for row, tokens in enumerate(docs):
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, count in counts.items():
+            bucket, sign = _bucket(token)
+            out[row, bucket] += sign * (1.0 + np.log(count))
+    return out
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VectorIndex:
+    """
+    Paper vectors on disk, keyed by paper id.
+
+    Files in directory:
+      vectors.f32  float32 rows, EMBEDDING_DIM columns, in ids order
+      ids.npy      int64 paper id per row (ascending)
+      idf.npy      float32 IDF weight per bucket
+      ivf.npz      IVF centroids, row order and cell offsets (optional)
+      meta.json    row count and sync state; written last, so readers never
+                   map rows that are still being appended
+    """
+    def __init__(self, directory: str = DEFAULT_VECTOR_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self.meta = {}
+        self.idf = None
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.matrix = np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+        self.ivf = None
+        self._mtime = None
+        self.reload()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ---- loading ----
+
+    def reload(self, force: bool = False):
+        """Re-map the files if another process (the scanner) changed them."""
+        try:
+            mtime = os.path.getmtime(self._path("meta.json"))
+        except OSError:
+            return
+        if mtime == self._mtime and not force:
+            return
+        with open(self._path("meta.json")) as f:
+            meta = json.load(f)
+        count = meta.get("count", 0)
+        self.meta = meta
+        self.idf = np.load(self._path("idf.npy"))
+        self.ids = np.load(self._path("ids.npy"))[:count]
+        self.matrix = (np.memmap(self._path("vectors.f32"), dtype=np.float32, mode="r", shape=(count, EMBEDDING_DIM))
+                       if count else np.zeros((0, EMBEDDING_DIM), dtype=np.float32))
+        self.ivf = None
+        if os.path.exists(self._path("ivf.npz")):
+            data = np.load(self._path("ivf.npz"))
+            self.ivf = {key: data[key] for key in data.files}
+        self._mtime = mtime
+
+    def _save(self, name: str, write):
+        # Write to a temporary file and swap it in: readers keep the old copy
+        # (a process that has vectors.f32 mapped must never see it truncated)
+        tmp_path = self._path(name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, self._path(name))
+
+    def _write_meta(self, **changes):
+        self.meta.update(changes, count=len(self.ids), dim=EMBEDDING_DIM)
+        tmp_path = self._path("meta.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.meta, f)
+        os.replace(tmp_path, self._path("meta.json"))
+        self._mtime = os.path.getmtime(self._path("meta.json"))
+
+    # ---- writing ----
+
+    def fit(self, docs: Iterable[Sequence[str]]):
+        """Fit IDF weights from feature lists and start an empty index."""
+        os.makedirs(self.directory, exist_ok=True)
+        df = np.zeros(EMBEDDING_DIM, dtype=np.float64)
+        n = 0
+        for tokens in docs:
+            df[list({_bucket(t)[0] for t in tokens})] += 1
+            n += 1
+        self.idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+
+        # Publish an empty index first so no reader maps old row counts onto the new files
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.matrix = np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+        self.ivf = None
+        self.meta = {}
+        if os.path.exists(self._path("meta.json")):
+            self._write_meta(synced_at=None)
+        if os.path.exists(self._path("ivf.npz")):
+            os.remove(self._path("ivf.npz"))
+        self._save("idf.npy", lambda f: np.save(f, self.idf))
+        self._save("vectors.f32", lambda f: None)
+        self._save("ids.npy", lambda f: np.save(f, self.ids))
+        self._write_meta(synced_at=None)
+
+    def embed(self, docs: Iterable[Sequence[str]]) -> np.ndarray:
+        return normalize(term_frequencies(docs) * self.idf)
+
+    def add(self, ids: Sequence[int], docs: Sequence[Sequence[str]]):
+        """Append vectors for new papers (ids must be larger than every stored id)."""
+        if not len(ids):
+            return
+        vectors = self.embed(docs)
+        with self._lock:
+            with open(self._path("vectors.f32"), "ab") as f:
+                f.write(vectors.astype(np.float32).tobytes())
+            self.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+            self._save("ids.npy", lambda f: np.save(f, self.ids))
+            self._write_meta()
+            self._remap()
+
+    def update(self, ids: Sequence[int], docs: Sequence[Sequence[str]]):
+        """Re-embed papers already in the index (e.g. after enrichment added an abstract)."""
+        rows = self.rows_for(ids)
+        keep = rows >= 0
+        if not keep.any():
+            return
+        vectors = self.embed([d for d, k in zip(docs, keep) if k])
+        with self._lock:
+            matrix = np.memmap(self._path("vectors.f32"), dtype=np.float32, mode="r+", shape=(len(self.ids), EMBEDDING_DIM))
+            matrix[rows[keep]] = vectors
+            matrix.flush()
+            del matrix
+            self._write_meta()
+            self._remap()
+
+    def _remap(self):
+        count = len(self.ids)
+        self.matrix = (np.memmap(self._path("vectors.f32"), dtype=np.float32, mode="r", shape=(count, EMBEDDING_DIM))
+                       if count else np.zeros((0, EMBEDDING_DIM), dtype=np.float32))
+
+    def build_ivf(self, cells: Optional[int] = None, seed: int = 0):
+        """Train k-means cells over the stored vectors and save the IVF index."""
+        n = len(self.ids)
+        cells = cells or max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        sample = self.matrix[np.sort(rng.choice(n, size=min(n, IVF_TRAIN_SAMPLE), replace=False))]
+        centroids = sample[rng.choice(len(sample), size=cells, replace=False)].copy()
+        for _ in range(IVF_ITERATIONS):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            for cell in range(cells):
+                members = sample[assign == cell]
+                if len(members):
+                    centroids[cell] = members.mean(axis=0)
+            centroids = normalize(centroids)
+
+        assign = np.concatenate([
+            np.argmax(self.matrix[start:start + 20000] @ centroids.T, axis=1)
+            for start in range(0, n, 20000)
+        ])
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        offsets = np.searchsorted(assign[order], np.arange(cells + 1)).astype(np.int64)
+        self.ivf = {"centroids": centroids.astype(np.float32), "order": order, "offsets": offsets,
+                    "count": np.array(n)}
+        self._save("ivf.npz", lambda f: np.savez(f, **self.ivf))
+        self._write_meta()
+        logger.info(f"Built IVF index: {n} vectors in {cells} cells")
+
+    # ---- querying ----
+
+    def rows_for(self, ids: Sequence[int]) -> np.ndarray:
+        """Row of each paper id, -1 where the paper is not indexed."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self.ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(self.ids, ids), len(self.ids) - 1)
+        return np.where(self.ids[rows] == ids, rows, -1)
+
+    def vector_for(self, paper_id: int) -> Optional[np.ndarray]:
+        row = self.rows_for([paper_id])[0]
+        return None if row < 0 else np.asarray(self.matrix[row])
+
+    def search(self, vector: np.ndarray, k: int = 10, exact: Optional[bool] = None,
+               nprobe: int = DEFAULT_NPROBE) -> List[Tuple[int, float]]:
+        """Top-k (paper id, cosine similarity), best first."""
+        n = len(self.ids)
+        if n == 0 or not np.any(vector):
+            return []
+        if exact is None:
+            exact = self.ivf is None or n < APPROX_MIN_ROWS
+        if exact or self.ivf is None:
+            rows = None
+            scores = self.matrix @ vector
+        else:
+            rows = self._candidates(vector, nprobe)
+            scores = self.matrix[rows] @ vector
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        picked = top if rows is None else rows[top]
+        # Papers sharing no term with the query score 0 and are not results
+        return [(int(self.ids[r]), float(s)) for r, s in zip(picked, scores[top]) if s > 0]
+
+    def _candidates(self, vector, nprobe):
+        ivf = self.ivf
+        cells = np.argsort(-(ivf["centroids"] @ vector))[:nprobe]
+        offsets = ivf["offsets"]
+        parts = [ivf["order"][offsets[c]:offsets[c + 1]] for c in cells]
+        # Rows appended after the IVF index was trained are always scanned
+        trained = int(ivf["count"])
+        if trained < len(self.ids):
+            parts.append(np.arange(trained, len(self.ids)))
+        return np.sort(np.concatenate(parts))
+
+    def search_text(self, q: str, k: int = 10, **kwargs) -> List[Tuple[int, float]]:
+        if self.idf is None:
+            return []
+        return self.search(self.embed([features(q)])[0], k, **kwargs)
+
+    def similar(self, paper_id: int, k: int = 10, **kwargs) -> Optional[List[Tuple[int, float]]]:
+        """Papers most similar to paper_id (excluding itself); None if it is not indexed."""
+        vector = self.vector_for(paper_id)
+        if vector is None:
+            return None
+        return [(i, s) for i, s in self.search(vector, k + 1, **kwargs) if i != paper_id][:k]
+
+    # ---- keeping up with the database ----
+
+    def sync(self, session, rebuild: bool = False):
+        """
+        Embed papers added since the last sync and re-embed papers enriched since
+        then. Builds (or refits) the whole index when it is empty or rebuild is set.
+        """
+        from database import Paper
+
+        started_at = datetime.utcnow()
+        with self._lock:
+            self.reload()
+        had_ivf = self.ivf is not None
+        if rebuild or self.idf is None:
+            self.fit(features(title, abstract) for title, abstract in
+                     session.query(Paper.title, Paper.abstract).yield_per(EMBED_BATCH_SIZE))
+
+        last_id = int(self.ids[-1]) if len(self.ids) else 0
+        added = self._embed_rows(
+            session.query(Paper.id, Paper.title, Paper.abstract).filter(Paper.id > last_id).order_by(Paper.id),
+            self.add)
+
+        updated = 0
+        synced_at = self.meta.get("synced_at")
+        if synced_at and last_id:
+            updated = self._embed_rows(
+                session.query(Paper.id, Paper.title, Paper.abstract).filter(
+                    Paper.id <= last_id, Paper.enriched_at >= datetime.fromisoformat(synced_at)),
+                self.update)
+
+        n = len(self.ids)
+        if self.ivf is not None and (n - int(self.ivf["count"])) > IVF_REBUILD_GROWTH * int(self.ivf["count"]):
+            self.build_ivf()
+        elif had_ivf and self.ivf is None and n:
+            # Refitting dropped the approximate index; retrain it on the new vectors
+            self.build_ivf()
+        self._write_meta(synced_at=started_at.isoformat())
+        if added or updated:
+            logger.info(f"Vector index: {added} papers added, {updated} re-embedded ({n} total)")
+
+    @staticmethod
+    def _embed_rows(query, write) -> int:
+        total = 0
+        batch_ids, batch_docs = [], []
+        for paper_id, title, abstract in query.yield_per(EMBED_BATCH_SIZE):
+            batch_ids.append(paper_id)
+            batch_docs.append(features(title, abstract))
+            if len(batch_ids) >= EMBED_BATCH_SIZE:
+                write(batch_ids, batch_docs)
+                total += len(batch_ids)
+                batch_ids, batch_docs = [], []
+        if batch_ids:
+            write(batch_ids, batch_docs)
+            total += len(batch_ids)
+        return total
+
+
+# Shared read-side index per process, re-mapped when the files change
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index(directory: str = DEFAULT_VECTOR_DIR) -> VectorIndex:
+    global _index
+    with _index_lock:
+        if _index is None or _index.directory != directory:
+            _index = VectorIndex(directory)
+        else:
+            _index.reload()
+        return _index
+
+
+def sync_embeddings(session, directory: str = DEFAULT_VECTOR_DIR, rebuild: bool = False):
+    """Bring the on-disk vector index up to date with the papers table."""
+    VectorIndex(directory).sync(session, rebuild=rebuild)
+
+
+def semantic_ids(q: str, max_results: int = SEMANTIC_MAX_RESULTS) -> Optional[List[int]]:
+    """
+    Ids of the papers nearest to q in vector space, most similar first; None
+    when no vectors exist yet. numpy work (and a reload of the index files
+    after a scan): async endpoints call it through run_in_threadpool.
+    """
+    index = get_index()
+    if not len(index):
+        return None
+    return [paper_id for paper_id, score in index.search_text(q, max_results) if score >= SEMANTIC_MIN_SCORE]
+
+
+def apply_semantic(query, q: str, ranked_ids: Optional[List[int]] = None):
+    """
+    Restrict a Paper query to the papers nearest to q, most similar first.
+    ranked_ids: semantic_ids(q) computed beforehand (off the event loop);
+    without them the search runs here. Falls back to keyword search when no
+    vectors exist yet.
+    """
+    from database import Paper
+    from database.search import apply_search
+
+    if ranked_ids is None:
+        ranked_ids = semantic_ids(q)
+        if ranked_ids is None:
+            return apply_search(query, q)
+    if not ranked_ids:
+        return query.filter(Paper.id.is_(None))
+    rank = {paper_id: position for position, paper_id in enumerate(ranked_ids)}
+    return (query
+            .filter(Paper.id.in_(list(rank)))
+            .order_by(case(rank, value=Paper.id), Paper.id.desc()))
+
+if __name__ == "__main__":
+    import argparse
+    from database import SessionLocal, init_db
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Build or update the paper vector index.")
+    parser.add_argument("--dir", default=DEFAULT_VECTOR_DIR)
+    parser.add_argument("--rebuild", action="store_true", help="Refit IDF weights and re-embed every paper")
+    parser.add_argument("--ivf", action="store_true", help="(Re)build the approximate index regardless of size")
+    args = parser.parse_args()
+
+    init_db()
+    session = SessionLocal()
+    try:
+        index = VectorIndex(args.dir)
+        index.sync(session, rebuild=args.rebuild)
+        if args.ivf and len(index):
+            index.build_ivf()
+    finally:
+        session.close()
@@ -0,0 +1,199 @@
+"""
+Query-plan audit: runs EXPLAIN for every query shape the app issues against
+`papers` (listing filters, pagination, search, the scanner's dedup lookup,
+near-duplicate and author probes) and reports which indexes each plan uses,
+full table scans and sorts.
+
+    python -m database.explain                  # the configured DATABASE_URL
+    python -m database.explain --verbose        # print the raw plans as well
+
+Works on SQLite (EXPLAIN QUERY PLAN) and PostgreSQL (EXPLAIN, JSON format).
+PostgreSQL picks plans from table statistics, so run it against a database
+with real data (after ANALYZE). Exits with status 1 if a shape that should be
+served by an index scans the whole papers table.
+"""
+import json
+import re
+from typing import Callable, List, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from database import Paper, ScanJob, ScanJobItem
+from database.authors import find_author, papers_by_author
+from database.normalize import shared_buckets
+from database.pagination import encode_cursor, paginate
+from database.search import filter_papers, search_backend
+from database.stats import count_papers, invalidate_stats
+
+SAMPLE_YEAR = 2024
+PAGE_SIZE = 10
+
+
+class Shape(NamedTuple):
+    name: str
+    run: Callable  # session -> anything; issues the shape's queries
+    # False for shapes that read the table in id order and stop at the LIMIT,
+    # where a table scan is the right plan
+    needs_index: bool = True
+
+
+class Plan(NamedTuple):
+    indexes: List[str]
+    full_scans: List[str]
+    sorts: int
+    lines: List[str]
+
+
+def query_shapes(conference: str) -> List[Shape]:
+    """The shapes main.py and the scanner issue, run through the same helpers."""
+    from scanner import Scanner
+
+    after = encode_cursor({"a": 10 ** 9, "p": 2})
+    columns = (Paper.id, Paper.title, Paper.authors, Paper.conference, Paper.year, Paper.url)
+
+    def listing(session, keyset=True, **kwargs):
+        page_args = {k: kwargs.pop(k) for k in ("cursor", "page") if k in kwargs}
+        paginate(filter_papers(session.query(Paper), **kwargs), PAGE_SIZE, keyset=keyset, **page_args)
+
+    def ranked(session):
+        query = filter_papers(session.query(Paper), q="learning")
+        query.order_by(None).count()
+        paginate(query, PAGE_SIZE, keyset=False)
+
+    return [
+        Shape("listing: newest first", lambda s: listing(s), needs_index=False),
+        Shape("listing: next page (cursor)", lambda s: listing(s, cursor=after), needs_index=False),
+        Shape("listing: page jump (offset)", lambda s: listing(s, page=5), needs_index=False),
+        Shape("listing: conference", lambda s: listing(s, conferences=[conference])),
+        Shape("listing: conference + cursor", lambda s: listing(s, conferences=[conference], cursor=after)),
+        Shape("listing: conference + year range", lambda s: listing(
+            s, min_year=SAMPLE_YEAR, max_year=SAMPLE_YEAR, conferences=[conference])),
+        Shape("listing: year range", lambda s: listing(s, min_year=SAMPLE_YEAR, max_year=SAMPLE_YEAR)),
+        Shape("listing: totals (paper_stats)", lambda s: count_papers(s, SAMPLE_YEAR, None, [conference])),
+        Shape("search: count + ranked page", ranked),
+        Shape("api: conference, selected columns", lambda s: paginate(
+            filter_papers(s.query(*columns), conferences=[conference]), PAGE_SIZE)),
+        Shape("similar: papers by id", lambda s: s.query(*columns).filter(Paper.id.in_([1, 2, 3])).all()),
+        Shape("scanner: title keys of a conference-year", lambda s: Scanner._existing_keys(s, conference, SAMPLE_YEAR)),
+        Shape("normalize: near-duplicate candidates", lambda s: shared_buckets(s, 1, 500)),
+        Shape("authors: author by name", lambda s: find_author(s, "Jane Doe")),
+        Shape("authors: papers by author", lambda s: paginate(papers_by_author(s.query(*columns), 1), PAGE_SIZE)),
+        Shape("jobs: recent", lambda s: s.query(ScanJob.id).order_by(ScanJob.id.desc()).limit(20).all()),
+        Shape("jobs: items of a job", lambda s: s.query(ScanJobItem).filter(ScanJobItem.job_id == 1).order_by(
+            ScanJobItem.conference, ScanJobItem.year).all()),
+    ]
+
+
+def captured_selects(engine: Engine, shape: Shape, session: Session) -> list:
+    """(sql, parameters) of every SELECT the shape issues, recorded while it runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    invalidate_stats() # so the stats shape reaches the database
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        shape.run(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def _sqlite_plan(conn, sql: str, parameters) -> Plan:
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, parameters).fetchall()
+    lines = [row[-1] for row in rows]
+    indexes, scans, sorts = [], [], 0
+    for detail in lines:
+        m = re.search(r"USING (?:COVERING )?INDEX (\w+)", detail)
+        if m:
+            indexes.append(m.group(1))
+        elif "USING INTEGER PRIMARY KEY" in detail:
+            indexes.append("(rowid)")
+        elif re.match(r"SCAN (\w+)$", detail):
+            scans.append(detail.split()[1])
+        elif detail.startswith("SCAN") and "VIRTUAL TABLE" in detail:
+            indexes.append(detail.split()[1]) # FTS5 index
+        if "TEMP B-TREE" in detail:
+            sorts += 1
+    return Plan(indexes, scans, sorts, lines)
+
+
+def _postgres_plan(conn, sql: str, parameters) -> Plan:
+    (plan,), = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql, parameters).fetchall()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    indexes, scans, lines = [], [], []
+    sorts = 0
+
+    def walk(node, depth=0):
+        nonlocal sorts
+        kind = node["Node Type"]
+        relation = node.get("Relation Name", "")
+        lines.append("  " * depth + " ".join(filter(None, [kind, relation, node.get("Index Name")])))
+        if node.get("Index Name"):
+            indexes.append(node["Index Name"])
+        if kind == "Seq Scan":
+            scans.append(relation)
+        if kind in ("Sort", "Incremental Sort"):
+            sorts += 1
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(plan[0]["Plan"])
+    return Plan(indexes, scans, sorts, lines)
+
+
+def explain(engine: Engine, shape: Shape, session: Session) -> Plan:
+    """Combined plan of every SELECT the shape issues."""
+    plans = []
+    statements = captured_selects(engine, shape, session)
+    with engine.connect() as conn:
+        for sql, parameters in statements:
+            if engine.dialect.name == "postgresql":
+                plans.append(_postgres_plan(conn, sql, parameters))
+            else:
+                plans.append(_sqlite_plan(conn, sql, parameters))
+    return Plan(
+        indexes=[name for plan in plans for name in plan.indexes],
+        full_scans=[name for plan in plans for name in plan.full_scans],
+        sorts=sum(plan.sorts for plan in plans),
+        lines=[line for plan in plans for line in plan.lines + ["--"]][:-1],
+    )
+
+
+def audit(engine: Engine, verbose: bool = False) -> int:
+    """Print one line per query shape; returns the number of shapes that scan papers without an index."""
+    if engine.dialect.name not in ("sqlite", "postgresql"):
+        raise SystemExit(f"EXPLAIN audit supports SQLite and PostgreSQL, not {engine.dialect.name}")
+    problems = 0
+    with Session(engine) as session:
+        conference = session.query(Paper.conference).limit(1).scalar() or "CVPR"
+        search_backend(session.get_bind()) # detected once, outside the captured queries
+        print(f"{'query shape':<40} {'indexes':<50} {'full scans':<12} sorts")
+        for shape in query_shapes(conference):
+            plan = explain(engine, shape, session)
+            bad = shape.needs_index and "papers" in plan.full_scans
+            problems += bad
+            print(f"{shape.name:<40} {', '.join(dict.fromkeys(plan.indexes)) or '-':<50} "
+                  f"{', '.join(plan.full_scans) or '-':<12} {plan.sorts}{'  <- no index' if bad else ''}")
+            if verbose:
+                for line in plan.lines:
+                    print(f"    {line}")
+    return problems
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from database import engine, init_db
+
+    parser = argparse.ArgumentParser(description="EXPLAIN the app's queries and report index use.")
+    parser.add_argument("--verbose", action="store_true", help="Print each query plan")
+    args = parser.parse_args()
+
+    init_db()
+    sys.exit(1 if audit(engine, args.verbose) else 0)
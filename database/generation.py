@@ -0,0 +1,37 @@
+"""
+Data generation: a token that changes whenever papers change, shared by every
+process on the machine (web workers, the scan worker, CLI runs).
+
+Writers call bump() after committing; readers compare current() with the
+token they cached a result under. The token is the identity of a small file
+that bump() atomically replaces, so reading it costs one stat() call and no
+database round trip.
+"""
+import os
+import time
+
+from database import DATA_DIR
+
+GENERATION_FILE = os.getenv("DATA_GENERATION_FILE", os.path.join(DATA_DIR, "generation"))
+
+
+def current(path: str = GENERATION_FILE) -> str:
+    """Token of the current data generation ("0" before the first bump)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return "0"
+    # A replaced file gets a new inode even within one mtime tick
+    return f"{st.st_ino}-{st.st_mtime_ns}"
+
+
+def bump(path: str = GENERATION_FILE):
+    """Start a new generation; cached results from older ones are no longer used."""
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(time.time_ns()))
+        os.replace(tmp, path)
+    except OSError:
+        pass # Caches then expire by TTL instead
@@ -0,0 +1,131 @@
+"""
+Schema migrations for databases created by older versions.
+
+create_all() only creates missing tables and add_missing_columns() only adds
+nullable columns. Changes to existing tables (indexes, constraints) are the
+numbered migrations below: schema_migrations records which ones a database
+has, and migrate() applies the rest in order when the app starts.
+
+A fresh database already has the current schema from create_all(), so every
+migration has to be a no-op there (IF NOT EXISTS, or inspect first).
+
+    python -m database.migrations            # apply pending migrations
+    python -m database.migrations --status   # list migrations and whether they are applied
+"""
+import logging
+from typing import Callable, List, NamedTuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+
+from database import SchemaMigration
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _listing_indexes(conn: Connection):
+    # Same definitions as Paper.__table_args__
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_papers_conference_id ON papers (conference, id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_papers_year_id ON papers (year, id)"))
+
+
+def _dedup_key_order(conn: Connection):
+    # Older databases have the unique constraint as (title, conference, year),
+    # which cannot serve "WHERE conference = ? AND year = ?"
+    constraints = {c["name"]: c["column_names"] for c in inspect(conn).get_unique_constraints("papers")}
+    if constraints.get("_title_conf_year_uc") != ["title", "conference", "year"]:
+        return
+    if conn.dialect.name == "postgresql":
+        # Same name: the scanner's ON CONFLICT refers to the constraint by name
+        conn.execute(text("ALTER TABLE papers DROP CONSTRAINT _title_conf_year_uc"))
+        conn.execute(text("ALTER TABLE papers ADD CONSTRAINT _title_conf_year_uc UNIQUE (conference, year, title)"))
+    else:
+        # SQLite cannot alter a table constraint; a unique index in the right
+        # order serves the lookup (and ON CONFLICT matches it as well)
+        conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ux_papers_conference_year_title "
+                          "ON papers (conference, year, title)"))
+
+
+def analyze(conn: Connection):
+    # Without statistics SQLite guesses, and may sort a whole conference instead
+    # of walking the table newest first until the page is full (or the reverse)
+    conn.execute(text("ANALYZE papers" if conn.dialect.name == "postgresql" else "ANALYZE"))
+
+
+def _title_key_index(conn: Connection):
+    # papers.title_key itself is added by add_missing_columns(); keys of existing
+    # papers are filled in by python -m database.normalize
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_papers_conference_year_title_key "
+                      "ON papers (conference, year, title_key)"))
+    # Without statistics for it SQLite prefers the new index for every conference filter
+    analyze(conn)
+
+
+def _paper_authors_index(conn: Connection):
+    # Same definition as PaperAuthor.__table_args__; it replaces the single
+    # column author_id index, which is its prefix
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_paper_authors_author_paper "
+                      "ON paper_authors (author_id, paper_id)"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_paper_authors_author_id"))
+    analyze(conn)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "papers: composite indexes for the listing filters", _listing_indexes),
+    Migration(2, "papers: unique key ordered (conference, year, title)", _dedup_key_order),
+    Migration(3, "planner statistics for the new indexes", analyze),
+    Migration(4, "papers: index for the normalized title dedup", _title_key_index),
+    Migration(5, "paper_authors: (author_id, paper_id) index for papers by author", _paper_authors_index),
+]
+
+
+def applied_versions(engine: Engine) -> set:
+    with engine.connect() as conn:
+        return {version for (version,) in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def migrate(engine: Engine) -> List[int]:
+    """Apply pending migrations, each in its own transaction. Returns the versions applied."""
+    done = applied_versions(engine)
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version in done:
+            continue
+        logger.info(f"Applying migration {migration.version}: {migration.description}")
+        try:
+            with engine.begin() as conn:
+                migration.apply(conn)
+                conn.execute(SchemaMigration.__table__.insert().values(
+                    version=migration.version, description=migration.description))
+        except (IntegrityError, OperationalError, ProgrammingError):
+            # The web server and the scan worker start together; if the other one
+            # got there first this one's transaction fails and rolls back
+            if migration.version in applied_versions(engine):
+                continue
+            raise
+        applied.append(migration.version)
+    return applied
+
+
+if __name__ == "__main__":
+    import argparse
+    from database import engine, init_db
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Apply or list schema migrations.")
+    parser.add_argument("--status", action="store_true", help="Only list migrations")
+    args = parser.parse_args()
+
+    if not args.status:
+        init_db() # create_all + migrate
+    done = applied_versions(engine) if inspect(engine).has_table("schema_migrations") else set()
+    for migration in MIGRATIONS:
+        state = "applied" if migration.version in done else "pending"
+        print(f"{migration.version:>4}  {state:<8} {migration.description}")
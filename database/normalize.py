@@ -0,0 +1,416 @@
+"""
+Title and author normalization, applied by Scanner.
+
+- title_key(): the title folded for comparison (Unicode compatibility forms
+  and accents, case, punctuation, whitespace), so "Deep Nets." from dblp and
+  "Deep  nets" from a CVF page share a key. Scanner dedups a conference-year
+  on it.
+- Near duplicates: a MinHash signature over character shingles of the key,
+  cut into LSH bands stored in paper_title_bands. Papers sharing a band are
+  candidates; a candidate whose shingles overlap by NEAR_DUPLICATE_THRESHOLD
+  (Jaccard) makes the newer paper's duplicate_of the earliest such paper, in
+  any conference, unless the words the two titles differ in carry a number
+  ("Part I" / "Part II", "3D" / "4D", "v2"): those are different papers.
+  Scanner runs it once after writing a scan's papers (index_new_titles), not
+  inside the ingest transactions.
+- authors / paper_authors: Paper.authors split into names and keyed by the
+  folded name, so "papers by X" is an index probe instead of a LIKE over every
+  row (database/authors.py). Paper.authors stays as scraped; the UI shows it
+  and search indexes it.
+
+Databases from before this module have no keys yet; re-normalize them once:
+
+    python -m database.normalize                       # keys, near-duplicate index, author lists
+    python -m database.normalize --delete-duplicates   # also drop same conference-year duplicates
+"""
+import logging
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
+
+from database import Author, Paper, PaperAuthor, TitleBand
+
+logger = logging.getLogger(__name__)
+
+# Author strings the list-page scrapers store when the list view has no authors
+PLACEHOLDER_AUTHORS = ("Visit Detail Page", "See Project Page", "Unknown")
+
+# Character n-grams of the title key that MinHash compares
+SHINGLE_SIZE = 4
+# 12 bands of 6 rows, of which candidates must share MIN_SHARED_BANDS: titles
+# with Jaccard 0.9 qualify with probability ~0.998 (0.95: ~0.999996), titles at
+# 0.5 (common words in common) with ~0.015. A single shared band would let in
+# ten times as many pairs to compare, for a recall of ~0.9999 at 0.9
+NUM_BANDS = 12
+BAND_ROWS = 6
+NUM_PERM = NUM_BANDS * BAND_ROWS
+MIN_SHARED_BANDS = 2
+# High on purpose: character shingles of two titles that differ in a single
+# short word still overlap by 0.8 or more
+NEAR_DUPLICATE_THRESHOLD = 0.9
+# A bucket shared by more papers than this stands for a common phrase, not a
+# duplicate; it is skipped so one "deep neural networks for" cannot make every
+# insert compare against thousands of titles
+MAX_BUCKET_SIZE = 50
+# Values per IN (...) probe; stays well under SQLite's bound parameter limit
+PROBE_CHUNK = 500
+RENORMALIZE_BATCH_SIZE = 2000
+
+# Titles hashed together; bounds the (shingles x NUM_PERM) matrix to a few MB
+MINHASH_CHUNK = 256
+
+# Hash family h(x) = (a*x + b) mod p. Fixed seed: signatures (and so the stored
+# bands) must be the same in every process.
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(20240601)
+_PERM_A = _rng.randint(1, _PRIME, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, _PRIME, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+# Shingle value = polynomial over its code points; band hash = FNV-1a style mix
+# of its rows (all uint64 arithmetic, wrapping)
+_GRAM_MULT = np.uint64(1000003)
+_FNV_PRIME = np.uint64(0x100000001B3)
+_BAND_SEEDS = (np.arange(NUM_BANDS, dtype=np.uint64) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+
+_NON_WORD = re.compile(r"[\W_]+")
+# Words that number a paper within a series: anything with a digit, roman numerals up to 39
+_NUMBERING = re.compile(r"\w*\d\w*|x{0,3}(?:ix|iv|v?i{1,3}|v)|x{1,3}")
+_AUTHOR_SEPARATOR = re.compile(r"\s*(?:[,;]|\band\b)\s*")
+
+
+def fold(text: str) -> str:
+    """Lowercase ASCII-ish form of text: accents dropped, punctuation to spaces, single spaces."""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
+
+def title_key(title: Optional[str]) -> str:
+    return fold(title or "")
+
+
+@lru_cache(maxsize=65536)
+def author_key(name: str) -> str:
+    # Cached: the same names come back paper after paper
+    return fold(name)
+
+
+def split_authors(authors: Optional[str]) -> List[str]:
+    """Names in a comma-joined Paper.authors string, in order, without duplicates or placeholders."""
+    if not authors or authors.strip() in PLACEHOLDER_AUTHORS:
+        return []
+    names, seen = [], set()
+    for name in _AUTHOR_SEPARATOR.split(authors):
+        name = " ".join(name.split())
+        key = author_key(name)
+        if key and key not in seen:
+            seen.add(key)
+            names.append(name)
+    return names
+
+
+def shingles(key: str) -> Set[str]:
+    if len(key) <= SHINGLE_SIZE:
+        return {key} if key else set()
+    return {key[i:i + SHINGLE_SIZE] for i in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def differ_in_numbering(a: str, b: str) -> bool:
+    """Whether title keys a and b differ in a number or roman numeral ("part i" / "part ii")."""
+    return any(_NUMBERING.fullmatch(word) for word in set(a.split()) ^ set(b.split()))
+
+
+def near_duplicate(a: str, a_grams: Set[str], b: str, b_grams: Set[str]) -> bool:
+    return jaccard(a_grams, b_grams) >= NEAR_DUPLICATE_THRESHOLD and not differ_in_numbering(a, b)
+
+
+def _gram_values(key: str) -> np.ndarray:
+    """One uint64 per shingle of key (a single one for keys up to SHINGLE_SIZE characters)."""
+    points = np.frombuffer(key.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    width = min(SHINGLE_SIZE, len(points))
+    count = len(points) - width + 1
+    values = np.zeros(count, dtype=np.uint64)
+    for offset in range(width):
+        values = values * _GRAM_MULT + points[offset:offset + count]
+    return values % _PRIME
+
+
+def minhash_many(keys: Sequence[str]) -> np.ndarray:
+    """(len(keys), NUM_PERM) MinHash signatures of the keys' shingles; all zeros for an empty key."""
+    signatures = np.zeros((len(keys), NUM_PERM), dtype=np.uint64)
+    for start in range(0, len(keys), MINHASH_CHUNK):
+        chunk = [(row, _gram_values(key)) for row, key in enumerate(keys[start:start + MINHASH_CHUNK], start) if key]
+        if not chunk:
+            continue
+        values = np.concatenate([grams for _, grams in chunk])
+        offsets = np.cumsum([0] + [len(grams) for _, grams in chunk[:-1]])
+        # Every permutation of every shingle at once, then the minimum per title
+        permuted = (values[:, None] * _PERM_A + _PERM_B) % _PRIME
+        signatures[[row for row, _ in chunk]] = np.minimum.reduceat(permuted, offsets, axis=0)
+    return signatures
+
+
+def band_hashes_many(keys: Sequence[str]) -> List[List[int]]:
+    """NUM_BANDS signed 64-bit LSH bucket ids per key (none for an empty key)."""
+    bands = minhash_many(keys).reshape(len(keys), NUM_BANDS, BAND_ROWS)
+    hashes = np.broadcast_to(_BAND_SEEDS, (len(keys), NUM_BANDS)).copy()
+    for row in range(BAND_ROWS):
+        hashes = (hashes ^ bands[:, :, row]) * _FNV_PRIME
+    hashes ^= hashes >> np.uint64(29)
+    return [row if key else [] for key, row in zip(keys, hashes.view(np.int64).tolist())]
+
+
+def band_hashes(key: str) -> List[int]:
+    return band_hashes_many([key])[0]
+
+
+def _chunks(items: Sequence, size: int = PROBE_CHUNK):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _insert_ignore(session, model, index_elements: List[str]):
+    """INSERT that skips rows conflicting on index_elements, where the backend supports it."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    return insert(model)
+
+
+def author_ids(session, names: Iterable[str]) -> Dict[str, int]:
+    """{name_key: author id} for names, creating the authors not seen before. Caller commits."""
+    wanted = {}
+    for name in names:
+        wanted.setdefault(author_key(name), name)
+    ids = {}
+
+    def load(keys):
+        for chunk in _chunks(list(keys)):
+            ids.update(session.execute(select(Author.name_key, Author.id).where(Author.name_key.in_(chunk))).all())
+
+    load(wanted)
+    missing = [key for key in wanted if key not in ids]
+    if missing:
+        session.execute(_insert_ignore(session, Author, ["name_key"]),
+                        [{"name": wanted[key], "name_key": key} for key in missing])
+        load(missing)
+    return ids
+
+
+def index_authors(session, papers: Sequence[Tuple[int, Optional[str]]], replace: bool = True):
+    """
+    Write paper_authors for (paper id, Paper.authors) pairs. replace: drop the
+    papers' previous author lists first (e.g. after enrichment filled them in).
+    Caller commits.
+    """
+    if replace:
+        for chunk in _chunks([paper_id for paper_id, _ in papers]):
+            session.execute(delete(PaperAuthor).where(PaperAuthor.paper_id.in_(chunk)))
+    split = [(paper_id, split_authors(authors)) for paper_id, authors in papers]
+    ids = author_ids(session, (name for _, names in split for name in names))
+    rows = [
+        {"paper_id": paper_id, "position": position, "author_id": ids[author_key(name)]}
+        for paper_id, names in split
+        for position, name in enumerate(names)
+    ]
+    if rows:
+        session.execute(insert(PaperAuthor.__table__), rows)
+
+
+def shared_buckets(session, first_id: int, last_id: int) -> List[Tuple[int, int]]:
+    """
+    (paper id, earlier paper id) for every pair of indexed papers sharing
+    MIN_SHARED_BANDS buckets of at most MAX_BUCKET_SIZE papers, the first one
+    with an id in [first_id, last_id]. One self-join over the band index,
+    instead of an IN (...) probe per few hundred hashes of a batch.
+    """
+    mine, other, member = aliased(TitleBand), aliased(TitleBand), aliased(TitleBand)
+    # "Has a member past the cap": stops reading the bucket there, so a huge
+    # bucket costs no more than a small one
+    oversized = (select(member.paper_id).where(member.band_hash == mine.band_hash)
+                 .offset(MAX_BUCKET_SIZE).limit(1).correlate(mine).exists())
+    return session.execute(
+        select(mine.paper_id, other.paper_id)
+        .where(mine.paper_id.between(first_id, last_id), ~oversized,
+               other.band_hash == mine.band_hash, other.paper_id < mine.paper_id)
+        .group_by(mine.paper_id, other.paper_id)
+        .having(func.count() >= MIN_SHARED_BANDS)).all()
+
+
+def index_titles(session, papers: Sequence[Tuple[int, Optional[str]]]) -> int:
+    """
+    Add (paper id, title_key) pairs to the near-duplicate index and set
+    duplicate_of on those matching an earlier paper (already indexed, or
+    earlier in papers). The papers must not be indexed yet. Caller commits.
+    Returns the number of papers marked as duplicates.
+    """
+    papers = sorted((paper_id, key or "") for paper_id, key in papers)
+    if not papers:
+        return 0
+    bands = dict(zip((paper_id for paper_id, _ in papers), band_hashes_many([key for _, key in papers])))
+    rows = [{"paper_id": paper_id, "band_hash": h} for paper_id, hashes in bands.items() for h in set(hashes)]
+    if not rows:
+        return 0
+    # Core INSERT: plain executemany, without the ORM's per-row bookkeeping
+    session.execute(insert(TitleBand.__table__), rows)
+
+    # The id range may take in papers another writer inserted meanwhile; they
+    # are filtered out below
+    shared = shared_buckets(session, papers[0][0], papers[-1][0])
+    candidates: Dict[int, Set[int]] = {}
+    for paper_id, other_id in shared:
+        if paper_id in bands:
+            candidates.setdefault(paper_id, set()).add(other_id)
+
+    known = {}  # paper id -> (title key, canonical id)
+    earlier = list({other_id for ids in candidates.values() for other_id in ids if other_id not in bands})
+    for chunk in _chunks(earlier):
+        for paper_id, key, duplicate_of in session.execute(
+                select(Paper.id, Paper.title_key, Paper.duplicate_of).where(Paper.id.in_(chunk))):
+            known[paper_id] = (key or "", duplicate_of or paper_id)
+
+    grams_of = {}  # paper id -> shingles, computed once per paper compared
+
+    def grams(paper_id, key):
+        if paper_id not in grams_of:
+            grams_of[paper_id] = shingles(key)
+        return grams_of[paper_id]
+
+    marked = []
+    for paper_id, key in papers:
+        canonical = None
+        if paper_id in candidates:
+            # Shingle sets only for the few papers that have candidates at all
+            matches = [known[other_id][1] for other_id in candidates[paper_id] if other_id in known
+                       and near_duplicate(key, grams(paper_id, key), known[other_id][0],
+                                          grams(other_id, known[other_id][0]))]
+            if matches:
+                canonical = min(matches)
+                marked.append({"id": paper_id, "duplicate_of": canonical})
+        # Later papers in this batch can match this one
+        known[paper_id] = (key, canonical or paper_id)
+
+    if marked:
+        session.execute(update(Paper), marked)
+    return len(marked)
+
+
+def index_papers(session, papers: Sequence[Tuple[int, Optional[str], Optional[str]]]) -> int:
+    """Index newly inserted (id, title_key, authors) papers; returns the number marked as duplicates."""
+    index_authors(session, [(paper_id, authors) for paper_id, _, authors in papers], replace=False)
+    return index_titles(session, [(paper_id, key) for paper_id, key, _ in papers])
+
+
+def index_new_titles(session, batch_size: int = RENORMALIZE_BATCH_SIZE) -> int:
+    """
+    Add the papers stored since the last call (ids above the highest indexed
+    one) to the near-duplicate index, committing per batch. Returns the number
+    marked as duplicates.
+    """
+    last = session.execute(select(func.max(TitleBand.paper_id))).scalar() or 0
+    marked = 0
+    for rows in _batches(session, (Paper.id, Paper.title_key), batch_size, after=last):
+        marked += index_titles(session, rows)
+        session.commit()
+    return marked
+
+
+def _delete_duplicates(session) -> int:
+    """Delete papers whose title key repeats an older paper of the same conference-year."""
+    from database.stats import invalidate_stats, rebuild_stats
+
+    older = aliased(Paper)
+    ids = session.execute(select(Paper.id).where(exists().where(
+        older.conference == Paper.conference, older.year == Paper.year,
+        older.title_key == Paper.title_key, older.id < Paper.id))).scalars().all()
+    for chunk in _chunks(ids):
+        session.execute(delete(PaperAuthor).where(PaperAuthor.paper_id.in_(chunk)))
+        session.execute(delete(TitleBand).where(TitleBand.paper_id.in_(chunk)))
+        session.execute(delete(Paper).where(Paper.id.in_(chunk)).execution_options(synchronize_session=False))
+    # Listing totals come from paper_stats
+    rebuild_stats(session)
+    session.commit()
+    invalidate_stats()
+    return len(ids)
+
+
+def _batches(session, columns, batch_size: int, after: int = 0):
+    """Rows of columns (Paper.id first) with ids above after, in id order, batch_size at a time."""
+    last = after
+    while True:
+        rows = session.execute(select(*columns).where(Paper.id > last).order_by(Paper.id).limit(batch_size)).all()
+        if not rows:
+            return
+        yield rows
+        last = rows[-1][0]
+
+
+def renormalize(session, delete_duplicates: bool = False, batch_size: int = RENORMALIZE_BATCH_SIZE) -> dict:
+    """
+    Recompute title keys, the near-duplicate index, duplicate_of and author
+    lists of every paper, committing per batch.
+    delete_duplicates: also delete papers whose title key repeats within a conference-year.
+    """
+    from database import generation
+    from database.migrations import analyze
+
+    result = {"papers": 0, "keys_changed": 0, "deleted": 0, "duplicates": 0}
+    for rows in _batches(session, (Paper.id, Paper.title, Paper.title_key), batch_size):
+        changed = [{"id": paper_id, "title_key": title_key(title)}
+                   for paper_id, title, key in rows if title_key(title) != key]
+        if changed:
+            session.execute(update(Paper), changed)
+        session.commit()
+        result["papers"] += len(rows)
+        result["keys_changed"] += len(changed)
+    logger.info(f"Title keys: {result['keys_changed']} of {result['papers']} papers changed")
+
+    if delete_duplicates:
+        result["deleted"] = _delete_duplicates(session)
+        logger.info(f"Deleted {result['deleted']} same conference-year duplicates")
+
+    # Rebuilt from scratch in id order, so duplicate_of always points at the oldest paper
+    session.execute(delete(TitleBand))
+    session.execute(delete(PaperAuthor))
+    session.execute(update(Paper).values(duplicate_of=None))
+    session.commit()
+    for rows in _batches(session, (Paper.id, Paper.title_key, Paper.authors), batch_size):
+        result["duplicates"] += index_papers(session, rows)
+        session.commit()
+    logger.info(f"Indexed {result['papers'] - result['deleted']} papers, {result['duplicates']} near-duplicates")
+    # Planner statistics for the refilled title_key column and tables
+    analyze(session.connection())
+    session.commit()
+    generation.bump()
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+    from database import SessionLocal, init_db
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Re-normalize titles and authors of every stored paper.")
+    parser.add_argument("--delete-duplicates", action="store_true",
+                        help="Delete papers whose normalized title repeats within a conference-year")
+    parser.add_argument("--batch-size", type=int, default=RENORMALIZE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    init_db()
+    session = SessionLocal()
+    try:
+        print(renormalize(session, delete_duplicates=args.delete_duplicates, batch_size=args.batch_size))
+    finally:
+        session.close()
@@ -0,0 +1,109 @@
+"""
+Keyset (cursor) pagination for paper listings ordered newest first.
+
+Cursors are opaque URL-safe tokens. A keyset cursor remembers the id at the
+page boundary, so fetching the next page is an index range scan whose cost
+does not depend on how deep the page is. Relevance-ranked search results have
+no stable key to seek on and paginate by offset instead; their cursors carry
+the offset.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+from database import Paper
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(state: dict) -> str:
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+    if not isinstance(state, dict) or not any(k in state for k in ("a", "b", "o")):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+    return state
+
+
+@dataclass
+class Page:
+    items: List
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+    page: int  # 1-based page number, for display
+
+
+def paginate(query, limit: int, cursor: Optional[str] = None, page: int = 1, keyset: bool = True) -> Page:
+    """
+    Fetch one page of query.
+
+    keyset: the query is unordered and may be paged by Paper.id descending.
+            Pass False for queries that carry their own ordering (ranked search).
+    cursor: token from a previous Page; takes precedence over page.
+    page:   page number for direct jumps without a cursor (served by offset).
+
+    Cursor state keys: "a" = ids below this one (next), "b" = ids above this
+    one (previous), "o" = offset, "p" = page number being displayed.
+    """
+    state = decode_cursor(cursor) if cursor else {}
+    page = max(1, int(state.get("p", page)))
+
+    if keyset and ("a" in state or "b" in state or (not cursor and page == 1)):
+        return _keyset_page(query, limit, state, page)
+
+    offset = int(state["o"]) if "o" in state else (page - 1) * limit
+    if not keyset:
+        query_page = query.offset(offset).limit(limit + 1).all()
+    else:
+        query_page = query.order_by(Paper.id.desc()).offset(offset).limit(limit + 1).all()
+    items = query_page[:limit]
+    has_next = len(query_page) > limit
+    has_prev = offset > 0
+
+    if keyset and items:
+        # A page jump lands here; from now on navigate by key
+        next_state = {"a": items[-1].id, "p": page + 1}
+        prev_state = {"b": items[0].id, "p": page - 1}
+    else:
+        next_state = {"o": offset + limit, "p": page + 1}
+        prev_state = {"o": max(0, offset - limit), "p": page - 1}
+    return Page(
+        items=items,
+        next_cursor=encode_cursor(next_state) if has_next else None,
+        prev_cursor=encode_cursor(prev_state) if has_prev else None,
+        page=page,
+    )
+
+
+def _keyset_page(query, limit, state, page) -> Page:
+    if "b" in state:
+        # Walking backwards: seek upwards from the boundary, then flip back to newest first
+        rows = query.filter(Paper.id > int(state["b"])).order_by(Paper.id.asc()).limit(limit + 1).all()
+        has_prev = len(rows) > limit
+        items = list(reversed(rows[:limit]))
+        has_next = True
+    else:
+        after = state.get("a")
+        if after is not None:
+            query = query.filter(Paper.id < int(after))
+        rows = query.order_by(Paper.id.desc()).limit(limit + 1).all()
+        has_next = len(rows) > limit
+        items = rows[:limit]
+        has_prev = after is not None
+
+    return Page(
+        items=items,
+        next_cursor=encode_cursor({"a": items[-1].id, "p": page + 1}) if has_next and items else None,
+        prev_cursor=encode_cursor({"b": items[0].id, "p": max(1, page - 1)}) if has_prev and items else None,
+        page=page,
+    )
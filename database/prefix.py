@@ -0,0 +1,143 @@
+"""
+In-memory prefix search for autocomplete, array-backed.
+
+PrefixIndex answers "which keys have a word starting with this prefix", best
+weight first. The keys are stored back to back in one string, and every word
+start of every key is one entry: (character position, key row), kept in two
+int32 arrays sorted by the text from the position on. A lookup is a binary
+search for the range of entries starting with the prefix. The index costs
+8 bytes per word and 8 per key (start and weight) on top of the text itself,
+instead of a node object per character as in a trie, and keys appended later
+are merged into the sorted arrays rather than rebuilding them.
+"""
+from typing import Iterable, List
+
+import numpy as np
+
+# Entries are sorted on this many characters from their position; longer
+# prefixes are matched on the first SORT_WIDTH and then checked in full
+SORT_WIDTH = 24
+# Ranked candidates per requested result; more only when the top ones repeat a key
+CANDIDATES_PER_RESULT = 4
+# Keys are folded (no line breaks), so this ends every key in the text
+SEPARATOR = "\n"
+# Above this share of new entries add() sorts everything again instead of merging
+RESORT_FRACTION = 0.125
+
+
+class PrefixIndex:
+    """
+    Prefix search over keys (already folded, words separated by single
+    spaces) with a weight per key. words_only=False indexes only the start of
+    each key (whole-key prefixes, e.g. for single words).
+    """
+    def __init__(self, keys: Iterable[str] = (), weights=None, words_only: bool = True):
+        self.words_only = words_only
+        self.text = ""
+        self.starts = np.zeros(0, dtype=np.int32)     # position of each key in text
+        self.weights = np.zeros(0, dtype=np.float32)
+        self.positions = np.zeros(0, dtype=np.int32)  # entries, sorted by text[position:]
+        self.rows = np.zeros(0, dtype=np.int32)       # key row of each entry
+        self._pending = []
+        self.add(keys, weights)
+        self.merge()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def key(self, row: int) -> str:
+        start = int(self.starts[row])
+        return self.text[start:self.text.index(SEPARATOR, start)]
+
+    def add(self, keys: Iterable[str], weights=None):
+        """Append keys; they get rows len(self), len(self) + 1, ... Searchable after merge()."""
+        keys = list(keys)
+        if not keys:
+            return
+        weights = np.ones(len(keys), dtype=np.float32) if weights is None else np.asarray(weights, dtype=np.float32)
+        first_row, position = len(self.starts), len(self.text)
+        starts, positions, rows = [], [], []
+        for row, key in enumerate(keys, first_row):
+            starts.append(position)
+            if key:
+                positions.append(position)
+                rows.append(row)
+                if self.words_only:
+                    space = key.find(" ")
+                    while space != -1:
+                        positions.append(position + space + 1)
+                        rows.append(row)
+                        space = key.find(" ", space + 1)
+            position += len(key) + 1
+        self.text += SEPARATOR.join(keys) + SEPARATOR
+        self.starts = np.concatenate([self.starts, np.array(starts, dtype=np.int32)])
+        self.weights = np.concatenate([self.weights, weights])
+
+        # Sorted into the entries by merge(), once for everything added meanwhile
+        self._pending.append((np.array(positions, dtype=np.int32), np.array(rows, dtype=np.int32)))
+
+    def merge(self):
+        """Sort entries of keys added since the last merge into place (search() does it too)."""
+        if not self._pending:
+            return
+        positions = np.concatenate([p for p, _ in self._pending])
+        rows = np.concatenate([r for _, r in self._pending])
+        self._pending = []
+        if len(positions) > RESORT_FRACTION * len(self.positions):
+            self.positions, self.rows = self._sorted(np.concatenate([self.positions, positions]),
+                                                     np.concatenate([self.rows, rows]))
+        elif len(positions):
+            # A few new entries (one scan batch): insert each at its place
+            positions, rows = self._sorted(positions, rows)
+            at = [self._bound(self._text(p), after=False) for p in positions.tolist()]
+            self.positions = np.insert(self.positions, at, positions)
+            self.rows = np.insert(self.rows, at, rows)
+
+    def _sorted(self, positions: np.ndarray, rows: np.ndarray):
+        # Sorted in C through a temporary fixed-width string array, dropped afterwards
+        text = np.array([self._text(p) for p in positions.tolist()], dtype=f"<U{SORT_WIDTH}")
+        order = np.argsort(text, kind="stable")
+        return positions[order], rows[order]
+
+    def _text(self, position: int) -> str:
+        return self.text[position:position + SORT_WIDTH]
+
+    def _bound(self, prefix: str, after: bool) -> int:
+        """First entry not below prefix (after=False), or past every entry starting with it."""
+        lo, hi = 0, len(self.positions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            text = self._text(int(self.positions[mid]))
+            if text < prefix or (after and text.startswith(prefix)):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def search(self, prefix: str, limit: int = 10) -> List[int]:
+        """Rows of up to limit keys with a word starting with prefix, highest weight first."""
+        self.merge()
+        if not prefix or not len(self.positions):
+            return []
+        head = prefix[:SORT_WIDTH]
+        lo = self._bound(head, after=False)
+        hi = self._bound(head, after=True)
+        rows = self.rows[lo:hi]
+        if len(prefix) > SORT_WIDTH:
+            rows = rows[[self.text.startswith(prefix, p) for p in self.positions[lo:hi].tolist()]]
+        return self._top(rows, limit)
+
+    def _top(self, rows: np.ndarray, limit: int) -> List[int]:
+        wanted = limit * CANDIDATES_PER_RESULT
+        while True:
+            best = rows
+            if len(rows) > wanted:
+                # Only the best few are sorted; a one-letter prefix can match a third of the index
+                best = rows[np.argpartition(-self.weights[rows], wanted - 1)[:wanted]]
+            # Weight descending, then row for ties
+            ranked = best[np.lexsort((best, -self.weights[best]))]
+            found = list(dict.fromkeys(ranked.tolist()))[:limit]
+            if len(found) == limit or len(best) == len(rows):
+                return found
+            # Keys matching on several words crowded out the others
+            wanted *= CANDIDATES_PER_RESULT
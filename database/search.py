@@ -0,0 +1,166 @@
+"""
+Full-text search over papers (title, authors, conference).
+
+SQLite uses an external-content FTS5 table kept in sync with `papers` by
+triggers; PostgreSQL uses a generated, weighted `tsvector` column with a GIN
+index. Both rank matches and treat every search term as a prefix. Any other
+backend (or SQLite built without FTS5) falls back to ILIKE.
+"""
+import logging
+import re
+from typing import List, Optional
+
+from sqlalchemy import column, func, literal_column, or_, table, text
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "papers_fts"
+# Relative weight of title, authors and conference matches
+SQLITE_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+SQLITE_SETUP = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, authors, conference,
+        content='papers', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, authors, conference)
+        VALUES (new.id, new.title, new.authors, new.conference);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, authors, conference)
+        VALUES ('delete', old.id, old.title, old.authors, old.conference);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS papers_fts_au AFTER UPDATE OF title, authors, conference ON papers BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, authors, conference)
+        VALUES ('delete', old.id, old.title, old.authors, old.conference);
+        INSERT INTO {FTS_TABLE}(rowid, title, authors, conference)
+        VALUES (new.id, new.title, new.authors, new.conference);
+    END""",
+    # Index rows that existed before the FTS table was created
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+POSTGRES_SETUP = [
+    """ALTER TABLE papers ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(authors, '')), 'B') ||
+            setweight(to_tsvector('simple', coalesce(conference, '')), 'C')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_papers_search_vector ON papers USING GIN (search_vector)",
+]
+
+# Detected backend per database URL: "fts5", "tsvector" or "ilike"
+_backends = {}
+
+
+def setup_search(engine):
+    """Create the full-text index for the engine's backend. Safe to call repeatedly."""
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        with engine.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"), {"name": FTS_TABLE}
+            ).first()
+        if not exists:
+            try:
+                with engine.begin() as conn:
+                    for statement in SQLITE_SETUP:
+                        conn.execute(text(statement))
+            except OperationalError as e:
+                # Python's sqlite3 built without FTS5
+                logger.warning(f"FTS5 unavailable, search falls back to ILIKE: {e}")
+    elif dialect == "postgresql":
+        with engine.begin() as conn:
+            for statement in POSTGRES_SETUP:
+                conn.execute(text(statement))
+    _backends.pop(str(engine.url), None)
+
+
+def search_backend(bind) -> str:
+    key = str(bind.engine.url)
+    if key not in _backends:
+        dialect = bind.dialect.name
+        backend = "ilike"
+        with bind.engine.connect() as conn:
+            if dialect == "sqlite":
+                if conn.execute(text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"),
+                                {"name": FTS_TABLE}).first():
+                    backend = "fts5"
+            elif dialect == "postgresql":
+                if conn.execute(text("SELECT 1 FROM information_schema.columns "
+                                     "WHERE table_name='papers' AND column_name='search_vector'")).first():
+                    backend = "tsvector"
+        _backends[key] = backend
+    return _backends[key]
+
+
+def search_terms(q: str):
+    """Split a query into word terms, dropping FTS/tsquery syntax characters."""
+    return re.findall(r"\w+", q.lower())
+
+
+def apply_search(query, q: str):
+    """
+    Restrict a Paper query to matches for q, best matches first (newest first
+    among equal ranks). Terms are ANDed and each matches as a prefix.
+    """
+    from database import Paper
+
+    terms = search_terms(q)
+    backend = search_backend(query.session.get_bind()) if terms else "ilike"
+
+    if backend == "fts5":
+        # "graph neur" -> "graph"* "neur"*  (each term quoted so it cannot be FTS syntax)
+        match = " ".join('"%s"*' % term for term in terms)
+        fts_table = table(FTS_TABLE, column("rowid"))
+        fts = literal_column(FTS_TABLE)
+        return (query
+                .join(fts_table, fts_table.c.rowid == Paper.id)
+                .filter(fts.op("MATCH")(match))
+                .order_by(func.bm25(fts, *SQLITE_BM25_WEIGHTS), Paper.id.desc()))
+
+    if backend == "tsvector":
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        vector = literal_column("papers.search_vector")
+        return (query
+                .filter(vector.op("@@")(tsquery))
+                .order_by(func.ts_rank(vector, tsquery).desc(), Paper.id.desc()))
+
+    search = f"%{q}%"
+    return query.filter(or_(
+        Paper.title.ilike(search),
+        Paper.authors.ilike(search),
+        Paper.conference.ilike(search)
+    )).order_by(Paper.id.desc())
+
+
+def filter_papers(query, q: Optional[str] = None, min_year: Optional[int] = None,
+                  max_year: Optional[int] = None, conferences: Optional[List[str]] = None,
+                  mode: str = "keyword", ranked_ids: Optional[List[int]] = None):
+    """
+    Apply the listing filters shared by / and /api/papers to a query over papers.
+    mode: "keyword" (full-text index) or "semantic" (nearest papers by embedding).
+    ranked_ids: for mode="semantic", the embedding search's result computed
+    beforehand (database.embeddings.semantic_ids).
+    """
+    from database import Paper
+    from database.embeddings import apply_semantic
+
+    # Text Search (ranked)
+    if q and q.strip():
+        query = apply_semantic(query, q, ranked_ids) if mode == "semantic" else apply_search(query, q)
+    
+    # Year Filter
+    if min_year is not None:
+        query = query.filter(Paper.year >= min_year)
+    if max_year is not None:
+        query = query.filter(Paper.year <= max_year)
+    
+    # Conference Filter
+    if conferences:
+        # conferences comes as a list e.g. ["CVPR", "NDSS"]
+        query = query.filter(Paper.conference.in_(conferences))
+    return query
@@ -0,0 +1,114 @@
+"""
+Materialized paper counts per conference-year.
+
+paper_stats holds one row per (conference, year) and is updated by Scanner in
+the same transaction that inserts the papers, so the listing page can show
+filtered totals and the conference facet without scanning `papers`.
+
+Readers go through an in-process cache. Scanner invalidates it after every
+commit and bumps the data generation (database/generation.py), so a scan
+running in another process (the scan worker, the CLI) is picked up on the
+next read; STATS_TTL only bounds the age of a snapshot.
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select, update
+
+from database import Paper, PaperStat
+from database import generation
+
+# Seconds a cached snapshot is trusted before re-reading paper_stats
+STATS_TTL = 30.0
+
+# Cached snapshot per database URL: (loaded_at, generation, {(conference, year): count})
+_snapshots = {}
+_lock = threading.Lock()
+
+
+def add_papers(session, conference: str, year: int, count: int):
+    """Record count new papers for a conference-year. Runs inside the caller's transaction."""
+    if count <= 0:
+        return
+    now = datetime.utcnow()
+    result = session.execute(
+        update(PaperStat)
+        .where(PaperStat.conference == conference, PaperStat.year == year)
+        .values(paper_count=PaperStat.paper_count + count, updated_at=now)
+    )
+    if result.rowcount == 0:
+        session.execute(insert(PaperStat).values(
+            conference=conference, year=year, paper_count=count, updated_at=now))
+
+
+def rebuild_stats(session):
+    """Recompute every row from `papers` (one GROUP BY). Caller commits."""
+    session.query(PaperStat).delete()
+    now = datetime.utcnow()
+    rows = [
+        {"conference": conference, "year": year, "paper_count": count, "updated_at": now}
+        for conference, year, count in session.execute(
+            select(Paper.conference, Paper.year, func.count()).group_by(Paper.conference, Paper.year))
+        if conference is not None and year is not None
+    ]
+    if rows:
+        session.execute(insert(PaperStat), rows)
+
+
+def ensure_stats(engine):
+    """Populate paper_stats for databases that have papers from before it existed."""
+    from sqlalchemy.orm import Session
+
+    with Session(engine) as session:
+        if session.query(PaperStat).first() is None and session.query(Paper.id).first() is not None:
+            rebuild_stats(session)
+            session.commit()
+    invalidate_stats()
+
+
+def invalidate_stats():
+    """Drop cached snapshots; the next reader reloads paper_stats."""
+    with _lock:
+        _snapshots.clear()
+
+
+def get_stats(session) -> Dict[Tuple[str, int], int]:
+    """{(conference, year): paper_count}, served from memory while fresh."""
+    key = str(session.get_bind().engine.url)
+    now = time.monotonic()
+    current = generation.current()
+    with _lock:
+        snapshot = _snapshots.get(key)
+    if snapshot and now - snapshot[0] < STATS_TTL and snapshot[1] == current:
+        return snapshot[2]
+
+    counts = {
+        (conference, year): count
+        for conference, year, count in session.query(PaperStat.conference, PaperStat.year, PaperStat.paper_count)
+    }
+    with _lock:
+        _snapshots[key] = (now, current, counts)
+    return counts
+
+
+def conference_names(session) -> List[str]:
+    """Distinct conferences with at least one paper, sorted."""
+    return sorted({conference for (conference, _), count in get_stats(session).items() if count})
+
+
+def count_papers(session, min_year: Optional[int] = None, max_year: Optional[int] = None,
+                 conferences: Optional[Iterable[str]] = None) -> int:
+    """Number of papers matching year/conference filters, from the materialized counts."""
+    wanted = set(conferences) if conferences else None
+    total = 0
+    for (conference, year), count in get_stats(session).items():
+        if min_year is not None and year < min_year:
+            continue
+        if max_year is not None and year > max_year:
+            continue
+        if wanted is not None and conference not in wanted:
+            continue
+        total += count
+    return total
@@ -0,0 +1,204 @@
+"""
+Search-as-you-type suggestions for the listing's search box (/api/suggest).
+
+Two PrefixIndex structures (database/prefix.py) held in memory:
+- titles: every paper's title key, matched from its start and ranked newest
+  first; the endpoint looks the display titles up by paper id.
+- keywords: the distinct words of all titles, ranked by the number of titles
+  containing them; the last word being typed is completed from it. Words
+  are matched folded and returned as spelled in the first title that had
+  them ("schro" -> "Schrödinger").
+
+The index is built once per process (in the background at startup) and then
+grows incrementally: when the data generation (database/generation.py)
+moves on, only papers with an id above the last one loaded are read and
+merged in. Changes to existing papers (python -m database.normalize) are
+picked up by the full rebuild every SUGGEST_REBUILD_INTERVAL seconds.
+"""
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy import select
+
+from database import Paper
+from database import generation
+from database.normalize import fold, title_key
+from database.prefix import PrefixIndex
+
+# Papers read per query while loading
+SUGGEST_LOAD_BATCH = 10000
+# Words shorter than this are not offered as completions
+MIN_KEYWORD_LENGTH = 3
+# Seconds between full rebuilds (incremental refreshes only ever add papers)
+SUGGEST_REBUILD_INTERVAL = 3600.0
+
+# Word characters, as title_key() splits them
+_WORD = re.compile(r"[^\W_]+")
+# The word being typed: trailing word characters of the query
+_LAST_WORD = re.compile(r"[^\W_]+\Z")
+
+
+def _spellings(title: str, key: str) -> List[tuple]:
+    """(folded word, word as written in title) pairs for the words of key."""
+    words = _WORD.findall(title)
+    if title.isascii():
+        # Folding ASCII only lowercases and splits at the same characters
+        return [(folded, word) for folded, word in zip(key.split(), words) if folded == word.lower()]
+    return [(folded, word) for word in words for folded in fold(word).split()]
+
+
+class Suggester:
+    """Title and keyword prefix indexes over the papers table."""
+    def __init__(self):
+        self.titles = PrefixIndex(words_only=False)
+        self.paper_ids = np.zeros(0, dtype=np.int64)  # paper id per title row
+        self.keywords = PrefixIndex(words_only=False)
+        self._keyword_rows: Dict[str, int] = {}
+        self._keyword_spellings: List[str] = []  # display form per keyword row
+        self.last_id = 0
+        self.generation = None
+        self.built_at = 0.0
+        # Searches wait while a refresh merges new papers into the arrays
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.titles)
+
+    def refresh(self, session) -> int:
+        """Add papers inserted since the last refresh; returns how many."""
+        current = generation.current()
+        with self._lock:
+            added = 0
+            while True:
+                rows = session.execute(
+                    select(Paper.id, Paper.title_key, Paper.title)
+                    .where(Paper.id > self.last_id).order_by(Paper.id).limit(SUGGEST_LOAD_BATCH)).all()
+                if not rows:
+                    break
+                self._add(rows)
+                added += len(rows)
+                self.last_id = rows[-1][0]
+            self.titles.merge()
+            self.keywords.merge()
+            self.generation = current
+            if not self.built_at:
+                self.built_at = time.monotonic()
+            return added
+
+    def _add(self, rows):
+        keys = [key if key is not None else title_key(title) for _, key, title in rows]
+        ids = [paper_id for paper_id, _, _ in rows]
+        # Newest first: the id is the weight (exact in float32 up to 16M papers)
+        self.titles.add(keys, ids)
+        self.paper_ids = np.concatenate([self.paper_ids, np.array(ids, dtype=np.int64)])
+
+        # Titles containing each word
+        counts = Counter(word for key in keys for word in set(key.split())
+                         if len(word) >= MIN_KEYWORD_LENGTH and not word.isdigit())
+        new_words = []
+        for word, count in counts.items():
+            row = self._keyword_rows.get(word)
+            if row is None:
+                self._keyword_rows[word] = len(self.keywords) + len(new_words)
+                new_words.append(word)
+            else:
+                self.keywords.weights[row] += count
+        self.keywords.add(new_words, [counts[word] for word in new_words])
+
+        # Spelling of each new word in the first title that has it
+        spellings = {}
+        missing = set(new_words)
+        for (_, _, title), key in zip(rows, keys):
+            if not missing:
+                break
+            if missing.isdisjoint(key.split()):
+                continue
+            for word, written in _spellings(title or "", key):
+                if word in missing:
+                    spellings[word] = written
+                    missing.discard(word)
+        self._keyword_spellings.extend(spellings.get(word, word) for word in new_words)
+
+    def suggest(self, q: str, limit: int = 8) -> dict:
+        """
+        {"keywords": words completing q's last word, as spelled in titles,
+        "paper_ids": ids of titles starting with q}.
+        """
+        key = title_key(q)
+        if not key:
+            return {"keywords": [], "paper_ids": []}
+        # Nothing to complete once the last word is finished (space, punctuation)
+        last = _LAST_WORD.search(q)
+        prefix = fold(last.group()) if last else ""
+        with self._lock:
+            paper_ids = self.paper_ids[self.titles.search(key, limit)].tolist()
+            completions = []
+            if prefix:
+                for row in self.keywords.search(prefix, limit + 1):
+                    if self.keywords.key(row) != prefix:
+                        completions.append(self._keyword_spellings[row])
+        return {"keywords": completions[:limit], "paper_ids": paper_ids}
+
+
+# Suggester per database URL
+_suggesters: Dict[str, Suggester] = {}
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def get_suggester(session) -> Suggester:
+    """
+    The process's Suggester, brought up to date with the papers table. The
+    first call builds it; later ones add new papers when the generation
+    changed. A full rebuild (older than SUGGEST_REBUILD_INTERVAL) runs while
+    other requests keep using the current index.
+    """
+    url = str(session.get_bind().engine.url)
+    with _lock:
+        suggester = _suggesters.get(url)
+    if suggester is None:
+        with _build_lock:
+            with _lock:
+                suggester = _suggesters.get(url)
+            if suggester is None:
+                suggester = Suggester()
+                suggester.refresh(session)
+                with _lock:
+                    _suggesters[url] = suggester
+        return suggester
+    if time.monotonic() - suggester.built_at > SUGGEST_REBUILD_INTERVAL and _build_lock.acquire(blocking=False):
+        try:
+            rebuilt = Suggester()
+            rebuilt.refresh(session)
+            with _lock:
+                _suggesters[url] = suggester = rebuilt
+        finally:
+            _build_lock.release()
+    elif suggester.generation != generation.current():
+        suggester.refresh(session)
+    return suggester
+
+
+def suggest(session, q: str, limit: int = 8) -> dict:
+    """Completions of q's last word and matching titles ({"id", "title", "conference", "year"}) for q."""
+    found = get_suggester(session).suggest(q, limit)
+    titles: List[dict] = []
+    if found["paper_ids"]:
+        rows = {row.id: row for row in session.execute(
+            select(Paper.id, Paper.title, Paper.conference, Paper.year).where(Paper.id.in_(found["paper_ids"])))}
+        # Papers deleted since they were indexed are skipped
+        titles = [rows[paper_id]._asdict() for paper_id in found["paper_ids"] if paper_id in rows]
+    return {"keywords": found["keywords"], "titles": titles}
+
+
+def warm_up(session_factory):
+    """Build the index in a background thread, so the first keystrokes do not wait for it."""
+    def build():
+        with session_factory() as session:
+            get_suggester(session)
+
+    threading.Thread(target=build, name="suggest-warm-up", daemon=True).start()
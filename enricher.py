@@ -0,0 +1,203 @@
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+from database import SessionLocal, Paper, init_db
+from database import generation
+from database.embeddings import sync_embeddings
+from database.normalize import PLACEHOLDER_AUTHORS, index_authors
+from scrapers.detail import DETAIL_HOSTS, DetailScraper, PaperDetail
+from scrapers.http import format_stats, get_client
+from scrapers.throttle import HostThrottle, parse_host_limits
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Paper.enrichment_status values. None means the paper has not been tried yet.
+STATUS_DONE = "done"            # found new authors, abstract or PDF link
+STATUS_NOT_FOUND = "not_found"  # page fetched, nothing usable on it
+STATUS_FAILED = "failed"        # page could not be fetched; retried with --retry-failed
+
+# Detail pages are small and numerous, so hosts get a larger budget than in a scan
+DEFAULT_HOST_LIMITS = {
+    "iclr.cc": 4,
+    "icml.cc": 4,
+    "neurips.cc": 4,
+    "nips.cc": 4,
+    "thecvf.com": 4,
+    "openreview.net": 2,
+}
+DEFAULT_HOST_LIMIT = 2
+DEFAULT_HOST_DELAY = 0.2  # seconds between two requests to the same host
+DEFAULT_MAX_WORKERS = 16
+# Results written per commit; an interrupted run loses at most this many pages of work
+COMMIT_BATCH_SIZE = 50
+
+def _supported_url():
+    """SQL condition: Paper.url is on one of DETAIL_HOSTS or a subdomain of it."""
+    return or_(*(condition for host in DETAIL_HOSTS
+                 for condition in (Paper.url.like(f"http%://{host}/%"), Paper.url.like(f"http%://%.{host}/%"))))
+
+class Enricher:
+    """
+    Second stage after Scanner.run: visit each paper's detail page and fill in
+    authors (where the list page only had a placeholder), abstract and PDF link.
+
+    Progress is stored per paper in enrichment_status / enriched_at and committed
+    in small batches, so an interrupted run resumes where it stopped and a
+    re-run only touches papers that were never tried.
+    """
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, host_limits=None, host_delay=DEFAULT_HOST_DELAY):
+        """
+        max_workers: detail pages fetched at once across all hosts.
+        host_limits: overrides merged into DEFAULT_HOST_LIMITS, e.g. {"iclr.cc": 8}.
+        host_delay: minimum seconds between requests to the same host.
+        """
+        self.max_workers = max(1, int(max_workers))
+        limits = dict(DEFAULT_HOST_LIMITS)
+        limits.update(host_limits or {})
+        self.scraper = DetailScraper()
+        self.scraper.throttle = HostThrottle(limits, default_limit=DEFAULT_HOST_LIMIT, delay=host_delay)
+
+    def run(self, target_confs=None, retry_failed=False, limit=None):
+        """
+        Enrich papers still missing data.
+        target_confs: Optional list of conference names (e.g. ['ICLR', 'ICML']). If None, all.
+        retry_failed: also retry papers whose page could not be fetched last time.
+        limit: stop after this many papers.
+        """
+        init_db()
+        session = SessionLocal()
+        started = time.monotonic()
+        http_before = get_client().stats.snapshot()
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich")
+        pending = []
+        counts = {STATUS_DONE: 0, STATUS_NOT_FOUND: 0, STATUS_FAILED: 0}
+
+        try:
+            papers = self._candidates(session, target_confs, retry_failed, limit)
+            logger.info(f"Enriching {len(papers)} papers with {self.max_workers} workers")
+            futures = {pool.submit(self.scraper.scrape_detail, paper.url): paper for paper in papers}
+            for future in as_completed(futures):
+                paper = futures[future]
+                try:
+                    detail = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to enrich paper {paper.id} ({paper.url}): {e}")
+                    detail = None
+                values = self._merge(paper, detail)
+                counts[values["enrichment_status"]] += 1
+                pending.append(values)
+                if len(pending) >= COMMIT_BATCH_SIZE:
+                    self._flush(session, pending)
+                    done = sum(counts.values())
+                    logger.info(f"Enriched {done}/{len(papers)} papers ({time.monotonic() - started:.0f}s)")
+            self._flush(session, pending)
+            # New abstracts change the papers' vectors
+            self._sync_embeddings(session)
+        finally:
+            # On interrupt: drop queued pages, keep what already finished
+            pool.shutdown(wait=True, cancel_futures=True)
+            self._flush(session, pending)
+            session.close()
+
+        logger.info(f"Enrichment finished in {time.monotonic() - started:.1f}s: "
+                    f"{counts[STATUS_DONE]} enriched, {counts[STATUS_NOT_FOUND]} without data, "
+                    f"{counts[STATUS_FAILED]} failed")
+        logger.info(f"HTTP: {format_stats(get_client().stats.since(http_before))}")
+        return counts
+
+    @staticmethod
+    def _candidates(session: Session, target_confs=None, retry_failed=False, limit=None):
+        """
+        Papers missing an abstract or real authors that have not been tried yet,
+        with a link to a site in DETAIL_HOSTS.
+        """
+        statuses = [Paper.enrichment_status.is_(None)]
+        if retry_failed:
+            statuses.append(Paper.enrichment_status == STATUS_FAILED)
+        query = session.query(Paper.id, Paper.url, Paper.authors, Paper.pdf_url, Paper.abstract).filter(
+            or_(*statuses),
+            or_(Paper.abstract.is_(None), Paper.authors.in_(PLACEHOLDER_AUTHORS)),
+            _supported_url(),
+        )
+        if target_confs:
+            query = query.filter(Paper.conference.in_(target_confs))
+        query = query.order_by(Paper.id)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def _merge(paper, detail: PaperDetail) -> dict:
+        """
+        Column values for one paper. Real authors and existing data are never
+        overwritten; "authors" is only present when the detail page replaced them.
+        """
+        # Naive UTC, like the other DateTime columns
+        values = {"id": paper.id, "pdf_url": paper.pdf_url, "abstract": paper.abstract,
+                  "enriched_at": datetime.now(timezone.utc).replace(tzinfo=None)}
+        if detail is None:
+            values["enrichment_status"] = STATUS_FAILED
+            return values
+
+        found = False
+        if detail.authors and (not paper.authors or paper.authors in PLACEHOLDER_AUTHORS):
+            values["authors"] = detail.authors
+            found = True
+        if detail.pdf_url and not paper.pdf_url:
+            values["pdf_url"] = detail.pdf_url
+            found = True
+        if detail.abstract and not paper.abstract:
+            values["abstract"] = detail.abstract
+            found = True
+        values["enrichment_status"] = STATUS_DONE if found else STATUS_NOT_FOUND
+        return values
+
+    @staticmethod
+    def _sync_embeddings(session: Session):
+        try:
+            sync_embeddings(session)
+            generation.bump()
+        except Exception as e:
+            logger.error(f"Failed to update the vector index: {e}")
+
+    @staticmethod
+    def _flush(session: Session, pending):
+        if not pending:
+            return
+        try:
+            # Bulk UPDATE ... WHERE id = :id, one executemany per batch and set of columns
+            session.execute(update(Paper), pending)
+            # Author lists (database/normalize.py) follow the replaced authors strings
+            replaced = [(values["id"], values["authors"]) for values in pending if "authors" in values]
+            if replaced:
+                index_authors(session, replaced)
+            session.commit()
+            # Cached listing pages show the old authors / abstracts
+            generation.bump()
+        except Exception as e:
+            logger.error(f"Failed to save {len(pending)} enrichment results: {e}")
+            session.rollback()
+        pending.clear()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fill in authors, abstracts and PDF links from paper detail pages.")
+    parser.add_argument("conferences", nargs="*", help="Conference names to enrich (default: all)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Detail pages fetched in parallel")
+    parser.add_argument("--host-limit", action="append", metavar="HOST=N",
+                        help="Concurrent requests allowed for a host, e.g. iclr.cc=8")
+    parser.add_argument("--host-delay", type=float, default=DEFAULT_HOST_DELAY,
+                        help="Seconds between requests to the same host")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Also retry papers whose detail page could not be fetched before")
+    parser.add_argument("--limit", type=int, help="Enrich at most this many papers")
+    args = parser.parse_args()
+
+    enricher = Enricher(max_workers=args.workers, host_limits=parse_host_limits(args.host_limit),
+                        host_delay=args.host_delay)
+    enricher.run(target_confs=args.conferences or None, retry_failed=args.retry_failed, limit=args.limit)
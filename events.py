@@ -0,0 +1,160 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import delete, func, insert, select
+
+from database import Event, SessionLocal
+
+# Events kept in the table; a client further behind than this gets a gap
+DEFAULT_CAPACITY = 5000
+# Events waiting to be written; beyond this (database unavailable) new ones are dropped
+MAX_QUEUED_EVENTS = 10000
+# Old events are deleted every this many written ones
+PRUNE_EVERY = 500
+# Seconds a process waits at exit for its queued events to be written
+FLUSH_TIMEOUT = 5.0
+
+class EventBus:
+    """
+    Progress and log events in the events table, shared by every process on
+    the database: web servers, the scan worker and CLI runs.
+
+    publish() only queues an event; a background thread writes queued events
+    in batches, so a log call made during a scan's write transaction never
+    waits on the database. The table gives every event an increasing id, so a
+    client that remembers the last id it saw asks for just the newer ones
+    (since()) from whichever web process serves it. Only the newest capacity
+    events are kept.
+    """
+    def __init__(self, session_factory=SessionLocal, capacity: int = DEFAULT_CAPACITY):
+        self._session_factory = session_factory
+        self.capacity = capacity
+        self._queue = queue.Queue(maxsize=MAX_QUEUED_EVENTS)
+        self._lock = threading.Lock()
+        self._writer = None
+        self._written = threading.Condition()
+        self._pending = 0 # queued or being written
+        self._unpruned = 0
+        # Set while this thread writes; events published meanwhile (say, a
+        # log record about a failed write) would only feed the loop
+        self._local = threading.local()
+
+    def publish(self, kind: str, **data) -> dict:
+        """
+        Queue an event {"time", "kind", **data}; it gets its id once written.
+        kind: "log" (a log record), "progress" (one conference-year of a scan),
+              "scan" or "job" (start / end of a scan or a queued job).
+        """
+        event = {"time": time.time(), "kind": kind}
+        event.update(data)
+        if getattr(self._local, "writing", False):
+            return event
+        with self._written:
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                return event # Dropped rather than hold up a scan
+            self._pending += 1
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_queued, daemon=True, name="event-writer")
+                self._writer.start()
+                # Events queued right before the process exits
+                atexit.register(self.flush)
+        return event
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """Wait until the events published so far are written; False on timeout."""
+        with self._written:
+            return self._written.wait_for(lambda: not self._pending, timeout)
+
+    def _write_queued(self):
+        while True:
+            batch = [self._queue.get()]
+            # Whatever piled up during the previous write goes in one INSERT
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            self._write(batch)
+            with self._written:
+                self._pending -= len(batch)
+                self._written.notify_all()
+
+    def _write(self, batch: List[dict]):
+        self._local.writing = True
+        session = self._session_factory()
+        try:
+            session.execute(insert(Event), [
+                {"time": event["time"], "kind": event["kind"],
+                 "data": json.dumps({k: v for k, v in event.items() if k not in ("time", "kind")}, default=str)}
+                for event in batch])
+            self._unpruned += len(batch)
+            if self._unpruned >= PRUNE_EVERY:
+                newest = select(func.max(Event.id)).scalar_subquery()
+                session.execute(delete(Event).where(Event.id <= newest - self.capacity))
+                self._unpruned = 0
+            session.commit()
+        except Exception:
+            # e.g. no events table yet (init_db not run) or database down: the batch is lost
+            session.rollback()
+        finally:
+            session.close()
+            self._local.writing = False
+
+# Process-wide bus; scanner, jobs and the web server publish here
+bus = EventBus()
+publish = bus.publish
+
+
+def _as_dict(event: Event) -> dict:
+    result = {"id": event.id, "time": event.time, "kind": event.kind}
+    result.update(json.loads(event.data))
+    return result
+
+
+def last_id(session) -> int:
+    return session.execute(select(func.max(Event.id))).scalar() or 0
+
+
+def first_id(session) -> int:
+    """Id of the oldest event still stored (last_id + 1 when there are none)."""
+    return session.execute(select(func.min(Event.id))).scalar() or last_id(session) + 1
+
+
+def since(session, after: int = 0, limit: Optional[int] = None) -> List[dict]:
+    """
+    Events with id > after, oldest first. An after beyond the newest id (ids
+    from before the database was reset) counts as 0.
+    """
+    query = select(Event).where(Event.id > after).order_by(Event.id).limit(limit)
+    events = session.execute(query).scalars().all()
+    if not events and after and after > last_id(session):
+        return since(session, 0, limit)
+    return [_as_dict(event) for event in events]
+
+
+def latest(session, kind: str, limit: int) -> List[dict]:
+    """The newest limit events of a kind, oldest first."""
+    events = session.execute(
+        select(Event).where(Event.kind == kind).order_by(Event.id.desc()).limit(limit)).scalars().all()
+    return [_as_dict(event) for event in reversed(events)]
+
+
+class EventLogHandler(logging.Handler):
+    """Logging handler that publishes each record as a "log" event."""
+    def __init__(self, event_bus: EventBus = None, level=logging.INFO):
+        super().__init__(level)
+        self.bus = event_bus or bus
+
+    def emit(self, record):
+        try:
+            self.bus.publish("log", level=record.levelname, logger=record.name, message=self.format(record))
+        except Exception:
+            self.handleError(record)
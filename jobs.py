@@ -0,0 +1,292 @@
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, exists, text, update
+from sqlalchemy.orm import Session, aliased
+from database import DATA_DIR, SessionLocal, ScanJob, ScanJobItem, init_db
+import events
+
+try:
+    import fcntl
+except ImportError: # Windows: no advisory file locks, see _lock_worker
+    fcntl = None
+
+logger = logging.getLogger("jobs") # also when run as __main__
+
+# ScanJob.status values
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+POLL_INTERVAL = 2.0  # seconds between checks for queued jobs
+HEARTBEAT_INTERVAL = 15.0  # seconds between heartbeats of a running job
+# A running job without a heartbeat for this long belongs to a dead worker
+STALE_AFTER = timedelta(minutes=2)
+# Held by the running worker, so each machine (and database) runs one
+WORKER_LOCK_FILE = os.path.join(DATA_DIR, "worker.lock")
+
+def _conference_list(conferences: Optional[List[str]]) -> Optional[str]:
+    return ",".join(sorted(set(conferences))) if conferences else None
+
+def _covers(job: ScanJob, conferences: Optional[List[str]], full: bool, enrich: bool) -> bool:
+    """Whether job already does everything a new request for these options would."""
+    if job.conferences is not None:
+        if not conferences or not set(conferences) <= set(job.conferences.split(",")):
+            return False
+    return (job.full or not full) and (job.enrich or not enrich)
+
+def _lock_queue(session: Session):
+    """
+    Take the database's write lock for scan_jobs until the session commits, so
+    two processes (or requests) cannot both miss each other's queued job.
+    Must be the first statement of the session's transaction.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        # Conflicts with itself and with writers, not with readers of the table
+        session.execute(text("LOCK TABLE scan_jobs IN SHARE ROW EXCLUSIVE MODE"))
+    else:
+        # SQLite locks the whole database for writing at the first write
+        # statement of a transaction (like BEGIN IMMEDIATE), even one that
+        # changes no rows; the next enqueue waits here (busy_timeout) and
+        # then reads the job this one queued
+        session.execute(text("UPDATE scan_jobs SET status = status WHERE 1 = 0"))
+
+def enqueue(session: Session, conferences: Optional[List[str]] = None, full: bool = False,
+            enrich: bool = False) -> Tuple[ScanJob, bool]:
+    """
+    Queue a scan unless a queued or running job already covers it.
+    Returns (job, created); created is False when an existing job was returned.
+    """
+    _lock_queue(session)
+    for job in session.query(ScanJob).filter(ScanJob.status.in_(ACTIVE_STATUSES)).order_by(ScanJob.id):
+        if _covers(job, conferences, full, enrich):
+            # Nothing to write, but end the transaction: it holds the queue lock.
+            # Commit rather than roll back, which would expire job (and the web
+            # app reads it after AsyncSession.run_sync returns).
+            session.commit()
+            return job, False
+    job = ScanJob(status=JOB_QUEUED, conferences=_conference_list(conferences), full=full, enrich=enrich)
+    session.add(job)
+    session.commit()
+    return job, True
+
+def job_progress(session: Session, job_id: int) -> Optional[dict]:
+    """Job status plus per conference-year progress, None if the job does not exist."""
+    job = session.get(ScanJob, job_id)
+    if job is None:
+        return None
+    items = session.query(ScanJobItem).filter(ScanJobItem.job_id == job_id).order_by(
+        ScanJobItem.conference, ScanJobItem.year).all()
+    counts = {}
+    for item in items:
+        counts[item.status] = counts.get(item.status, 0) + 1
+    return {
+        "id": job.id,
+        "status": job.status,
+        "conferences": job.conferences.split(",") if job.conferences else None,
+        "full": job.full,
+        "enrich": job.enrich,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "error": job.error,
+        "total": len(items),
+        "finished": len(items) - counts.get("pending", 0) - counts.get("running", 0),
+        "counts": counts,
+        "items": [
+            {"conference": i.conference, "year": i.year, "status": i.status,
+             "papers_found": i.papers_found, "papers_added": i.papers_added}
+            for i in items
+        ],
+    }
+
+def claim_next(session: Session) -> Optional[ScanJob]:
+    """
+    Atomically move the oldest queued job to running, if no other job is running.
+    One job at a time keeps scans from competing for the database and the sites.
+    """
+    now = datetime.utcnow()
+    # Jobs whose worker died mid-run would otherwise block the queue forever
+    session.execute(
+        update(ScanJob)
+        .where(ScanJob.status == JOB_RUNNING, ScanJob.heartbeat_at < now - STALE_AFTER)
+        .values(status=JOB_FAILED, finished_at=now, error="Worker stopped responding")
+    )
+    session.commit()
+
+    job = session.query(ScanJob).filter(ScanJob.status == JOB_QUEUED).order_by(ScanJob.id).first()
+    if job is None:
+        return None
+    running = aliased(ScanJob)
+    claimed = session.execute(
+        update(ScanJob)
+        .where(ScanJob.id == job.id, ScanJob.status == JOB_QUEUED,
+               ~exists().where(and_(running.status == JOB_RUNNING, running.id != job.id)))
+        .values(status=JOB_RUNNING, started_at=now, heartbeat_at=now, worker_pid=os.getpid())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    session.commit()
+    if not claimed:
+        return None
+    session.refresh(job)
+    return job
+
+def run_job(job: ScanJob):
+    """Run a claimed job's scan (and enrichment), recording progress as it goes."""
+    from scanner import Scanner
+
+    job_id = job.id
+    conferences = job.conferences.split(",") if job.conferences else None
+    session = SessionLocal()
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_heartbeat, args=(job_id, stop), daemon=True)
+    heartbeat.start()
+
+    def progress(conf_name, year, status, papers_found=None, papers_added=None):
+        item = session.get(ScanJobItem, (job_id, conf_name, year))
+        if item is None:
+            item = ScanJobItem(job_id=job_id, conference=conf_name, year=year)
+            session.add(item)
+        item.status = status
+        item.papers_found = papers_found
+        item.papers_added = papers_added
+        item.updated_at = datetime.utcnow()
+        session.commit()
+
+    status, error = JOB_DONE, None
+    events.publish("job", job_id=job_id, status=JOB_RUNNING)
+    try:
+        logger.info(f"Job {job_id}: scanning {conferences or 'all conferences'}")
+        Scanner(full=job.full).run(target_confs=conferences, progress=progress)
+        if job.enrich:
+            from enricher import Enricher
+            Enricher().run(target_confs=conferences)
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {e}")
+        session.rollback()
+        status, error = JOB_FAILED, str(e)
+    finally:
+        stop.set()
+        heartbeat.join()
+        session.execute(update(ScanJob).where(ScanJob.id == job_id).values(
+            status=status, error=error, finished_at=datetime.utcnow()))
+        session.commit()
+        session.close()
+    logger.info(f"Job {job_id} {status}")
+    events.publish("job", job_id=job_id, status=status, error=error)
+
+def _heartbeat(job_id: int, stop: threading.Event):
+    session = SessionLocal()
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                session.execute(update(ScanJob).where(ScanJob.id == job_id).values(heartbeat_at=datetime.utcnow()))
+                session.commit()
+            except Exception as e:
+                # e.g. SQLite busy while the scan writes; the next beat will do
+                logger.warning(f"Heartbeat for job {job_id} failed: {e}")
+                session.rollback()
+    finally:
+        session.close()
+
+def _lock_worker(path: str = WORKER_LOCK_FILE):
+    """
+    Take the worker lock: returns the open lock file, which holds the lock until
+    it is closed, or None when another process holds it. Without fcntl every
+    caller gets the lock.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    lock = open(path, "a")
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return None
+    return lock
+
+def work(poll_interval: float = POLL_INTERVAL, once: bool = False, parent_pid: Optional[int] = None):
+    """
+    Worker loop: claim and run queued jobs one at a time.
+    once: return when the queue is empty. parent_pid: exit when that process goes away.
+    Returns at once if another worker is running (WORKER_LOCK_FILE).
+    """
+    lock = _lock_worker()
+    if lock is None:
+        logger.info("Another scan worker is running, exiting")
+        return
+    try:
+        _work(poll_interval, once, parent_pid)
+    finally:
+        lock.close()
+
+def _work(poll_interval: float, once: bool, parent_pid: Optional[int]):
+    init_db()
+    logger.info(f"Scan worker {os.getpid()} started")
+    while True:
+        if parent_pid and os.getppid() != parent_pid:
+            logger.info("Web server exited, stopping scan worker")
+            return
+        session = SessionLocal()
+        try:
+            job = claim_next(session)
+        finally:
+            session.close()
+        if job is not None:
+            run_job(job)
+            continue
+        if once:
+            return
+        time.sleep(poll_interval)
+
+# Worker process started by this (web) process
+_worker = None
+_worker_lock = threading.Lock()
+
+def ensure_worker():
+    """
+    Start a scan worker subprocess unless one is running already: the one this
+    process started earlier, or any other holding WORKER_LOCK_FILE (started by
+    another uvicorn worker, or python jobs.py). Returns the process started
+    here, None if another process's worker is running.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is not None and _worker.poll() is None:
+            return _worker
+        lock = _lock_worker()
+        if lock is None:
+            return None
+        # Released for the worker to take; should two web processes get here at
+        # once, the second worker finds the lock taken and exits
+        lock.close()
+        script = os.path.abspath(__file__)
+        # Its events reach the web servers through the events table
+        _worker = subprocess.Popen([sys.executable, script, "--parent-pid", str(os.getpid())],
+                                   cwd=os.path.dirname(script))
+        return _worker
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued scan jobs (see /api/refresh).")
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL)
+    parser.add_argument("--parent-pid", type=int, help="Exit when this process exits (set by ensure_worker)")
+    args = parser.parse_args()
+
+    # Same log file as the web UI's log console
+    logging.basicConfig(level=logging.INFO)
+    file_handler = logging.FileHandler("scraper.log", mode='a')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logging.getLogger().addHandler(file_handler)
+    # And the web UI's log console
+    logging.getLogger().addHandler(events.EventLogHandler())
+
+    work(args.poll_interval, once=args.once, parent_pid=args.parent_pid)
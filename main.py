@@ -1,35 +1,61 @@
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import SessionLocal, Paper, init_db
-from scanner import Scanner
+from starlette.concurrency import run_in_threadpool
+from database import SessionLocal, Paper, ScanJob, init_db
+from database.aio import AsyncSessionLocal, get_async_db
+from database.authors import author_paper_count, complete_authors, find_author, papers_by_author
+from database.search import filter_papers
+from database.pagination import InvalidCursor, paginate
+from database.stats import conference_names, count_papers
+from database.suggest import suggest, warm_up
+from database.embeddings import get_index, semantic_ids
+import events
+import jobs
+from response_cache import make_cache
+from scrapers.registry import load_conferences
 from starlette.requests import Request
 from typing import Optional, List
 from fastapi import Query
+import asyncio
+import csv
+import os
+import io
 import json
 
+# Columns /api/papers can return (?fields=title,year); id is always included
+PAPER_FIELDS = ("id", "title", "authors", "conference", "year", "url", "pdf_url", "tags", "source_url", "fetched_at",
+                "duplicate_of")
+DEFAULT_API_FIELDS = ("id", "title", "authors", "conference", "year", "url", "pdf_url", "tags")
+# Rows fetched per round trip while streaming an export
+EXPORT_BATCH_SIZE = 1000
+# Event stream: seconds between checks of the events table, seconds between keep-alives, max events per response
+EVENT_POLL_INTERVAL = 0.25
+EVENT_KEEPALIVE = 15.0
+EVENT_BATCH_MAX = 1000
+
 app = FastAPI(title="Paper Aggregator")
 
+# Rendered listing pages and API responses (RESPONSE_CACHE=memory|sqlite|off, see response_cache.py)
+page_cache = make_cache()
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
-# Dependency
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Startup
 @app.on_event("startup")
 def on_startup():
     init_db()
     # Configure logging to write to file
     import logging
+    # Console output as well; nothing the app imports configures it
+    logging.basicConfig(level=logging.INFO)
     file_handler = logging.FileHandler("scraper.log", mode='w')
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
@@ -43,112 +69,428 @@ def on_startup():
     logging.getLogger("scanner").addHandler(file_handler)
     logging.getLogger("scrapers").addHandler(file_handler)
     logging.getLogger("uvicorn").addHandler(file_handler) # Optional: capture server logs too
+    # Feed the UI's log console (/api/events/stream)
+    root_logger.addHandler(events.EventLogHandler())
+
+    # Scans run in a separate worker process (jobs.py) so they never block requests.
+    # Set SCAN_WORKER=external when a worker is started some other way.
+    if os.getenv("SCAN_WORKER", "auto") != "external":
+        jobs.ensure_worker()
+    # Search box suggestions (/api/suggest) are served from memory; load them now
+    warm_up(SessionLocal)
 
 @app.get("/api/logs")
-async def get_logs():
-    """Returns the last 100 lines of the scraper log."""
-    try:
-        with open("scraper.log", "r") as f:
-            lines = f.readlines()
-            return {"logs": lines[-100:]} # Return last 100 lines
-    except FileNotFoundError:
-        return {"logs": ["Log file not found."]}
+async def get_logs(db: AsyncSession = Depends(get_async_db)):
+    """Returns the last 100 log lines (scanner, worker and server)."""
+    logs = await db.run_sync(events.latest, "log", 100)
+    return {"logs": [_log_line(e) for e in logs]}
+
+def _log_line(event: dict) -> str:
+    return f"{event.get('level', 'INFO')} - {event.get('logger', '')} - {event.get('message', '')}\n"
+
+def _events_page(session: Session, after: int, limit: int) -> dict:
+    if after > events.last_id(session):
+        after = 0 # Id from before the database was reset
+    batch = events.since(session, after, limit=limit)
+    return {
+        "events": batch,
+        "last_id": batch[-1]["id"] if batch else after,
+        "missed": after + 1 < events.first_id(session),
+    }
+
+@app.get("/api/events")
+async def get_events(after: int = Query(0, ge=0), limit: int = Query(1000, ge=1, le=EVENT_BATCH_MAX),
+                     db: AsyncSession = Depends(get_async_db)):
+    """
+    Progress and log events newer than id after, oldest first.
+    Pass the returned last_id back as after to get only what happened since.
+    missed is true when events after `after` were already deleted.
+    """
+    return await db.run_sync(_events_page, after, limit)
+
+@app.get("/api/events/stream")
+async def stream_events(request: Request, after: int = Query(0, ge=0)):
+    """
+    Server-Sent Events stream of progress and log events.
+    Resumes after the Last-Event-ID header an EventSource sends on reconnect, or after.
+    """
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        after = int(last_event_id)
+
+    async def event_stream():
+        offset = after
+        idle = 0.0
+        # Tells EventSource to reconnect after 2s if the connection drops
+        yield "retry: 2000\n\n"
+        while not await request.is_disconnected():
+            # A session per poll: the stream can stay open for hours
+            async with AsyncSessionLocal() as db:
+                batch = await db.run_sync(events.since, offset, EVENT_BATCH_MAX)
+            if batch:
+                idle = 0.0
+                offset = batch[-1]["id"]
+                yield "".join(f"id: {e['id']}\ndata: {json.dumps(e, default=str)}\n\n" for e in batch)
+                continue
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+            idle += EVENT_POLL_INTERVAL
+            if idle >= EVENT_KEEPALIVE:
+                # Comment line; keeps proxies from closing an idle connection
+                idle = 0.0
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+def _parse_year(value: Optional[str]) -> Optional[int]:
+    # Form submissions send empty strings for blank fields
+    if value and value.strip():
+        try:
+            return int(value)
+        except ValueError:
+            pass # Ignore invalid int
+    return None
+
+async def _semantic_mode(q: Optional[str], mode: str):
+    """
+    (mode, ranked ids) for filter_papers. The embedding search is numpy work,
+    so it runs here in the threadpool rather than inside AsyncSession.run_sync
+    on the event loop; without vectors yet, search by keyword instead.
+    """
+    if mode != "semantic" or not (q and q.strip()):
+        return mode, None
+    ranked_ids = await run_in_threadpool(semantic_ids, q)
+    return ("keyword", None) if ranked_ids is None else (mode, ranked_ids)
+
+def _listing(db: Session, q, year_from, year_to, conferences, mode, ranked_ids, page, limit, cursor) -> dict:
+    """Data for one listing page (runs inside AsyncSession.run_sync)."""
+    # Text Search (full-text index, ranked); otherwise newest first, paged by key
+    ranked = bool(q and q.strip())
+    query = filter_papers(db.query(Paper), q, year_from, year_to, conferences, mode, ranked_ids)
+    
+    # Get total filtered count. Year/conference filters alone are answered from the
+    # per-conference-year counts materialized at scan time; text search has to count.
+    if ranked:
+        # Ordering is irrelevant to the count and costly for ranked search
+        total_count = query.order_by(None).count()
+    else:
+        total_count = count_papers(db, year_from, year_to, conferences)
+    
+    # Pagination: Previous/Next follow cursors, "Go to page" jumps by page number
+    return {
+        "result": paginate(query, limit, cursor=cursor, page=page, keyset=not ranked),
+        "total_count": total_count,
+        "total_pages": (total_count + limit - 1) // limit,
+        # Available conferences for the filter UI (cached, see database/stats.py)
+        "all_confs": sorted(conference_names(db)),
+    }
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(
     request: Request, 
-    db: Session = Depends(get_db), 
+    db: AsyncSession = Depends(get_async_db), 
     q: Optional[str] = None,
     min_year: Optional[str] = None, # changed to str to handle empty string form submission
     max_year: Optional[str] = None,
     conferences: Optional[List[str]] = Query(None),
     page: int = Query(1, ge=1),
-    limit: int = Query(10, ge=1, le=500)
+    limit: int = Query(10, ge=1, le=500),
+    cursor: Optional[str] = None,
+    mode: str = Query("keyword", pattern="^(keyword|semantic)$")
 ):
-    query = db.query(Paper).order_by(Paper.id.desc())
-    
-    # Text Search
-    if q:
-        search = f"%{q}%"
-        query = query.filter(
-            (Paper.title.ilike(search)) | 
-            (Paper.authors.ilike(search)) | 
-            (Paper.conference.ilike(search))
-        )
-    
-    # Year Filter
-    if min_year and min_year.strip():
-        try:
-            query = query.filter(Paper.year >= int(min_year))
-        except ValueError:
-            pass # Ignore invalid int
-            
-    if max_year and max_year.strip():
-        try:
-            query = query.filter(Paper.year <= int(max_year))
-        except ValueError:
-            pass # Ignore invalid int
-        
-    # Conference Filter
-    if conferences:
-        # conferences comes as a list e.g. ["CVPR 2025", "NDSS 2025"]
-        query = query.filter(Paper.conference.in_(conferences))
-    
-    # Get total filtered count
-    total_count = query.count()
-    
-    # Pagination
-    total_pages = (total_count + limit - 1) // limit
-    offset = (page - 1) * limit
-    
-    # Apply limit for display
-    papers = query.offset(offset).limit(limit).all()
+    # Key taken before reading any data, so a scan committing meanwhile cannot
+    # leave its results cached under the new generation
+    cache_key = page_cache.key(request.url.path, request.query_params)
+    cached = await page_cache.aget(cache_key)
+    if cached is not None:
+        return HTMLResponse(cached, headers={"X-Cache": "hit"})
+
+    year_from = _parse_year(min_year)
+    year_to = _parse_year(max_year)
     
-    # Get available conferences and years for the filter UI
-    # We can cache this or query distinct values
-    all_confs = db.query(Paper.conference).distinct().all()
-    all_confs = [c[0] for c in all_confs if c[0]]
+    # The queries run over the async engine; the event loop serves other requests meanwhile
+    search_mode, ranked_ids = await _semantic_mode(q, mode)
+    try:
+        listing = await db.run_sync(_listing, q, year_from, year_to, conferences, search_mode, ranked_ids,
+                                    page, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    result = listing["result"]
     
-    # Load all configured conferences from conferences.json for the update modal
+    # Configured conferences for the update modal (parsed again only when the file changes)
     configured_confs = []
     try:
-        with open("config/conferences.json", "r") as f:
-            conf_config = json.load(f)
-            configured_confs = sorted(conf_config.keys())
+        configured_confs = sorted(load_conferences().keys())
     except Exception:
         pass  # If loading fails, just use empty list
     
-    return templates.TemplateResponse("index.html", {
-        "request": request, 
-        "papers": papers, 
-        "total_count": total_count,
-        "page": page,
+    # Rendering a long page takes a while too; keep it off the event loop
+    response = await run_in_threadpool(templates.TemplateResponse, request, "index.html", {
+        "papers": result.items, 
+        "total_count": listing["total_count"],
+        "page": result.page,
         "limit": limit,
-        "total_pages": total_pages,
+        "total_pages": listing["total_pages"],
+        "next_cursor": result.next_cursor,
+        "prev_cursor": result.prev_cursor,
         "query": q,
-        "all_confs": sorted(all_confs),
+        "mode": mode,
+        "all_confs": listing["all_confs"],
         "configured_confs": configured_confs,
         "selected_confs": conferences or [],
         "min_year": min_year,
         "max_year": max_year
     })
+    await page_cache.aset(cache_key, response.body)
+    response.headers["X-Cache"] = "miss"
+    return response
 
 @app.post("/api/refresh")
-async def refresh_data(background_tasks: BackgroundTasks, conf: Optional[str] = Query(None)):
+async def refresh_data(conf: Optional[str] = Query(None), enrich: bool = False, full: bool = False,
+                       db: AsyncSession = Depends(get_async_db)):
     """
-    Trigger a scraper update.
+    Queue a scraper update; the scan worker (jobs.py) picks it up.
     conf: Optional comma-separated list of conferences to update (e.g. "CVPR,ICCV").
           If None, updates all.
+    enrich: afterwards fetch detail pages for missing authors / abstracts (enricher.py).
+    full: rescan every conference-year, even ones unchanged since the last scan.
+    A queued or running job that already covers the request is returned instead of a new one.
     """
-    scanner = Scanner()
     target_confs = None
     if conf:
-        target_confs = [c.strip() for c in conf.split(",") if c.strip()]
-        
-    background_tasks.add_task(scanner.run, target_confs=target_confs)
-    msg = f"Update started for {target_confs}" if target_confs else "Update started for all conferences"
-    return {"message": msg}
+        target_confs = [c.strip() for c in conf.split(",") if c.strip()] or None
+
+    job, created = await db.run_sync(jobs.enqueue, target_confs, full=full, enrich=enrich)
+    if created:
+        events.publish("job", job_id=job.id, status=job.status, conferences=target_confs)
+    if os.getenv("SCAN_WORKER", "auto") != "external":
+        # Restarts the worker if it died since startup
+        jobs.ensure_worker()
+    scope = f"for {target_confs}" if target_confs else "for all conferences"
+    if created:
+        msg = f"Update queued {scope} (job {job.id})"
+    else:
+        msg = f"An update covering this is already {job.status} (job {job.id})"
+    return {"message": msg, "job_id": job.id, "created": created}
+
+@app.get("/api/jobs")
+async def list_jobs(limit: int = Query(20, ge=1, le=200), db: AsyncSession = Depends(get_async_db)):
+    """Most recent scan jobs, newest first."""
+    return {"jobs": await db.run_sync(_recent_jobs, limit)}
+
+def _recent_jobs(db: Session, limit: int) -> List[dict]:
+    recent = db.query(ScanJob.id).order_by(ScanJob.id.desc()).limit(limit).all()
+    results = []
+    for (job_id,) in recent:
+        progress = jobs.job_progress(db, job_id)
+        progress.pop("items")
+        results.append(progress)
+    return results
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Status of one scan job with per conference-year progress."""
+    progress = await db.run_sync(jobs.job_progress, job_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return progress
 
 @app.get("/api/papers")
-def get_papers_api(db: Session = Depends(get_db)):
-    return db.query(Paper).limit(500).all()
+async def get_papers_api(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    q: Optional[str] = None,
+    min_year: Optional[int] = None,
+    max_year: Optional[int] = None,
+    conferences: Optional[List[str]] = Query(None),
+    fields: Optional[str] = None,
+    format: str = Query("json", pattern="^(json|ndjson|csv)$"),
+    mode: str = Query("keyword", pattern="^(keyword|semantic)$"),
+    cursor: Optional[str] = None,
+    page: Optional[int] = Query(None, ge=1),
+    limit: int = Query(100, ge=1, le=500)
+):
+    """
+    Papers newest first (best match first with q), filtered like the listing page.
+    fields: comma-separated columns to return (default: DEFAULT_API_FIELDS).
+    mode: "semantic" ranks by embedding similarity to q instead of keyword match.
+
+    format=json pages: follow next_cursor / prev_cursor, or pass page=N.
+    format=ndjson / csv stream every matching paper (cursor, page and limit are ignored).
+    """
+    columns = _api_columns(fields)
+    if format != "json":
+        media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+        return StreamingResponse(
+            _export(columns, format, q, min_year, max_year, conferences, mode),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="papers.{format}"'},
+        )
+    
+    cache_key = page_cache.key(request.url.path, request.query_params)
+    cached = await page_cache.aget(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json", headers={"X-Cache": "hit"})
+
+    ranked = bool(q and q.strip())
+    search_mode, ranked_ids = await _semantic_mode(q, mode)
+
+    def fetch_page(session: Session):
+        query = filter_papers(session.query(*columns), q, min_year, max_year, conferences, search_mode, ranked_ids)
+        return paginate(query, limit, cursor=cursor, page=page or 1, keyset=not ranked)
+
+    try:
+        result = await db.run_sync(fetch_page)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response = JSONResponse(jsonable_encoder({
+        "papers": [row._asdict() for row in result.items],
+        "page": result.page,
+        "next_cursor": result.next_cursor,
+        "prev_cursor": result.prev_cursor,
+    }), headers={"X-Cache": "miss"})
+    await page_cache.aset(cache_key, response.body)
+    return response
+
+def _api_columns(fields: Optional[str]):
+    names = [f.strip() for f in fields.split(",") if f.strip()] if fields else list(DEFAULT_API_FIELDS)
+    unknown = [name for name in names if name not in PAPER_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # Cursors are keyed on id
+    if "id" not in names:
+        names.insert(0, "id")
+    return [getattr(Paper, name) for name in dict.fromkeys(names)]
+
+# Most endpoints query through the request's AsyncSession (db.run_sync for the
+# shared sync helpers). The ones below use a sync Session in the threadpool
+# instead, because run_sync runs its function on the event loop and their work
+# is mostly Python, not database I/O: exports serialize rows for as long as the
+# client reads (after the request's AsyncSession is closed), and the author and
+# suggestion indexes are built in memory, within the request when the data
+# changed. On the event loop that would hold up every other request.
+def _sync_call(fn, *args):
+    """fn(session, *args) with a sync Session; call it through run_in_threadpool."""
+    with SessionLocal() as db:
+        return fn(db, *args)
+
+def _export(columns, format: str, q, min_year, max_year, conferences, mode="keyword"):
+    """
+    Stream every matching row as NDJSON or CSV.
+
+    Rows are column tuples read EXPORT_BATCH_SIZE at a time with yield_per
+    (a server-side cursor on PostgreSQL), and output is flushed once per batch,
+    so memory stays constant however large the table is.
+    """
+    # Runs in the threadpool with its own sync Session (see _sync_call)
+    with SessionLocal() as db:
+        query = filter_papers(db.query(*columns), q, min_year, max_year, conferences, mode)
+        if not (q and q.strip()):
+            query = query.order_by(Paper.id.desc())
+        
+        names = [column.key for column in columns]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if format == "csv" else None
+        if writer:
+            writer.writerow(names)
+        
+        for i, row in enumerate(query.yield_per(EXPORT_BATCH_SIZE), 1):
+            if writer:
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(dict(zip(names, row)), default=str))
+                buffer.write("\n")
+            if i % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+@app.get("/api/similar")
+async def similar_papers(
+    db: AsyncSession = Depends(get_async_db),
+    id: Optional[int] = None,
+    q: Optional[str] = None,
+    k: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = None
+):
+    """
+    Papers closest to paper `id` (or to free text `q`) by title/abstract embedding,
+    most similar first, each with its cosine similarity as "score".
+    """
+    if (id is None) == (not q):
+        raise HTTPException(status_code=400, detail="Pass exactly one of id or q")
+    index = get_index()
+    # Vector search is numpy work; run it off the event loop
+    if id is not None:
+        hits = await run_in_threadpool(index.similar, id, k)
+        if hits is None:
+            raise HTTPException(status_code=404, detail=f"Paper {id} is not in the vector index")
+    else:
+        hits = await run_in_threadpool(index.search_text, q, k)
+    
+    columns = _api_columns(fields)
+    found = await db.execute(select(*columns).where(Paper.id.in_([i for i, _ in hits])))
+    rows = {row.id: row._asdict() for row in found}
+    return {"papers": [dict(rows[i], score=round(score, 4)) for i, score in hits if i in rows]}
+
+@app.get("/api/authors")
+async def suggest_authors(prefix: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50)):
+    """
+    Author autocomplete: names with a part starting with prefix (accents and
+    case ignored), most papers first, each with its paper count.
+    """
+    # Served from memory; the session only connects when the index has to be (re)loaded
+    return {"authors": await run_in_threadpool(_sync_call, complete_authors, prefix, limit)}
+
+@app.get("/api/authors/{name}")
+async def get_author_papers(
+    request: Request,
+    name: str,
+    db: AsyncSession = Depends(get_async_db),
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page: Optional[int] = Query(None, ge=1),
+    limit: int = Query(100, ge=1, le=500)
+):
+    """
+    Papers listing name as an author (accents, case and punctuation ignored),
+    newest first, paged like /api/papers.
+    """
+    columns = _api_columns(fields)
+    cache_key = page_cache.key(request.url.path, request.query_params)
+    cached = await page_cache.aget(cache_key)
+    if cached is not None:
+        return Response(cached, media_type="application/json", headers={"X-Cache": "hit"})
+
+    def fetch_page(session: Session):
+        author = find_author(session, name)
+        if author is None:
+            return None
+        result = paginate(papers_by_author(session.query(*columns), author.id), limit, cursor=cursor, page=page or 1)
+        return author.name, author_paper_count(session, author.id), result
+
+    try:
+        found = await db.run_sync(fetch_page)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if found is None:
+        raise HTTPException(status_code=404, detail=f"No papers by {name!r}")
+    author_name, paper_count, result = found
+    response = JSONResponse(jsonable_encoder({
+        "author": {"name": author_name, "papers": paper_count},
+        "papers": [row._asdict() for row in result.items],
+        "page": result.page,
+        "next_cursor": result.next_cursor,
+        "prev_cursor": result.prev_cursor,
+    }), headers={"X-Cache": "miss"})
+    await page_cache.aset(cache_key, response.body)
+    return response
+
+@app.get("/api/suggest")
+async def suggest_search(q: str = Query(..., min_length=1), limit: int = Query(8, ge=1, le=20)):
+    """
+    Search-as-you-type: completions of the word being typed, as spelled in
+    titles (most frequent first), and titles starting with q (newest first).
+    """
+    return await run_in_threadpool(_sync_call, suggest, q, limit)
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from database import DATA_DIR, generation
+
+# RESPONSE_CACHE: "memory" (per process, default), "sqlite" (shared by every
+# uvicorn worker on the machine) or "off"
+DEFAULT_BACKEND = os.getenv("RESPONSE_CACHE", "memory")
+# Seconds a cached response is served; data changes invalidate it sooner
+DEFAULT_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+DEFAULT_SQLITE_PATH = os.getenv("RESPONSE_CACHE_PATH", os.path.join(DATA_DIR, "responses.db"))
+MAX_ENTRIES = 512
+MAX_BYTES = 64 * 2**20
+# The SQLite backend deletes expired rows every this many writes
+PURGE_EVERY = 200
+
+
+class LRUBackend:
+    """In-process cache, least recently used entries evicted past max_entries / max_bytes."""
+    # Dict lookups: cheaper to run on the event loop than to hand to a thread
+    blocking = False
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # key -> (expires_at, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, value)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+
+class SQLiteBackend:
+    """
+    Cache in a local SQLite file, so every uvicorn worker on the machine shares
+    hits. WAL mode lets workers read while another one writes.
+    """
+    # File I/O and lock waits (up to the 5 s timeout): kept off the event loop
+    blocking = True
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH, max_entries: int = MAX_ENTRIES * 4):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local() # sqlite3 connections stay on their thread
+        self._writes = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, value BLOB)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at >= ?", (key, time.time())).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float):
+        try:
+            conn = self._connection()
+            conn.execute("INSERT OR REPLACE INTO responses (key, expires_at, value) VALUES (?, ?, ?)",
+                         (key, time.time() + ttl, value))
+            self._writes += 1
+            if self._writes % PURGE_EVERY == 0:
+                conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+                # Beyond max_entries drop the ones expiring first
+                conn.execute("DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                             "ORDER BY expires_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+        except sqlite3.Error:
+            pass # A busy cache is skipped, never an error for the request
+
+    def clear(self):
+        self._connection().execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """
+    Rendered responses keyed by endpoint + normalized query parameters + the
+    current data generation. A scan or enrichment run bumps the generation
+    (database/generation.py), so entries from before it are simply never
+    looked up again and age out; ttl bounds how long any entry is served.
+    """
+    def __init__(self, backend=None, ttl: float = DEFAULT_TTL):
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def key(path: str, params) -> str:
+        """
+        Cache key for a request. params: Starlette QueryParams (or a list of
+        (name, value) pairs). Blank values are dropped (empty form fields mean
+        "no filter") and repeated parameters such as conferences are sorted, so
+        equivalent URLs share an entry.
+        """
+        items = params.multi_items() if hasattr(params, "multi_items") else list(params)
+        normalized = {}
+        for name, value in items:
+            value = str(value)
+            if value.strip():
+                normalized.setdefault(name, set()).add(value)
+        canonical = json.dumps([path, sorted((k, sorted(v)) for k, v in normalized.items()),
+                                generation.current()])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.backend.get(key) if self.backend else None
+
+    def set(self, key: str, value: bytes):
+        if self.backend:
+            self.backend.set(key, value, self.ttl)
+
+    # For async endpoints: blocking backends run in the threadpool
+    async def aget(self, key: str) -> Optional[bytes]:
+        if self.backend and self.backend.blocking:
+            return await run_in_threadpool(self.backend.get, key)
+        return self.get(key)
+
+    async def aset(self, key: str, value: bytes):
+        if self.backend and self.backend.blocking:
+            await run_in_threadpool(self.backend.set, key, value, self.ttl)
+        else:
+            self.set(key, value)
+
+
+def make_cache(backend: str = DEFAULT_BACKEND, ttl: float = DEFAULT_TTL) -> ResponseCache:
+    if backend == "off" or ttl <= 0:
+        return ResponseCache(None, ttl)
+    if backend == "sqlite":
+        return ResponseCache(SQLiteBackend(), ttl)
+    return ResponseCache(LRUBackend(), ttl)
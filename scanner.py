@@ -1,69 +1,116 @@
-import json
+import argparse
 import logging
-import os
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from sqlalchemy.orm import Session
-from database import SessionLocal, Paper, init_db
-from scrapers.base import EventScraper, PaperData
-from scrapers.cvpr import CVPRScraper
-from scrapers.iccv import ICCVScraper
-from scrapers.eccv import ECCVScraper
-from scrapers.ndss import NDSSScraper
-from scrapers.neurips import NeurIPSScraper
-from scrapers.icml import ICMLScraper
-from scrapers.iclr import ICLRScraper
-from scrapers.usenix_security import USENIXScraper
-from scrapers.ieee_sp import IEEESPScraper
-from scrapers.acm_ccs import ACMCCSScraper
-from sqlalchemy import exists
+from database import SessionLocal, Paper, ScanState, init_db
+from database import generation
+from database.normalize import index_authors, index_new_titles, title_key
+from database.stats import add_papers, invalidate_stats
+from database.embeddings import sync_embeddings
+import events
+from scrapers.base import EventScraper
+from scrapers.cache import HTTPCache, DEFAULT_CACHE_DIR
+from scrapers.http import format_stats, get_client
+from scrapers.registry import DEFAULT_CONFIG_PATH, load_conferences, scraper_class, scraper_keys
+from scrapers.throttle import HostThrottle, parse_host_limits
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent requests allowed per host. Hosts not listed get DEFAULT_HOST_LIMIT.
+DEFAULT_HOST_LIMITS = {
+    "dblp.org": 2,
+    "thecvf.com": 2,
+    "icml.cc": 2,
+    "iclr.cc": 2,
+    "nips.cc": 2,
+    "neurips.cc": 2,
+    "ecva.net": 1,
+}
+DEFAULT_HOST_LIMIT = 1
+DEFAULT_HOST_DELAY = 1.0  # seconds between two requests to the same host
+DEFAULT_MAX_WORKERS = 6
+# A past year's page that has not changed for this long is treated as final and
+# no longer fetched (see _is_frozen). --full overrides.
+FROZEN_AFTER_DAYS = 14
+# Rows per multi-row INSERT. 500 rows x 8 columns stays under SQLite's bound-parameter limit.
+INSERT_BATCH_SIZE = 500
+# Papers handed from a scraping thread to the writer and committed at a time
+SCAN_BATCH_SIZE = 500
+# Batches waiting to be written before scraping threads pause; bounds memory
+MAX_QUEUED_BATCHES = 16
+
+class _Cancelled(Exception):
+    """Raised in a scraping thread when the scan stopped consuming its batches."""
+
 class Scanner:
-    def __init__(self, config_path="config/conferences.json"):
+    def __init__(self, config_path=DEFAULT_CONFIG_PATH, max_workers=DEFAULT_MAX_WORKERS,
+                 host_limits=None, host_delay=DEFAULT_HOST_DELAY, use_cache=True, cache_dir=DEFAULT_CACHE_DIR,
+                 full=False):
+        """
+        max_workers: global cap on conference-years fetched and parsed at once (1 = sequential).
+        host_limits: overrides merged into DEFAULT_HOST_LIMITS, e.g. {"dblp.org": 3}.
+        host_delay: minimum seconds between requests to the same host.
+        use_cache: send conditional requests and skip pages that are unchanged since
+                   they were last ingested. False always downloads and parses.
+        full: ignore scan_state and the HTTP cache: fetch and parse every configured
+              conference-year, including past years considered final.
+        """
         self.config_path = config_path
         self.scrapers = {}
         self.config = {}
+        self.max_workers = max(1, int(max_workers))
+        limits = dict(DEFAULT_HOST_LIMITS)
+        limits.update(host_limits or {})
+        self.throttle = HostThrottle(limits, default_limit=DEFAULT_HOST_LIMIT, delay=host_delay)
+        self.full = full
+        self.http_cache = HTTPCache(cache_dir) if use_cache and not full else None
         self.load_config()
 
     def load_config(self):
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = load_conferences(self.config_path)
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             self.config = {}
 
     def get_scraper(self, scraper_type, conf_name, year):
-        if scraper_type == "CVPR":
-            return CVPRScraper(conf_name, year)
-        elif scraper_type == "ICCV":
-            return ICCVScraper(conf_name, year)
-        elif scraper_type == "ECCV":
-            return ECCVScraper(conf_name, year)
-        elif scraper_type == "NDSS":
-            return NDSSScraper(conf_name, year)
-        elif scraper_type == "NeurIPS":
-            return NeurIPSScraper(conf_name, year)
-        elif scraper_type == "ICML":
-            return ICMLScraper(conf_name, year)
-        elif scraper_type == "ICLR":
-            return ICLRScraper(conf_name, year)
-        elif scraper_type == "USENIX":
-            return USENIXScraper(conf_name, year)
-        elif scraper_type == "IEEESP":
-            return IEEESPScraper(conf_name, year)
-        elif scraper_type == "ACMCCS":
-            return ACMCCSScraper(conf_name, year)
-        else:
-            return None
+        scraper = self._create_scraper(scraper_type, conf_name, year)
+        if scraper:
+            scraper.throttle = self.throttle
+            scraper.http_cache = self.http_cache
+        return scraper
+
+    def _create_scraper(self, scraper_type, conf_name, year):
+        # Only the module of this scraper type is imported (scrapers/registry.py)
+        cls = scraper_class(scraper_type)
+        return cls(conf_name, year) if cls else None
 
-    def run(self, target_confs=None):
+    def run(self, target_confs=None, progress=None):
         """
         Run configured scrapers and update DB.
         target_confs: Optional list of conference names to scrape (e.g. ['CVPR', 'ICCV']).
                       If None, scrapes all.
+        progress: Optional callback(conf_name, year, status, papers_found=None, papers_added=None),
+                  called on the calling thread with status "pending" for every planned
+                  conference-year, "running" after each stored batch, then "skipped"
+                  (frozen), "unchanged", "done" or "failed".
+                  The same updates are published as "progress" events (events.py).
+
+        Conference-years are fetched and parsed on a thread pool of max_workers,
+        with HostThrottle keeping each host within its own budget. Scrapers stream
+        their papers (EventScraper.iter_years) in batches of SCAN_BATCH_SIZE through
+        a bounded queue; the calling thread writes and commits each batch as it
+        arrives, so papers show up before a page is finished and memory stays flat.
+        All database writes stay on the calling thread.
         """
         init_db()
         session = SessionLocal()
@@ -75,6 +122,63 @@ class Scanner:
         if target_confs:
             logger.info(f"Filtering to only: {target_confs}")
         
+        started = time.monotonic()
+        http_before = get_client().stats.snapshot()
+        states = {} if self.full else {(s.conference, s.year): s for s in session.query(ScanState)}
+        tasks, frozen = self._build_tasks(target_confs, states)
+
+        def report(conf_name, year, status, papers_found=None, papers_added=None):
+            events.publish("progress", conference=conf_name, year=year, status=status,
+                           papers_found=papers_found, papers_added=papers_added)
+            if progress:
+                progress(conf_name, year, status, papers_found=papers_found, papers_added=papers_added)
+
+        events.publish("scan", status="started", conferences=target_confs,
+                       pages=len(tasks), frozen=len(frozen))
+        for conf_name, year in frozen:
+            report(conf_name, year, "skipped")
+        for _, conf_name, years, _ in tasks:
+            for year in years:
+                report(conf_name, year, "pending")
+        
+        batches = queue.Queue(maxsize=MAX_QUEUED_BATCHES)
+        cancelled = threading.Event()
+        try:
+            # max_workers=1 degrades to the old one-at-a-time scan
+            logger.info(f"Scraping {len(tasks)} pages with {self.max_workers} workers")
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scrape") as pool:
+                for index, (scraper, conf_name, years, url) in enumerate(tasks):
+                    pool.submit(self._scrape, index, scraper, years, url, batches, cancelled)
+                try:
+                    self._write_batches(session, tasks, batches, report)
+                finally:
+                    # Lets scraping threads blocked on a full queue give up if writing stopped early
+                    cancelled.set()
+            self._index_titles(session)
+            self._sync_embeddings(session)
+        finally:
+            session.close()
+        
+        elapsed = time.monotonic() - started
+        logger.info(f"Scan finished in {elapsed:.1f}s")
+        logger.info(f"HTTP: {format_stats(get_client().stats.since(http_before))}")
+        events.publish("scan", status="finished", conferences=target_confs, seconds=round(elapsed, 1))
+
+    def _build_tasks(self, target_confs=None, states=None):
+        """
+        Expand the config into (scraper, conf_name, years, url) work items.
+        Returns (tasks, frozen) where frozen lists the (conf_name, year) left out.
+        Years of a conference that share a source URL (e.g. ECCV on ecva.net)
+        become one item so the page is fetched and parsed only once.
+
+        states: {(conf_name, year): ScanState}. Frozen conference-years are left
+        out; for the rest the scraper learns the hash of the page last ingested,
+        so an unchanged page is dropped right after download.
+        """
+        states = states or {}
+        now = datetime.utcnow()
+        frozen = []
+        tasks = []
         for conf_name, conf_data in self.config.items():
             # Filter if target_confs is specified
             if target_confs and conf_name not in target_confs:
@@ -85,66 +189,326 @@ class Scanner:
             scraper_type = conf_data.get("scraper")
             years_data = conf_data.get("years", {})
             
+            years_by_url = {}
             for year_str, url in years_data.items():
-                year = int(year_str)
-                conf_id = f"{conf_name} {year}"
-                
-                logger.info(f"Starting scrape for {conf_id}...")
-                
-                scraper = self.get_scraper(scraper_type, conf_name, year)
+                years_by_url.setdefault(url, []).append(int(year_str))
+            
+            for url, years in years_by_url.items():
+                pending = [y for y in years if not self._is_frozen(states.get((conf_name, y)), url, now)]
+                frozen.extend((conf_name, y) for y in years if y not in pending)
+                if not pending:
+                    continue
+                scraper = self.get_scraper(scraper_type, conf_name, pending[0])
                 if not scraper:
-                    logger.warning(f"No scraper found for type {scraper_type}")
+                    logger.warning(f"No scraper found for type {scraper_type} (known: {', '.join(scraper_keys())})")
                     continue
-                
-                try:
-                    found_papers = scraper.scrape(url)
-                    logger.info(f"Found {len(found_papers)} papers for {conf_id}")
-                    
-                    new_count = 0
-                    for p_data in found_papers:
-                        if self._save_paper(session, p_data, conf_name, year, url):
-                            new_count += 1
-                    
-                    session.commit()
-                    logger.info(f"Added {new_count} new papers for {conf_id}.")
-                    
-                    # Add a small delay between scraping different years to be respectful
-                    import time
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to scrape {conf_id}: {e}")
-                    session.rollback()
-        
-        session.close()
+                # Skip the page only if every year it feeds ingested this exact body
+                hashes = {self._known_hash(states.get((conf_name, y)), url) for y in pending}
+                if len(hashes) == 1 and None not in hashes:
+                    scraper.known_hashes[url] = hashes.pop()
+                tasks.append((scraper, conf_name, pending, url))
+        if frozen:
+            logger.info(f"Skipping {len(frozen)} past conference-years unchanged for {FROZEN_AFTER_DAYS}+ days (use --full to rescan)")
+        return tasks, frozen
 
-    def _save_paper(self, session: Session, p_data: PaperData, conf_name: str, year: int, source_url: str) -> bool:
+    @staticmethod
+    def _known_hash(state, url):
+        if state is None or state.source_url != url or not state.paper_count:
+            return None
+        return state.content_hash
+
+    @staticmethod
+    def _is_frozen(state, url, now):
         """
-        Save paper to DB if not exists. Returns True if new.
+        Past years' proceedings stop changing. Once a past conference-year's page
+        has produced papers and kept the same content for FROZEN_AFTER_DAYS, it is
+        not fetched again (unless its URL in the config changes).
         """
-        # Check duplicates based on Title + Conference Name + Year
-        exists = session.query(Paper).filter(
-            Paper.title == p_data.title,
-            Paper.conference == conf_name,
-            Paper.year == year
-        ).first()
-        
-        if exists:
+        if state is None or state.source_url != url or not state.paper_count or not state.content_hash:
             return False
+        if state.year >= now.year or state.last_changed_at is None:
+            return False
+        return now - state.last_changed_at >= timedelta(days=FROZEN_AFTER_DAYS)
+
+    def _record_scan(self, session: Session, conf_name, years, url, ingested, content_hash=None, paper_count=None):
+        """Update scan_state after fetching a page: ingested=True once its papers are stored, False if it was unchanged."""
+        now = datetime.utcnow()
+        try:
+            for year in years:
+                state = session.get(ScanState, (conf_name, year))
+                if state is None:
+                    if not ingested:
+                        continue
+                    state = ScanState(conference=conf_name, year=year)
+                    session.add(state)
+                state.last_fetched_at = now
+                if ingested:
+                    if content_hash != state.content_hash or url != state.source_url:
+                        state.last_changed_at = now
+                    state.source_url = url
+                    state.content_hash = content_hash
+                    state.paper_count = paper_count
+            session.commit()
+        except Exception as e:
+            logger.error(f"Failed to record scan state for {self._describe(conf_name, years)}: {e}")
+            session.rollback()
+
+    @staticmethod
+    def _index_titles(session: Session):
+        """Link the papers added by this scan to earlier near-duplicates (duplicate_of)."""
+        try:
+            if index_new_titles(session):
+                generation.bump()
+        except Exception as e:
+            logger.error(f"Failed to update the near-duplicate index: {e}")
+            session.rollback()
+
+    @staticmethod
+    def _sync_embeddings(session: Session):
+        """Embed the papers added by this scan for /api/similar and semantic search."""
+        try:
+            sync_embeddings(session)
+            # Semantic search results change with the index
+            generation.bump()
+        except Exception as e:
+            logger.error(f"Failed to update the vector index: {e}")
+
+    @staticmethod
+    def _describe(conf_name, years):
+        return f"{conf_name} {', '.join(str(y) for y in years)}"
+
+    def _write_batches(self, session: Session, tasks, batches: queue.Queue, report):
+        """
+        Store the batches sent by _scrape until every task has finished.
+        A conference-year is recorded in scan_state only once all of its papers
+        are stored; after a failed batch the rest of that conference-year is skipped.
+        """
+        remaining = len(tasks)
+        found = {}     # (task index, year) -> papers received
+        added = {}     # (task index, year) -> new rows stored
+        failed = set() # (task index, year) whose writes failed
+        existing = {}  # (task index, year) -> titles already stored, shared by its batches
+        while remaining:
+            kind, index, year, payload = batches.get()
+            scraper, conf_name, years, url = tasks[index]
+            key = (index, year)
+            if kind == "papers":
+                if key in failed:
+                    continue
+                found[key] = found.get(key, 0) + len(payload)
+                if key not in existing:
+                    existing[key] = self._existing_keys(session, conf_name, year)
+                new_count = self._store(session, payload, conf_name, year, url, existing[key])
+                if new_count is None:
+                    failed.add(key)
+                    report(conf_name, year, "failed", papers_found=found[key], papers_added=added.get(key, 0))
+                    continue
+                added[key] = added.get(key, 0) + new_count
+                report(conf_name, year, "running", papers_found=found[key], papers_added=added[key])
+                continue
+
+            # kind == "done": the scraper finished (payload is its exception, if any)
+            remaining -= 1
+            if payload is not None:
+                logger.error(f"Failed to scrape {self._describe(conf_name, years)}: {payload}")
+                for year in years:
+                    if (index, year) not in failed:
+                        report(conf_name, year, "failed", papers_found=found.get((index, year)),
+                               papers_added=added.get((index, year)))
+                continue
+            if scraper.not_modified:
+                logger.info(f"{self._describe(conf_name, years)} unchanged since last scan, skipping.")
+                self._record_scan(session, conf_name, years, url, ingested=False)
+                for year in years:
+                    report(conf_name, year, "unchanged")
+                continue
+            for year in years:
+                key = (index, year)
+                if key in failed:
+                    continue
+                found_count, new_count = found.get(key, 0), added.get(key, 0)
+                logger.info(f"Found {found_count} papers for {conf_name} {year}, {new_count} new.")
+                report(conf_name, year, "done", papers_found=found_count, papers_added=new_count)
+                if found_count:
+                    # This conference-year is now up to date with the page
+                    if self.http_cache:
+                        self.http_cache.mark_consumed(url, EventScraper.cache_key(conf_name, year))
+                    self._record_scan(session, conf_name, [year], url, ingested=True,
+                                      content_hash=scraper.content_hashes.get(url),
+                                      paper_count=found_count)
+
+    def _scrape(self, index, scraper: EventScraper, years, url: str, batches: queue.Queue,
+                cancelled: threading.Event):
+        """
+        Fetch and parse one page for one or more years on a worker thread,
+        sending ("papers", index, year, [PaperData]) batches and finally
+        ("done", index, None, exception or None) to batches.
+        """
+        if cancelled.is_set():
+            return
+        conf_id = self._describe(scraper.conference_name, years)
+        error = None
+        try:
+            logger.info(f"Starting scrape for {conf_id}...")
+            pending = {}
+            for year, paper in scraper.iter_years(url, years):
+                batch = pending.setdefault(year, [])
+                batch.append(paper)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    self._send(batches, ("papers", index, year, pending.pop(year)), cancelled)
+            for year, batch in pending.items():
+                self._send(batches, ("papers", index, year, batch), cancelled)
+        except _Cancelled:
+            return
+        except Exception as e:
+            error = e
+        try:
+            self._send(batches, ("done", index, None, error), cancelled)
+        except _Cancelled:
+            pass
+
+    @staticmethod
+    def _send(batches: queue.Queue, message, cancelled: threading.Event):
+        # Blocks while the writer is behind; gives up once the scan is cancelled
+        while True:
+            if cancelled.is_set():
+                raise _Cancelled()
+            try:
+                batches.put(message, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _existing_keys(session: Session, conf_name: str, year: int):
+        """Title keys (database/normalize.py) already stored for a conference-year."""
+        keys = {
+            key for (key,) in session.query(Paper.title_key).filter(
+                Paper.conference == conf_name,
+                Paper.year == year,
+                Paper.title_key.isnot(None)
+            )
+        }
+        # Papers stored before title keys existed, until python -m database.normalize has run
+        keys.update(title_key(title) for (title,) in session.query(Paper.title).filter(
+            Paper.conference == conf_name, Paper.year == year, Paper.title_key.is_(None)))
+        return keys
+
+    def _store(self, session: Session, found_papers, conf_name: str, year: int, url: str,
+               existing=None) -> Optional[int]:
+        """
+        Save and commit one batch of a conference-year. Returns the number of new
+        papers, None on failure. existing: title keys already stored for the
+        conference-year; new keys are added to it.
+        """
+        conf_id = f"{conf_name} {year}"
+        try:
+            new_count = self._save_papers(session, found_papers, conf_name, year, url, existing)
+            session.commit()
+            if new_count:
+                # Listing totals and facets come from paper_stats; drop the cached copy,
+                # and let other processes (web server) know their cached pages are stale
+                invalidate_stats()
+                generation.bump()
+            logger.debug(f"Added {new_count} new papers for {conf_id}.")
+            return new_count
+        except Exception as e:
+            logger.error(f"Failed to save {conf_id}: {e}")
+            session.rollback()
+            return None
+
+    def _save_papers(self, session: Session, papers, conf_name: str, year: int, source_url: str,
+                     existing=None) -> int:
+        """
+        Bulk insert papers for one conference-year. Returns the number of new rows.
+
+        Papers are deduplicated on their title key (database/normalize.py), so
+        "Title." and "title" from two sources count once. Existing keys for the
+        conference-year are loaded with a single query (unless passed in as
+        existing) and the remaining papers are written with multi-row INSERTs.
+        On SQLite and PostgreSQL the INSERT also skips rows that hit
+        _title_conf_year_uc, so a concurrent writer cannot make the batch fail.
+        paper_stats and the author lists are updated in the same transaction;
+        near duplicates are linked after the scan (_index_titles).
+        """
+        if existing is None:
+            existing = self._existing_keys(session, conf_name, year)
+        
+        rows = []
+        for p_data in papers:
+            # Check duplicates based on normalized Title + Conference Name + Year (also within this batch)
+            key = title_key(p_data.title)
+            if key in existing:
+                continue
+            existing.add(key)
+            rows.append({
+                "title": p_data.title,
+                "title_key": key,
+                "authors": p_data.authors,
+                "conference": conf_name,
+                "year": year,
+                "url": p_data.url,
+                "pdf_url": p_data.pdf_url,
+                "source_url": source_url,
+                "tags": p_data.tags,
+            })
+        
+        if not rows:
+            return 0
         
-        new_paper = Paper(
-            title=p_data.title,
-            authors=p_data.authors,
-            conference=conf_name,
-            year=year,
-            url=p_data.url,
-            pdf_url=p_data.pdf_url,
-            source_url=source_url,
-            tags=p_data.tags
-        )
-        session.add(new_paper)
-        return True
+        stmt = self._insert_ignore(session)
+        if session.get_bind().dialect.insert_executemany_returning:
+            # executemany + RETURNING is sent as batched multi-row INSERTs; only
+            # rows actually inserted (not skipped by ON CONFLICT) come back
+            inserted = session.execute(
+                stmt.returning(Paper.id, Paper.title_key, Paper.authors), rows,
+                execution_options={"insertmanyvalues_page_size": INSERT_BATCH_SIZE}
+            ).all()
+        else:
+            session.execute(stmt, rows)
+            inserted = session.query(Paper.id, Paper.title_key, Paper.authors).filter(
+                Paper.conference == conf_name, Paper.year == year,
+                Paper.title_key.in_([row["title_key"] for row in rows])
+            ).all()
+        new_count = len(inserted)
+        
+        index_authors(session, [(paper_id, authors) for paper_id, _, authors in inserted], replace=False)
+        add_papers(session, conf_name, year, new_count)
+        return new_count
+
+    @staticmethod
+    def _insert_ignore(session: Session):
+        """INSERT for papers that skips duplicates on backends that support it."""
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(Paper).on_conflict_do_nothing(constraint="_title_conf_year_uc")
+        if dialect == "sqlite":
+            # Equivalent to INSERT OR IGNORE, restricted to the uniqueness constraint
+            return sqlite.insert(Paper).on_conflict_do_nothing(index_elements=["title", "conference", "year"])
+        return insert(Paper)
 
 if __name__ == "__main__":
-    scanner = Scanner()
-    scanner.run()
+    parser = argparse.ArgumentParser(description="Scrape configured conferences into the database.")
+    parser.add_argument("conferences", nargs="*", help="Conference names to scan (default: all)")
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH)
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Conference-years fetched in parallel (1 = sequential)")
+    parser.add_argument("--host-limit", action="append", metavar="HOST=N",
+                        help="Concurrent requests allowed for a host, e.g. dblp.org=3")
+    parser.add_argument("--host-delay", type=float, default=DEFAULT_HOST_DELAY,
+                        help="Seconds between requests to the same host")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the HTTP cache: download and parse every page")
+    parser.add_argument("--full", action="store_true",
+                        help="Rescan everything, including past years and pages unchanged since the last scan")
+    parser.add_argument("--enrich", action="store_true",
+                        help="Afterwards, fetch detail pages for missing authors/abstracts (see enricher.py)")
+    args = parser.parse_args()
+
+    scanner = Scanner(args.config, max_workers=args.workers,
+                      host_limits=parse_host_limits(args.host_limit), host_delay=args.host_delay,
+                      use_cache=not args.no_cache, full=args.full)
+    scanner.run(target_confs=args.conferences or None)
+    if args.enrich:
+        from enricher import Enricher
+        Enricher().run(target_confs=args.conferences or None)
@@ -1,57 +1,178 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from abc import ABC
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+import hashlib
+import os
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from .cache import HTTPCache
+from .http import HTTPClient, get_client
+from .throttle import HostThrottle
 
 @dataclass
 class PaperData:
     title: str
     authors: str
     url: str
-    url: str
     pdf_url: Optional[str] = None
     tags: Optional[str] = None # Comma-separated tags
 
+def _default_parser() -> str:
+    # lxml builds the tree several times faster than the pure-Python html.parser
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+# BeautifulSoup tree builder used by all scrapers; override with SCRAPER_HTML_PARSER
+HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER") or _default_parser()
+
+# Partial-parse targets shared by several scrapers
+DBLP_ENTRIES = SoupStrainer('li', class_='entry inproceedings')
+CVF_PAPER_LIST = SoupStrainer(['dt', 'dd'])
+
 class EventScraper(ABC):
+    # BeautifulSoup tree builder ("lxml" or "html.parser")
+    parser: str = HTML_PARSER
+    # Shared per-host limiter, assigned by the Scanner when scraping concurrently
+    throttle: Optional[HostThrottle] = None
+    # On-disk conditional-request cache, assigned by the Scanner unless disabled
+    http_cache: Optional[HTTPCache] = None
+    # Pooled HTTP client; None uses the process-wide one (scrapers.http.get_client)
+    http: Optional[HTTPClient] = None
+
     def __init__(self, conference_name: str, year: int):
         self.conference_name = conference_name
         self.year = year
+        # Set by fetch when the page is unchanged since it was last ingested: the
+        # server answered 304 and every conference-year in cache_consumers already
+        # ingested the cached version, or the body matches known_hashes.
+        # scrape() then returns nothing.
+        self.not_modified = False
+        self.cache_consumers = [self.cache_key(conference_name, year)]
+        # Pages already parsed during this run, keyed by URL (see iter_years)
+        self.documents = {}
+        # sha256 of each page body fetched, and of the bodies already ingested
+        # (set by the Scanner from scan_state); a match also sets not_modified
+        self.content_hashes = {}
+        self.known_hashes = {}
+
+    @staticmethod
+    def cache_key(conference_name: str, year: int) -> str:
+        return f"{conference_name}:{year}"
+
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
+        """
+        Yield the page's papers one by one as they are extracted, so callers can
+        store them in batches instead of waiting for the whole list.
+        Scrapers implement this; ones that only override scrape() still work.
+        """
+        if type(self).scrape is EventScraper.scrape:
+            raise NotImplementedError(f"{type(self).__name__} implements neither iter_papers nor scrape")
+        yield from self.scrape(url)
 
-    @abstractmethod
     def scrape(self, url: str) -> List[PaperData]:
-        pass
+        """All papers on the page as a list (compatibility wrapper around iter_papers)."""
+        return list(self.iter_papers(url))
+
+    def iter_years(self, url: str, years: List[int]) -> Iterator[Tuple[int, PaperData]]:
+        """
+        Stream (year, paper) for several years of this conference that share one
+        source page. The page is fetched and parsed once and handed to a scraper
+        per year. Scrapers whose page holds every year (ECCV) can override this
+        to extract all years in a single pass.
+        """
+        if years == [self.year]:
+            for paper in self.iter_papers(url):
+                yield self.year, paper
+            return
+        
+        self.cache_consumers = [self.cache_key(self.conference_name, y) for y in years]
+        soup = self.get_soup(url)
+        if soup is None:
+            return
+        
+        for year in years:
+            scraper = self if year == self.year else type(self)(self.conference_name, year)
+            scraper.documents = {url: soup}
+            for paper in scraper.iter_papers(url):
+                yield year, paper
+
+    def scrape_years(self, url: str, years: List[int]) -> Dict[int, List[PaperData]]:
+        """iter_years collected into {year: [papers]} (every requested year present)."""
+        results = {year: [] for year in years}
+        for year, paper in self.iter_years(url, years):
+            results[year].append(paper)
+        return results
+
+    def parse_only(self, url: str) -> Optional[SoupStrainer]:
+        """
+        Elements of the page this scraper reads, so the parser only builds those
+        subtrees (e.g. the dblp scrapers only need li.entry.inproceedings).
+        None parses the whole document.
+        """
+        return None
+
+    def make_soup(self, content, url: str) -> BeautifulSoup:
+        return BeautifulSoup(content, self.parser, parse_only=self.parse_only(url))
 
     def get_soup(self, url: str):
+        if url in self.documents:
+            return self.documents[url]
+        
+        content = self.fetch(url)
+        if content is None:
+            return None
+        return self.make_soup(content, url)
+
+    def fetch(self, url: str, conditional: bool = True) -> Optional[bytes]:
+        """
+        Download a page body with retries, host throttling and the HTTP cache.
+        Returns None on failure, or when the page is unchanged and already
+        ingested (self.not_modified is set): either the server answered 304 or
+        the body hashes to known_hashes[url].
+        conditional=False asks for the full body even if the cache has validators.
+        """
         import time
         max_retries = 3
         retry_delay = 2  # seconds
         
+        client = self.http or get_client()
+        
         for attempt in range(max_retries):
             try:
-                # Use comprehensive browser headers to avoid bot detection
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                }
+                # Browser headers live on the client's session; only add the conditional ones
+                headers = self.http_cache.conditional_headers(url) if self.http_cache and conditional else None
                 
                 # Add a small delay between requests to be respectful
                 if attempt > 0:
                     time.sleep(retry_delay * attempt)
                 
-                response = requests.get(url, headers=headers, timeout=30, verify=False)
+                if self.throttle:
+                    with self.throttle.slot(url):
+                        response = client.get(url, headers=headers)
+                else:
+                    response = client.get(url, headers=headers)
+                if response.status_code == 304 and self.http_cache:
+                    if all(self.http_cache.is_consumed(url, c) for c in self.cache_consumers):
+                        self.not_modified = True
+                        return None
+                    content = self.http_cache.load(url)
+                    if content is None:
+                        if not conditional:
+                            print(f"Error fetching {url}: 304 to an unconditional request")
+                            return None
+                        # Body evicted between the header lookup and now; download it
+                        # again (and store it with its new validators below)
+                        return self.fetch(url, conditional=False)
+                    return self._unless_known(url, content)
+                
                 response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                if self.http_cache:
+                    self.http_cache.store(url, response.content,
+                                          response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return self._unless_known(url, response.content)
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 403 and attempt < max_retries - 1:
                     print(f"Got 403 error for {url}, retrying in {retry_delay * (attempt + 1)}s...")
@@ -63,3 +184,12 @@ class EventScraper(ABC):
                 return None
         
         return None
+
+    def _unless_known(self, url: str, content: bytes) -> Optional[bytes]:
+        """Record the body's hash; None (and not_modified) if it is the body last ingested."""
+        digest = hashlib.sha256(content).hexdigest()
+        self.content_hashes[url] = digest
+        if self.known_hashes.get(url) == digest:
+            self.not_modified = True
+            return None
+        return content
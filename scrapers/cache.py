@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = "cache/http"
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class HTTPCache:
+    """
+    On-disk cache of fetched pages for conditional requests.
+
+    Each entry keeps the body plus the ETag / Last-Modified validators the server
+    sent, so the next fetch can ask "has this changed?" with If-None-Match /
+    If-Modified-Since. Entries also remember which consumers (conference-years)
+    have already ingested the current version, which lets the scanner skip a
+    304 page entirely instead of re-parsing the cached body.
+
+    The index lives in index.json next to the bodies; the least recently used
+    entries are evicted once the total body size exceeds max_bytes.
+    """
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(directory, "index.json")
+        os.makedirs(directory, exist_ok=True)
+        self._index: Dict[str, dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, dict]:
+        try:
+            with open(self._index_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".body")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for a conditional GET, empty if the URL is not cached."""
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry or not os.path.exists(self._body_path(url)):
+                return {}
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def load(self, url: str) -> Optional[bytes]:
+        """Cached body for a URL (after a 304), or None if it has gone missing."""
+        try:
+            with open(self._body_path(url), "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            if url in self._index:
+                self._index[url]["accessed"] = time.time()
+                self._save_index()
+        return body
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """Save a fresh 200 response. Pages without validators are not cached."""
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            with open(self._body_path(url), "wb") as f:
+                f.write(body)
+            self._index[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": len(body),
+                "accessed": time.time(),
+                # New version of the page: nobody has ingested it yet
+                "consumers": [],
+            }
+            self._evict()
+            self._save_index()
+
+    def is_consumed(self, url: str, consumer: str) -> bool:
+        with self._lock:
+            entry = self._index.get(url)
+            return bool(entry) and consumer in entry.get("consumers", [])
+
+    def mark_consumed(self, url: str, consumer: str):
+        """Record that consumer has ingested the cached version of url."""
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry or consumer in entry["consumers"]:
+                return
+            entry["consumers"].append(consumer)
+            self._save_index()
+
+    def _evict(self):
+        total = sum(entry["size"] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for url in sorted(self._index, key=lambda u: self._index[u]["accessed"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._index.pop(url)["size"]
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
@@ -1,13 +1,18 @@
-from .base import EventScraper, PaperData
-from bs4 import BeautifulSoup
+from .base import EventScraper, PaperData, CVF_PAPER_LIST
+from typing import Iterator
 from urllib.parse import urljoin
+from .registry import register
 
+@register("CVPR")
 class CVPRScraper(EventScraper):
-    def scrape(self, url: str) -> list[PaperData]:
+    def parse_only(self, url: str):
+        # The link heuristics on conference main sites need the whole page
+        return CVF_PAPER_LIST if "openaccess.thecvf.com" in url else None
+
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
         soup = self.get_soup(url)
-        papers = []
         if not soup:
-            return papers
+            return
 
         # Logic for openaccess.thecvf.com (Standard CVF Archive)
         if "openaccess.thecvf.com" in url:
@@ -45,13 +50,13 @@ class CVPRScraper(EventScraper):
                     # Clean up "Search for keys" helper text if present? 
                     # Usually CVF text clean.
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=link,
                     pdf_url=link.replace("html", "pdf") if "html" in link else None
-                ))
-            return papers
+                )
+            return
 
         # Logic for cvpr.thecvf.com or other conference main sites
         # Based on user check, these might be simple lists of links "Title -> Project Page"
@@ -90,11 +95,9 @@ class CVPRScraper(EventScraper):
                 # If the URL is external (github, project page), it's likely a paper listed on the conf site
                 # Authors might not be present.
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors="See Project Page", # Placeholder as authors aren't visible in simple link lists
                     url=full_url,
                     pdf_url=None
-                ))
-
-        return papers
+                )
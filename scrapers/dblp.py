@@ -0,0 +1,190 @@
+from .base import EventScraper, PaperData, DBLP_ENTRIES
+from typing import Iterator, List, Optional, Tuple
+
+# Papers with at most this many pages are tagged "Short Paper"
+SHORT_PAPER_MAX_PAGES = 6
+# Bytes fed to the pull parser at a time
+CHUNK_SIZE = 64 * 1024
+
+# DBLP table-of-contents layout (dblp.org/db/conf/<venue>/<venue><year>.html):
+# <li class="entry inproceedings" ...>
+#   <nav class="publ"><ul><li><div class="head"><a href="DOI URL">...</a></div></li></ul></nav>
+#   <cite class="data" ...>
+#     <span itemprop="author" ...><a ...><span itemprop="name">Author Name</span></a></span>
+#     <span class="title" itemprop="name">Paper Title.</span>
+#     <span itemprop="pagination">12-25</span>
+#   </cite>
+# </li>
+
+
+def short_paper_tag(pages: str) -> Optional[str]:
+    """'Short Paper' for a dblp pagination string spanning <= SHORT_PAPER_MAX_PAGES pages."""
+    page_count = 0
+    if "-" in pages:
+        try:
+            start, end = pages.split("-")
+            # Article-numbered proceedings use "12:1-12:18"
+            if ":" in start: start = start.split(":")[-1]
+            if ":" in end: end = end.split(":")[-1]
+            page_count = int(end) - int(start) + 1
+        except ValueError:
+            pass
+    else:
+        page_count = 1
+
+    if 0 < page_count <= SHORT_PAPER_MAX_PAGES:
+        return "Short Paper"
+    return None
+
+
+def _make_paper(title, authors_list, link, pages, tag_short_papers) -> PaperData:
+    return PaperData(
+        title=title,
+        authors=", ".join(authors_list),
+        url=link,
+        pdf_url=None,
+        tags=short_paper_tag(pages) if tag_short_papers and pages is not None else None
+    )
+
+
+def _classes(element) -> List[str]:
+    return (element.get('class') or '').split()
+
+
+def _text(element) -> str:
+    # Same result as BeautifulSoup's get_text(strip=True)
+    return "".join(s.strip() for s in element.itertext())
+
+
+def _parse_entry(li, page_url: str, tag_short_papers: bool) -> Optional[PaperData]:
+    """Extract one <li class="entry inproceedings"> lxml element."""
+    cite = next((c for c in li.iter('cite') if 'data' in _classes(c)), None)
+    if cite is None:
+        return None
+
+    title = None
+    authors_list = []
+    pages = None
+    for span in cite.iter('span'):
+        itemprop = span.get('itemprop')
+        if itemprop == 'name' and title is None and 'title' in _classes(span):
+            title = _text(span)
+        elif itemprop == 'author':
+            name_span = next((n for n in span.iter('span') if n.get('itemprop') == 'name'), None)
+            if name_span is not None:
+                authors_list.append(_text(name_span))
+        elif itemprop == 'pagination':
+            pages = _text(span)
+    if title is None:
+        return None
+
+    # First link in <nav class="publ"> is the electronic edition (DOI / publisher)
+    link = page_url
+    nav = next((n for n in li.iter('nav') if 'publ' in _classes(n)), None)
+    if nav is not None:
+        ul = nav.find('.//ul')
+        if ul is not None:
+            first_a = ul.find('.//a')
+            if first_a is not None:
+                link = first_a.get('href')
+
+    return _make_paper(title, authors_list, link, pages, tag_short_papers)
+
+
+def iter_dblp_papers(content: bytes, page_url: str, tag_short_papers: bool = False) -> Iterator[PaperData]:
+    """
+    Stream PaperData out of a dblp table-of-contents page in one pass.
+
+    The page is fed to lxml's pull parser in chunks; each entry is converted
+    as soon as its closing </li> arrives and is then dropped from the tree, so
+    memory stays flat no matter how many papers the proceedings have.
+    """
+    from lxml import etree
+
+    # dblp always serves UTF-8; without this lxml assumes latin-1 when the chunk lacks a <meta charset>
+    parser = etree.HTMLPullParser(events=('end',), tag='li', encoding='utf-8')
+    for start in range(0, len(content), CHUNK_SIZE):
+        parser.feed(content[start:start + CHUNK_SIZE])
+        yield from _drain(parser, page_url, tag_short_papers)
+    parser.close()
+    yield from _drain(parser, page_url, tag_short_papers)
+
+
+def _drain(parser, page_url, tag_short_papers) -> Iterator[PaperData]:
+    for _, li in parser.read_events():
+        classes = _classes(li)
+        # Nested <li> inside the entry's nav menus also fire events; skip them
+        if 'entry' not in classes or 'inproceedings' not in classes:
+            continue
+        paper = _parse_entry(li, page_url, tag_short_papers)
+        if paper:
+            yield paper
+        # Free the finished entry and everything before it
+        li.clear()
+        while li.getprevious() is not None:
+            del li.getparent()[0]
+
+
+def soup_dblp_papers(soup, page_url: str, tag_short_papers: bool = False) -> Iterator[PaperData]:
+    """Same extraction over a BeautifulSoup tree, used when lxml is unavailable."""
+    for li in soup.find_all('li', class_='entry inproceedings'):
+        cite = li.find('cite', class_='data')
+        if not cite: continue
+
+        title_span = cite.find('span', class_='title', itemprop='name')
+        if not title_span: continue
+        title = title_span.get_text(strip=True)
+
+        authors_list = []
+        for author_span in cite.find_all('span', itemprop='author'):
+            name_span = author_span.find('span', itemprop='name')
+            if name_span:
+                authors_list.append(name_span.get_text(strip=True))
+
+        link = page_url
+        nav = li.find('nav', class_='publ')
+        if nav:
+            ul = nav.find('ul')
+            if ul:
+                first_a = ul.find('a')
+                if first_a:
+                    link = first_a.get('href')
+
+        pagination = cite.find('span', itemprop='pagination')
+        pages = pagination.get_text(strip=True) if pagination else None
+        yield _make_paper(title, authors_list, link, pages, tag_short_papers)
+
+
+class DBLPScraper(EventScraper):
+    """
+    Base for conferences whose config points at a dblp.org table of contents
+    (ACM CCS, NDSS, USENIX Security, IEEE S&P; ICCV uses the engine directly).
+    """
+    # Tag papers of <= SHORT_PAPER_MAX_PAGES pages as "Short Paper"
+    tag_short_papers = False
+
+    def parse_only(self, url: str):
+        return DBLP_ENTRIES
+
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
+        yield from iter_dblp(self, url, self.tag_short_papers)
+
+    def iter_years(self, url: str, years: List[int]) -> Iterator[Tuple[int, PaperData]]:
+        # A dblp page is one proceedings volume; parse it once for every year pointing at it
+        self.cache_consumers = [self.cache_key(self.conference_name, y) for y in years]
+        for paper in self.iter_papers(url):
+            for year in years:
+                yield year, paper
+
+
+def iter_dblp(scraper: EventScraper, url: str, tag_short_papers: bool = False) -> Iterator[PaperData]:
+    """Fetch a dblp page through scraper and stream its papers."""
+    if url in scraper.documents:
+        return soup_dblp_papers(scraper.documents[url], url, tag_short_papers)
+
+    content = scraper.fetch(url)
+    if content is None:
+        return iter(())
+    if scraper.parser == "lxml":
+        return iter_dblp_papers(content, url, tag_short_papers)
+    return soup_dblp_papers(scraper.make_soup(content, url), url, tag_short_papers)
@@ -0,0 +1,153 @@
+from .base import EventScraper
+from bs4 import BeautifulSoup
+from dataclasses import dataclass
+from typing import List, Optional
+from urllib.parse import urljoin, urlparse, parse_qs
+import re
+
+# Meta descriptions shorter than this are site blurbs, not abstracts
+MIN_ABSTRACT_LENGTH = 100
+
+# Sites whose paper pages parse_detail understands (subdomains included). Other
+# links, e.g. the DOI / publisher pages of dblp entries, are not fetched.
+DETAIL_HOSTS = (
+    "thecvf.com",             # CVF open access and conference sites
+    "ecva.net",               # ECCV papers
+    "iclr.cc", "icml.cc", "neurips.cc", "nips.cc",  # MiniConf sites, NeurIPS proceedings
+    "openreview.net",
+    "proceedings.mlr.press",  # PMLR
+)
+
+# Separators between names in author strings ("A · B", "A, B and C")
+AUTHOR_SEPARATORS = re.compile(r"\s*(?:·|•|;|,|\band\b)\s*")
+
+
+@dataclass
+class PaperDetail:
+    authors: Optional[str] = None # Comma-separated
+    abstract: Optional[str] = None
+    pdf_url: Optional[str] = None
+
+    def is_empty(self) -> bool:
+        return not (self.authors or self.abstract or self.pdf_url)
+
+
+def _meta(soup, name: str) -> List[str]:
+    tags = soup.find_all('meta', attrs={'name': name}) or soup.find_all('meta', attrs={'property': name})
+    return [t.get('content', '').strip() for t in tags if t.get('content', '').strip()]
+
+
+def _split_authors(text: str) -> List[str]:
+    return [name for name in AUTHOR_SEPARATORS.split(text.strip()) if name]
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.split())
+
+
+def parse_detail(soup: BeautifulSoup, url: str) -> PaperDetail:
+    """
+    Extract authors, abstract and PDF link from a paper detail page.
+
+    Tried in order, first hit wins per field:
+    1. Highwire Press <meta name="citation_*"> tags (CVF open access, OpenReview, PMLR, most publishers)
+    2. CVF open access layout: div#authors, div#abstract
+    3. MiniConf virtual sites (iclr.cc / icml.cc / neurips.cc / ICCV):
+       h3.card-subtitle authors, div#abstractExample / .abstract-text-inner, OpenReview link
+    4. Generic div.abstract / og:description
+    """
+    detail = PaperDetail()
+
+    # 1. Citation meta tags
+    authors = _meta(soup, 'citation_author')
+    if authors:
+        detail.authors = ", ".join(authors)
+    abstract = _meta(soup, 'citation_abstract')
+    if abstract:
+        detail.abstract = _clean(abstract[0])
+    pdf = _meta(soup, 'citation_pdf_url')
+    if pdf:
+        detail.pdf_url = urljoin(url, pdf[0])
+
+    # 2. CVF open access
+    if not detail.authors:
+        authors_div = soup.find('div', id='authors')
+        if authors_div:
+            # <div id="authors"><b><i>A, B, C</i></b>; Venue ...</div>
+            names = authors_div.find('i') or authors_div
+            detail.authors = ", ".join(_split_authors(names.get_text(" ", strip=True))) or None
+
+    # 3. MiniConf
+    if not detail.authors:
+        subtitle = soup.find('h3', class_='card-subtitle')
+        if subtitle:
+            detail.authors = ", ".join(_split_authors(subtitle.get_text(" ", strip=True))) or None
+
+    if not detail.abstract:
+        for candidate in (soup.find('div', id='abstract'),
+                          soup.find('div', id='abstractExample'),
+                          soup.find('div', class_='abstract-text-inner'),
+                          soup.find(['div', 'section', 'p'], class_='abstract')):
+            if candidate:
+                text = _clean(candidate.get_text(" ", strip=True))
+                # Some layouts prefix the text with a heading
+                text = re.sub(r"^abstract\s*:?\s*", "", text, flags=re.IGNORECASE)
+                if text:
+                    detail.abstract = text
+                    break
+
+    if not detail.pdf_url:
+        detail.pdf_url = _pdf_link(soup, url)
+
+    # 4. Social preview text as a last resort
+    if not detail.abstract:
+        for description in _meta(soup, 'og:description') + _meta(soup, 'description'):
+            if len(description) >= MIN_ABSTRACT_LENGTH:
+                detail.abstract = _clean(description)
+                break
+
+    return detail
+
+
+def _pdf_link(soup, url: str) -> Optional[str]:
+    for a in soup.find_all('a', href=True):
+        href = a['href']
+        text = a.get_text(strip=True).lower()
+        parsed = urlparse(urljoin(url, href))
+        # OpenReview forum links from MiniConf pages: the PDF lives at /pdf?id=<same id>
+        if parsed.hostname and parsed.hostname.endswith('openreview.net') and parsed.path == '/forum':
+            paper_id = parse_qs(parsed.query).get('id')
+            if paper_id:
+                return f"https://openreview.net/pdf?id={paper_id[0]}"
+        if parsed.path.lower().endswith('.pdf') and 'supp' not in parsed.path.lower():
+            return parsed.geturl()
+        if text in ('pdf', '[pdf]', 'paper pdf', 'paper'):
+            if parsed.path.lower().endswith('.pdf') or '/pdf' in parsed.path.lower():
+                return parsed.geturl()
+    return None
+
+
+class DetailScraper(EventScraper):
+    """
+    Fetches individual paper pages for the enrichment stage (enricher.py).
+    One instance is shared by all enrichment workers; it has no HTTP cache and
+    records no content hashes, so fetch() keeps no per-page state.
+    """
+    def __init__(self):
+        super().__init__("detail", 0)
+
+    def _unless_known(self, url: str, content: bytes) -> Optional[bytes]:
+        # Page hashes only matter for list pages (Scanner's scan_state); kept
+        # here they would grow by one entry per enriched paper
+        return content
+
+    def scrape(self, url: str):
+        # A detail page describes one paper; see scrape_detail
+        return []
+
+    def scrape_detail(self, url: str) -> Optional[PaperDetail]:
+        """PaperDetail for the page, or None if it could not be fetched."""
+        soup = self.get_soup(url)
+        if soup is None:
+            return None
+        return parse_detail(soup, url)
@@ -1,14 +1,25 @@
 from .base import EventScraper, PaperData
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+import re
+from typing import Dict, Iterator, List, Tuple
 from urllib.parse import urljoin
+from .registry import register
 
+@register("ECCV")
 class ECCVScraper(EventScraper):
-    def scrape(self, url: str) -> list[PaperData]:
-        papers = []
+    # "ECCV 2024" / "ECCV 2024 Papers" section headers
+    YEAR_HEADER = re.compile(r"ECCV (\d{4})")
+    # Year headers and the accordion-content siblings holding their papers
+    SECTIONS = SoupStrainer(['h3', 'div', 'button'], class_=['accordion-header', 'accordion', 'ptitle', 'accordion-content'])
+
+    def parse_only(self, url: str):
+        return self.SECTIONS
+
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
         soup = self.get_soup(url)
         if not soup:
-            return papers
-
+            return
+        
         # Logic for ecva.net/papers.php
         # Structure:
         # <div id="content">
@@ -19,61 +30,48 @@ class ECCVScraper(EventScraper):
         #   </div>
         # </div>
         #
-        # Note: The page often contains ALL years. We might need to filter by the requested year header.
-        # However, the user config points to the same URL for all years. 
-        # Ideally, we find the section for self.year.
-        if not soup:
-            return papers
+        # Note: The page contains ALL years and the config points to the same URL
+        # for every year, so we pick the section for self.year.
+        container = self._year_sections(soup).get(self.year)
+        if not container:
+            return
+        yield from self._parse_section(container, url)
 
-        # Determine the logic based on the URL
-        # For ecva.net/papers.php
-        
-        # Heuristic: Find the header "ECCV <Year>" and parse siblings until next header
-        
-        content_div = soup.find('div', id='content')
-        if not content_div:
-            content_div = soup.find('div', class_='content')
-            
-        if not content_div:
-             # Fallback to body?
-             content_div = soup.body
-        
-        # Heuristic: Find the header "ECCV <Year>" in the whole soup
+    def iter_years(self, url: str, years: List[int]) -> Iterator[Tuple[int, PaperData]]:
+        """Fetch the all-years page once and extract every requested year in one pass."""
+        self.cache_consumers = [self.cache_key(self.conference_name, y) for y in years]
+        soup = self.get_soup(url)
+        if not soup:
+            return
         
-        target_header = None
+        sections = self._year_sections(soup)
+        for year in years:
+            if year in sections:
+                for paper in self._parse_section(sections[year], url):
+                    yield year, paper
+
+    def _year_sections(self, soup) -> Dict[int, object]:
+        """Map each year to its accordion-content container, walking the headers once."""
         # Headers are usually <h3> or <div class="accordion-header">
         # 2024 uses <button class="accordion">ECCV 2024 Papers</button>
         # Search in soup.find_all because the header might be outside the 'content' div
         candidates = soup.find_all(['h3', 'div', 'button'], class_=['accordion-header', 'accordion', 'ptitle'])
         
+        sections = {}
         for header in candidates:
-            if f"ECCV {self.year}" in header.get_text():
-                target_header = header
-                break
-        
-        container = None
-        if target_header:
+            match = self.YEAR_HEADER.search(header.get_text())
+            if not match:
+                continue
+            year = int(match.group(1))
+            if year in sections:
+                continue  # First header for a year wins, as before
             # The papers are in the 'next sibling' div usually "accordion-content"
-            container = target_header.find_next_sibling('div', class_='accordion-content')
-        
-        if not container:
-            # Fallback for old years or if header not found but 'content' div exists and seems right?
-            # If we are scraping a specific year url (like 2022 if it was separate, but here it is one page)
-            # We must be careful.
-            
-            # If default content_div logic found something, check if it looks like the right year?
-            # Hard to tell.
-            pass
+            container = header.find_next_sibling('div', class_='accordion-content')
+            if container:
+                sections[year] = container
+        return sections
 
-        if not container and content_div:
-             # Try to use content_div as fallback if we couldn't match header
-             # But this risks getting wrong year.
-             # However, for now let's use it if we are desperate.
-             pass
-             
-        if not container:
-             return papers
-        
+    def _parse_section(self, container, url: str) -> Iterator[PaperData]:
         dt_list = container.find_all('dt', class_='ptitle')
         for dt in dt_list:
             a_tag = dt.find('a')
@@ -88,7 +86,7 @@ class ECCVScraper(EventScraper):
             dd = dt.find_next_sibling('dd')
             authors = dd.get_text(strip=True) if dd else "Unknown"
             
-            papers.append(PaperData(
+            yield PaperData(
                 title=title,
                 authors=authors,
                 url=link,
@@ -96,6 +94,4 @@ class ECCVScraper(EventScraper):
                 # ECVA links are like papers/eccv_2022/papers_ECCV/html/....php
                 # PDFs are often ../papers_ECCV/papers/....pdf
                 # We can leave pdf_url None or try to guess.
-            ))
-            
-        return papers
+            )
@@ -0,0 +1,158 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+def _accept_encoding() -> str:
+    # Only advertise brotli when urllib3 can decode it; otherwise a "br" body
+    # would reach the parser still compressed
+    try:
+        import brotli  # noqa: F401
+        return "gzip, deflate, br"
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            return "gzip, deflate, br"
+        except ImportError:
+            return "gzip, deflate"
+
+# Browser-like headers to avoid bot detection, sent with every request
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': _accept_encoding(),
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Seconds to establish a connection / to wait for data on it. A dead host fails
+# fast while a slow dblp page still has time to arrive.
+CONNECT_TIMEOUT = float(os.getenv("SCRAPER_CONNECT_TIMEOUT", "10"))
+READ_TIMEOUT = float(os.getenv("SCRAPER_READ_TIMEOUT", "30"))
+# Idle keep-alive connections kept per host; match the largest host budget
+POOL_MAXSIZE = int(os.getenv("SCRAPER_POOL_MAXSIZE", "16"))
+
+
+class HTTPStats:
+    """Thread-safe request / connection counters of an HTTPClient."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.bytes_received = 0 # On the wire, i.e. before decompression
+        self.bytes_decoded = 0
+        self.per_host = {}  # host -> {"requests": n, "connections": n}
+
+    def _host(self, host: str) -> dict:
+        return self.per_host.setdefault(host, {"requests": 0, "connections": 0})
+
+    def request(self, host: str, wire_bytes: int, decoded_bytes: int):
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += wire_bytes
+            self.bytes_decoded += decoded_bytes
+            self._host(host)["requests"] += 1
+
+    def connection_opened(self, host: str):
+        with self._lock:
+            self.connections_opened += 1
+            self._host(host)["connections"] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": max(0, self.requests - self.connections_opened),
+                "bytes_received": self.bytes_received,
+                "bytes_decoded": self.bytes_decoded,
+            }
+
+    def since(self, before: Dict[str, int]) -> Dict[str, int]:
+        """Counters accumulated since an earlier snapshot()."""
+        now = self.snapshot()
+        return {key: now[key] - before.get(key, 0) for key in now}
+
+
+def _counting_pool(base, stats: HTTPStats):
+    class CountingPool(base):
+        def _new_conn(self):
+            stats.connection_opened(self.host)
+            return super()._new_conn()
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report each new connection to stats."""
+    def __init__(self, stats: HTTPStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.stats),
+            "https": _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+
+class HTTPClient:
+    """
+    Shared HTTP client for all scrapers: one pooled requests.Session, so
+    requests to a host reuse keep-alive connections (and TLS sessions) instead
+    of opening a new one per page.
+
+    The pool is thread-safe; the Scanner's and Enricher's worker threads all
+    share the client returned by get_client().
+    """
+    def __init__(self, connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT,
+                 pool_maxsize: int = POOL_MAXSIZE, headers: Optional[Dict[str, str]] = None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.stats = HTTPStats()
+        self.session = requests.Session()
+        self.session.headers.clear()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        self.session.verify = False
+        # Like the one-off requests.get calls before: no cookies carried between requests
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        # pool_block=False: past pool_maxsize extra connections are opened and dropped after use
+        adapter = _CountingAdapter(self.stats, pool_connections=32, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET url; headers are added to the defaults (e.g. If-None-Match)."""
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        wire_bytes = response.raw.tell() if response.raw is not None else len(response.content)
+        self.stats.request(requests.utils.urlparse(url).hostname or "", wire_bytes, len(response.content))
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+def format_stats(stats: Dict[str, int]) -> str:
+    """One-line summary of HTTPStats.snapshot() / since() for the logs."""
+    return (f"{stats['requests']} requests over {stats['connections_opened']} connections "
+            f"({stats['connections_reused']} reused), {stats['bytes_received'] / 1e6:.1f} MB received")
+
+def get_client() -> HTTPClient:
+    """The process-wide HTTPClient, created on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
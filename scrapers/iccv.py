@@ -1,54 +1,30 @@
-from .base import EventScraper, PaperData
-from bs4 import BeautifulSoup
+from .base import EventScraper, PaperData, DBLP_ENTRIES, CVF_PAPER_LIST
+from .dblp import iter_dblp
+from typing import Iterator
 from urllib.parse import urljoin
+from .registry import register
 
+@register("ICCV")
 class ICCVScraper(EventScraper):
-    def scrape(self, url: str) -> list[PaperData]:
-        soup = self.get_soup(url)
-        papers = []
-        if not soup:
-            return papers
+    def parse_only(self, url: str):
+        if "dblp.org" in url:
+            return DBLP_ENTRIES
+        if "openaccess.thecvf.com" in url:
+            return CVF_PAPER_LIST
+        # MiniConf pages fall back through tables, lists and cards; parse everything
+        return None
 
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
         if "dblp.org" in url:
-            # DBLP Scraping (Same as ACM CCS)
-            # Layout: <li class="entry inproceedings"> <cite class="data"> <span class="title">...</span> ... </cite> </li>
-            items = soup.find_all('li', class_='entry inproceedings')
-            for li in items:
-                cite = li.find('cite', class_='data')
-                if not cite: continue
-                
-                title_span = cite.find('span', class_='title', itemprop='name')
-                if not title_span: continue
-                title = title_span.get_text(strip=True)
-                
-                # Authors
-                author_spans = cite.find_all('span', itemprop='author')
-                authors_list = []
-                for author_span in author_spans:
-                    name_span = author_span.find('span', itemprop='name')
-                    if name_span:
-                        authors_list.append(name_span.get_text(strip=True))
-                authors = ", ".join(authors_list)
-                
-                # Link
-                nav = li.find('nav', class_='publ')
-                link = url
-                if nav:
-                    ul = nav.find('ul')
-                    if ul:
-                        first_a = ul.find('a')
-                        if first_a:
-                             link = first_a.get('href')
-                             
-                papers.append(PaperData(
-                    title=title,
-                    authors=authors,
-                    url=link,
-                    pdf_url=None
-                ))
-            return papers
+            # DBLP Scraping (shared engine with ACM CCS, NDSS, USENIX, IEEE S&P)
+            yield from iter_dblp(self, url)
+            return
+
+        soup = self.get_soup(url)
+        if not soup:
+            return
 
-        elif "openaccess.thecvf.com" in url:
+        if "openaccess.thecvf.com" in url:
             # Legacy CVF OpenAccess
             # <dt class="ptitle"><a href="...">Title</a></dt>
             # <dd class="baseys">Authors</dd>
@@ -72,13 +48,13 @@ class ICCVScraper(EventScraper):
                 if dd:
                     authors = dd.get_text(strip=True)
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=link,
                     pdf_url=link.replace("html", "pdf") if "html" in link else None
-                ))
-            return papers
+                )
+            return
 
         else:
             # MiniConf site (e.g. iccv.thecvf.com/Conferences/2025)
@@ -126,16 +102,16 @@ class ICCVScraper(EventScraper):
                 else:
                     link = href
                     
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=link,
                     pdf_url=None
-                ))
+                )
                 found_rows = True
                 
             if found_rows:
-                return papers
+                return
 
             # Try list items first (Papers list view)
             lis = soup.find_all('li')
@@ -157,16 +133,16 @@ class ICCVScraper(EventScraper):
                     else:
                         link = href
                     
-                    papers.append(PaperData(
+                    yield PaperData(
                         title=title,
                         authors="Visit Detail Page", # MiniConf list view usually lacks authors
                         url=link,
                         pdf_url=None
-                    ))
+                    )
                     found_li = True
             
             if found_li:
-                return papers
+                return
                 
             # Fallback to Cards (MiniConf Grid view)
             cards = soup.find_all('div', class_='card')
@@ -185,10 +161,9 @@ class ICCVScraper(EventScraper):
                 subtitle = card.find('div', class_='card-subtitle')
                 authors = subtitle.get_text(strip=True) if subtitle else "Unknown"
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=link,
                     pdf_url=None
-                ))
-            return papers
+                )
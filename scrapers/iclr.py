@@ -1,20 +1,21 @@
 from .base import EventScraper, PaperData
-from bs4 import BeautifulSoup
+from typing import Iterator
 from urllib.parse import urljoin
-import requests
+from .registry import register
 
+@register("ICLR")
 class ICLRScraper(EventScraper):
-    def scrape(self, url: str) -> list[PaperData]:
-        papers = []
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
         soup = self.get_soup(url)
         if not soup:
-            return papers
+            return
         
         # Logic for iclr.cc/virtual/YEAR/papers.html
         # 2024 structure: <ul> <li> <a href="/virtual/2024/poster/ID">Title</a> </li> ... </ul>
         
         # Check for list items with links
         lis = soup.find_all('li')
+        found_li_papers = False
         for li in lis:
             a_tag = li.find('a')
             if not a_tag: continue
@@ -41,15 +42,16 @@ class ICLRScraper(EventScraper):
                 # So authors are missing in this view.
                 authors = "Visit Detail Page"
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=url_full,
                     pdf_url=None
-                ))
+                )
+                found_li_papers = True
                 
         # Fallback to card logic (older years?)
-        if not papers:
+        if not found_li_papers:
             cards = soup.find_all('div', class_='card')
             for card in cards:
                 h3 = card.find('h3', class_='card-title')
@@ -74,11 +76,9 @@ class ICLRScraper(EventScraper):
                 else:
                     authors = "Unknown"
                     
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=link,
                     pdf_url=None # PDF usually inside the detail page
-                ))
-            
-        return papers
+                )
@@ -1,14 +1,14 @@
 from .base import EventScraper, PaperData
-from bs4 import BeautifulSoup
+from typing import Iterator
 from urllib.parse import urljoin
-import requests
+from .registry import register
 
+@register("ICML")
 class ICMLScraper(EventScraper):
-    def scrape(self, url: str) -> list[PaperData]:
-        papers = []
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
         soup = self.get_soup(url)
         if not soup:
-            return papers
+            return
 
         # Logic for icml.cc/virtual/YEAR/papers.html (Same as ICLR)
         
@@ -35,16 +35,16 @@ class ICMLScraper(EventScraper):
                 
                 authors = "Visit Detail Page"
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=url_full,
                     pdf_url=None
-                ))
+                )
                 found_li_papers = True
 
         if found_li_papers:
-            return papers
+            return
 
         # Fallback to card logic (older years or different view)
         cards = soup.find_all('div', class_='card')
@@ -65,12 +65,12 @@ class ICMLScraper(EventScraper):
             subtitle = card.find('div', class_='card-subtitle')
             authors = subtitle.get_text(strip=True) if subtitle else "Unknown"
             
-            papers.append(PaperData(
+            yield PaperData(
                 title=title,
                 authors=authors,
                 url=link,
                 pdf_url=None
-            ))
+            )
             
         # Keep legacy PMLR logic as fallback if URL contains mlr.press?
         # Config updated to icml.cc so this branch might not trigger, but good to keep if needed.
@@ -97,11 +97,9 @@ class ICMLScraper(EventScraper):
                 authors_span = div.find('span', class_='authors')
                 authors = authors_span.get_text(strip=True) if authors_span else "Unknown"
                 
-                papers.append(PaperData(
+                yield PaperData(
                     title=title,
                     authors=authors,
                     url=abs_link,
                     pdf_url=pdf_link
-                ))
-        
-        return papers
+                )
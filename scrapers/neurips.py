@@ -1,14 +1,21 @@
 from .base import EventScraper, PaperData
-from bs4 import BeautifulSoup
+from typing import Iterator
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
-import requests
+from .registry import register
 
+@register("NeurIPS")
 class NeurIPSScraper(EventScraper):
-    def scrape(self, url: str) -> list[PaperData]:
-        papers = []
+    # The paper list and the wrapper used as a fallback container
+    PAPER_LIST = SoupStrainer(['ul', 'div'], class_=['paper-list', 'col-sm-12'])
+
+    def parse_only(self, url: str):
+        return self.PAPER_LIST
+
+    def iter_papers(self, url: str) -> Iterator[PaperData]:
         soup = self.get_soup(url)
         if not soup:
-            return papers
+            return
 
         # Logic for NeurIPS (papers.nips.cc)
         if "nips.cc" in url or "neurips.cc" in url:
@@ -41,15 +48,13 @@ class NeurIPSScraper(EventScraper):
                     if authors_tag:
                          authors = authors_tag.get_text(strip=True)
                     
-                    papers.append(PaperData(
+                    yield PaperData(
                         title=title,
                         authors=authors,
                         url=link,
                         pdf_url=link.replace("Hash", "Abstract").replace(".html", ".pdf") # Heuristic, might need check
-                    ))
+                    )
             
             # 2024/2025 might use a different schedule page (neurips.cc/Conferences/2025/Schedule)
             # If so, the structure is vastly different (virtual schedule).
             # We will assume users point to the Proceedings/Papers list if available.
-            
-        return papers
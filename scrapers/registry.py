@@ -0,0 +1,109 @@
+"""
+Scraper registry: the "scraper" key of each conference in
+config/conferences.json names a scraper class registered here.
+
+Scraper modules register their class with the @register(key) decorator when
+they are imported, and they are imported only when a conference of that
+type is scanned: SCRAPER_MODULES says which module declares each built-in
+key, so neither the web app nor a scan of one conference loads the others
+(or requests / bs4, until something is scraped).
+
+Scrapers outside this package can plug in through the "paper_agg.scrapers"
+entry point group (name = registry key, value = "module:Class"), or by
+importing a module that uses @register before the scan starts.
+"""
+import importlib
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = "config/conferences.json"
+
+# Registry key -> module that declares it with @register
+SCRAPER_MODULES = {
+    "CVPR": "scrapers.cvpr",
+    "ICCV": "scrapers.iccv",
+    "ECCV": "scrapers.eccv",
+    "NDSS": "scrapers.ndss",
+    "NeurIPS": "scrapers.neurips",
+    "ICML": "scrapers.icml",
+    "ICLR": "scrapers.iclr",
+    "USENIX": "scrapers.usenix_security",
+    "IEEESP": "scrapers.ieee_sp",
+    "ACMCCS": "scrapers.acm_ccs",
+}
+ENTRY_POINT_GROUP = "paper_agg.scrapers"
+
+_registry: Dict[str, type] = {}
+_registry_lock = threading.Lock()
+
+
+def register(key: str) -> Callable[[type], type]:
+    """Class decorator: make the scraper available as config "scraper": key."""
+    def decorator(cls: type) -> type:
+        with _registry_lock:
+            _registry[key] = cls
+        return cls
+    return decorator
+
+
+def _entry_points() -> list:
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    # Python 3.10+ select(); 3.9 returns a dict of groups
+    return list(found.select(group=ENTRY_POINT_GROUP) if hasattr(found, "select") else found.get(ENTRY_POINT_GROUP, []))
+
+
+def scraper_class(key: str) -> Optional[type]:
+    """The scraper class registered as key, importing its module on first use. None if unknown."""
+    with _registry_lock:
+        cls = _registry.get(key)
+    if cls is not None:
+        return cls
+    module = SCRAPER_MODULES.get(key)
+    if module is not None:
+        importlib.import_module(module) # runs its @register
+    else:
+        for entry_point in _entry_points():
+            if entry_point.name == key:
+                register(key)(entry_point.load())
+                break
+    with _registry_lock:
+        return _registry.get(key)
+
+
+def scraper_keys() -> List[str]:
+    """Every known key, without importing any scraper."""
+    with _registry_lock:
+        keys = set(_registry)
+    keys.update(SCRAPER_MODULES)
+    keys.update(entry_point.name for entry_point in _entry_points())
+    return sorted(keys)
+
+
+# Parsed config per path: (mtime_ns, size, config)
+_configs = {}
+_configs_lock = threading.Lock()
+
+
+def load_conferences(path: str = DEFAULT_CONFIG_PATH) -> dict:
+    """
+    Parsed conferences.json ({ "ConfName": { "scraper": "Type", "years": { "2024": "url" } } }).
+    The file is parsed once and re-read only when its mtime or size changes.
+    Raises OSError / ValueError if it cannot be read.
+    """
+    st = os.stat(path)
+    with _configs_lock:
+        cached = _configs.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, 'r') as f:
+        config = json.load(f)
+    with _configs_lock:
+        _configs[path] = (st.st_mtime_ns, st.st_size, config)
+    return config
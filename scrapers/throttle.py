@@ -0,0 +1,66 @@
+import argparse
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+def parse_host_limits(values) -> Dict[str, int]:
+    """Parse repeated HOST=N command-line values into a limits dict."""
+    limits = {}
+    for value in values or []:
+        host, _, limit = value.partition("=")
+        if not host or not limit.isdigit():
+            raise argparse.ArgumentTypeError(f"Invalid --host-limit '{value}', expected HOST=N")
+        limits[host.strip()] = int(limit)
+    return limits
+
+
+class HostThrottle:
+    """
+    Per-host politeness limits shared by every scraper in a scan.
+
+    limits: { "dblp.org": 2, "thecvf.com": 2 } - max concurrent requests per host.
+            Keys match the host itself or any subdomain (thecvf.com covers
+            openaccess.thecvf.com and cvpr.thecvf.com).
+    default_limit: budget for hosts not listed in limits.
+    delay: minimum seconds between the start of two requests to the same host.
+    """
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = 1, delay: float = 1.0):
+        self.limits = {k.lower(): max(1, int(v)) for k, v in (limits or {}).items()}
+        self.default_limit = max(1, int(default_limit))
+        self.delay = max(0.0, float(delay))
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_slot = {}
+
+    def budget_key(self, url: str) -> str:
+        host = (urlparse(url).hostname or "").lower()
+        # Longest suffix wins so "icml.cc" does not swallow a more specific entry
+        for suffix in sorted(self.limits, key=len, reverse=True):
+            if host == suffix or host.endswith("." + suffix):
+                return suffix
+        return host
+
+    def _semaphore(self, key: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(key)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.limits.get(key, self.default_limit))
+                self._semaphores[key] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's request slots for the duration of a fetch."""
+        key = self.budget_key(url)
+        with self._semaphore(key):
+            # Reserve the next start time for this host, then sleep outside the lock
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_slot.get(key, 0.0))
+                self._next_slot[key] = start + self.delay
+            if start > now:
+                time.sleep(start - now)
+            yield
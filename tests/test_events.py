@@ -0,0 +1,35 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import events
+from database import Base
+
+
+def test_events_of_every_bus_reach_every_reader(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path}/events.db")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(events, "PRUNE_EVERY", 1)
+    # One bus per process: the web server's and the scan worker's
+    web, worker = events.EventBus(Session, capacity=3), events.EventBus(Session, capacity=3)
+
+    web.publish("job", job_id=1, status="queued")
+    assert web.flush()
+    worker.publish("job", job_id=1, status="running")
+    worker.publish("log", level="INFO", logger="scanner", message="Scanning CVPR")
+    assert worker.flush()
+
+    with Session() as session:
+        assert [(e["id"], e["kind"]) for e in events.since(session)] == [(1, "job"), (2, "job"), (3, "log")]
+        assert [e["status"] for e in events.since(session, 0, limit=2)] == ["queued", "running"]
+        assert events.since(session, 2)[0]["message"] == "Scanning CVPR"
+        # Ids from before the database was reset start over
+        assert len(events.since(session, 99)) == 3
+
+    web.publish("job", job_id=1, status="done")
+    assert web.flush()
+    with Session() as session:
+        # Only the newest capacity events are kept
+        assert events.first_id(session) == 2
+        assert events.last_id(session) == 4
+        assert [e["message"] for e in events.latest(session, "log", 10)] == ["Scanning CVPR"]
@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import jobs
+from database import Base, ScanJob, sqlite_pragmas
+
+
+def test_concurrent_enqueues_queue_one_job(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path}/jobs.db", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    # Widen the window between the active-jobs check and the insert
+    conference_list = jobs._conference_list
+    def slow_conference_list(conferences):
+        time.sleep(0.3)
+        return conference_list(conferences)
+    monkeypatch.setattr(jobs, "_conference_list", slow_conference_list)
+
+    start = threading.Barrier(2)
+    results = []
+    def enqueue():
+        with Session() as session:
+            start.wait()
+            job, created = jobs.enqueue(session, ["CVPR"])
+            results.append((job.id, created))
+
+    threads = [threading.Thread(target=enqueue) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with Session() as session:
+        assert session.query(ScanJob).count() == 1
+    assert sorted(created for _, created in results) == [False, True]
+    assert results[0][0] == results[1][0]
+
+
+def test_enqueue_of_covered_scan_releases_the_queue_lock(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/jobs.db")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    with Session() as session:
+        first, created = jobs.enqueue(session, ["CVPR"])
+        assert created
+        again, created = jobs.enqueue(session, ["CVPR"])
+        assert not created
+        assert not session.in_transaction()
+        # Another connection can write right away (no busy wait for the lock)
+        other = sqlite3.connect(f"{tmp_path}/jobs.db", timeout=0)
+        other.execute("UPDATE scan_jobs SET status = status")
+        other.commit()
+        other.close()
+        assert again.id == first.id
+
+
+@pytest.mark.skipif(jobs.fcntl is None, reason="needs fcntl")
+def test_one_worker_lock_per_machine(tmp_path):
+    path = f"{tmp_path}/worker.lock"
+    first = jobs._lock_worker(path)
+    assert first is not None
+    assert jobs._lock_worker(path) is None
+    first.close()
+    again = jobs._lock_worker(path)
+    assert again is not None
+    again.close()
@@ -0,0 +1,54 @@
+from sqlalchemy import insert, select
+
+from database import Paper
+from database.normalize import index_new_titles, index_papers, title_key
+
+
+def ingest(session, titles):
+    """Insert titles as papers of consecutive conferences and index them; {title: duplicate_of title}."""
+    rows = [{"id": i, "title": title, "title_key": title_key(title), "conference": f"C{i}", "year": 2024}
+            for i, title in enumerate(titles, 1)]
+    session.execute(insert(Paper), rows)
+    index_papers(session, [(row["id"], row["title_key"], None) for row in rows])
+    session.commit()
+    title_of = {row["id"]: row["title"] for row in rows}
+    return {title: title_of.get(duplicate_of)
+            for title, duplicate_of in session.execute(select(Paper.title, Paper.duplicate_of))}
+
+
+def test_formatting_variants_are_near_duplicates(session):
+    duplicates = ingest(session, [
+        "Denoising Diffusion Probabilistic Models",
+        "Denoising diffusion probabilistic models.",
+        "Denoising Diffusion Probabilistic Model",
+        "Pre-training of Deep Bidirectional Transformers for Language Understanding",
+        "Pretraining of Deep Bidirectional Transformers for Language Understanding",
+    ])
+    assert duplicates["Denoising diffusion probabilistic models."] == "Denoising Diffusion Probabilistic Models"
+    assert duplicates["Denoising Diffusion Probabilistic Model"] == "Denoising Diffusion Probabilistic Models"
+    assert (duplicates["Pretraining of Deep Bidirectional Transformers for Language Understanding"]
+            == "Pre-training of Deep Bidirectional Transformers for Language Understanding")
+
+
+def test_numbered_titles_are_not_near_duplicates(session):
+    titles = [f"Old paper {n}" for n in range(1, 51)] + [
+        "Scene Understanding Part I", "Scene Understanding Part II",
+        "Neural Radiance Fields for Dynamic 3D Scenes", "Neural Radiance Fields for Dynamic 4D Scenes",
+        "Segment Anything", "Segment Anything v2",
+    ]
+    duplicates = ingest(session, titles)
+    assert {title: duplicate for title, duplicate in duplicates.items() if duplicate} == {}
+
+
+def test_index_new_titles_links_papers_stored_since_the_last_pass(session):
+    def store(*rows):
+        session.execute(insert(Paper), [{"id": i, "title": title, "title_key": title_key(title),
+                                         "conference": f"C{i}", "year": 2024} for i, title in rows])
+        session.commit()
+
+    store((1, "Denoising Diffusion Probabilistic Models"), (2, "Segment Anything"))
+    assert index_new_titles(session) == 0
+    store((3, "Denoising diffusion probabilistic models."), (4, "Segment anything!"))
+    assert index_new_titles(session) == 2
+    assert index_new_titles(session) == 0
+    assert dict(session.execute(select(Paper.id, Paper.duplicate_of)).all()) == {1: None, 2: None, 3: 1, 4: 2}
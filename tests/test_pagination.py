@@ -0,0 +1,69 @@
+import base64
+
+import pytest
+from sqlalchemy import insert
+
+from database import Paper
+from database.pagination import InvalidCursor, decode_cursor, encode_cursor, paginate
+
+
+@pytest.fixture
+def papers(session):
+    session.execute(insert(Paper), [{"id": i, "title": f"Paper {i}", "conference": "CVPR", "year": 2024}
+                                    for i in range(1, 26)])
+    session.commit()
+    return session.query(Paper)
+
+
+def ids(page):
+    return [paper.id for paper in page.items]
+
+
+def test_cursor_round_trip():
+    for state in ({"a": 17, "p": 2}, {"b": 5, "p": 1}, {"o": 40, "p": 3}):
+        cursor = encode_cursor(state)
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == state
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    encode_cursor({"p": 2})[:-3],  # truncated
+    base64.urlsafe_b64encode(b"[1, 2]").decode(),  # JSON, but not an object
+    encode_cursor({"p": 2}),  # no position
+])
+def test_tampered_cursors_are_rejected(papers, cursor):
+    with pytest.raises(InvalidCursor):
+        paginate(papers, 10, cursor=cursor)
+
+
+def test_keyset_pages_walk_forward_and_back(papers):
+    first = paginate(papers, 10)
+    assert ids(first) == list(range(25, 15, -1))
+    assert first.prev_cursor is None
+    second = paginate(papers, 10, cursor=first.next_cursor)
+    assert ids(second) == list(range(15, 5, -1))
+    assert second.page == 2
+    last = paginate(papers, 10, cursor=second.next_cursor)
+    assert ids(last) == [5, 4, 3, 2, 1]
+    assert last.next_cursor is None
+
+    back = paginate(papers, 10, cursor=last.prev_cursor)
+    assert ids(back) == ids(second)
+    assert back.page == 2
+    assert ids(paginate(papers, 10, cursor=back.prev_cursor)) == ids(first)
+
+
+def test_page_jump_continues_by_key(papers):
+    jumped = paginate(papers, 10, page=2)
+    assert ids(jumped) == list(range(15, 5, -1))
+    assert decode_cursor(jumped.next_cursor) == {"a": 6, "p": 3}
+    assert ids(paginate(papers, 10, cursor=jumped.next_cursor)) == [5, 4, 3, 2, 1]
+
+
+def test_ranked_queries_page_by_offset(papers):
+    ranked = papers.order_by(Paper.title)
+    first = paginate(ranked, 10, keyset=False)
+    second = paginate(ranked, 10, cursor=first.next_cursor, keyset=False)
+    assert decode_cursor(first.next_cursor) == {"o": 10, "p": 2}
+    assert not set(ids(first)) & set(ids(second))
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from database import generation
+from response_cache import LRUBackend, ResponseCache, SQLiteBackend
+
+
+@pytest.fixture
+def generation_file(tmp_path, monkeypatch):
+    """A generation token of the test's own, bumped with generation.bump(path)."""
+    path = str(tmp_path / "generation")
+    current = generation.current
+    monkeypatch.setattr(generation, "current", lambda: current(path))
+    return path
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    backend = LRUBackend() if request.param == "memory" else SQLiteBackend(str(tmp_path / "responses.db"))
+    return ResponseCache(backend, ttl=60)
+
+
+def test_entries_are_not_served_after_a_generation_bump(cache, generation_file):
+    key = cache.key("/api/papers", [("q", "graph")])
+    cache.set(key, b"page")
+    assert cache.get(cache.key("/api/papers", [("q", "graph")])) == b"page"
+
+    generation.bump(generation_file)
+    assert cache.key("/api/papers", [("q", "graph")]) != key
+    assert cache.get(cache.key("/api/papers", [("q", "graph")])) is None
+
+
+def test_async_access_matches_sync_access(cache, generation_file):
+    key = cache.key("/", [])
+
+    async def roundtrip():
+        await cache.aset(key, b"listing")
+        return await cache.aget(key)
+
+    assert asyncio.run(roundtrip()) == b"listing"
+    assert cache.get(key) == b"listing"
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    for backend in (LRUBackend(), SQLiteBackend(str(tmp_path / "responses.db"))):
+        backend.set("key", b"page", ttl=-1)
+        assert backend.get("key") is None
+
+
+def test_equivalent_queries_share_a_key(generation_file):
+    key = ResponseCache.key
+    assert key("/", [("conferences", "CVPR"), ("conferences", "ICLR"), ("q", "")]) == \
+        key("/", [("conferences", "ICLR"), ("conferences", "CVPR")])
+    assert key("/", [("q", "graph")]) != key("/api/papers", [("q", "graph")])
+
+
+def test_lru_evicts_least_recently_used():
+    backend = LRUBackend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1" and backend.get("c") == b"3"
@@ -0,0 +1,28 @@
+from sqlalchemy import select
+
+from database import Paper
+from scanner import Scanner
+from scrapers.base import PaperData
+
+
+def save(session, titles, existing=None):
+    scanner = Scanner.__new__(Scanner)  # _save_papers needs no config
+    papers = [PaperData(title=title, authors="A. Author, B. Author", url=f"https://example.org/{i}")
+              for i, title in enumerate(titles)]
+    added = scanner._save_papers(session, papers, "CVPR", 2024, "https://example.org/", existing)
+    session.commit()
+    return added
+
+
+def test_save_papers_skips_titles_already_stored_or_repeated(session):
+    assert save(session, ["Deep Nets", "Deep nets.", "Graph Networks"]) == 2
+    assert save(session, ["Graph  networks", "Vision Transformers"]) == 1
+    assert sorted(session.execute(select(Paper.title)).scalars()) == ["Deep Nets", "Graph Networks",
+                                                                       "Vision Transformers"]
+
+
+def test_save_papers_ignores_rows_a_concurrent_writer_inserted(session):
+    assert save(session, ["Deep Nets"]) == 1
+    # As if another writer stored the title after this one loaded the keys
+    assert save(session, ["Deep Nets", "Graph Networks"], existing=set()) == 1
+    assert session.query(Paper).count() == 2
@@ -0,0 +1,40 @@
+from sqlalchemy import insert, update
+
+from database import Paper
+from database.search import filter_papers, search_backend, setup_search
+
+
+def titles(session, **filters):
+    return [paper.title for paper in filter_papers(session.query(Paper), **filters)]
+
+
+def test_full_text_search_matches_term_prefixes_in_any_field(engine, session):
+    setup_search(engine)
+    assert search_backend(engine) == "fts5"
+    session.execute(insert(Paper), [
+        {"title": "Graph Neural Networks", "authors": "Ada Lovelace", "conference": "ICLR", "year": 2023},
+        {"title": "Neural Radiance Fields", "authors": "Alan Turing", "conference": "CVPR", "year": 2024},
+        {"title": "Protein Folding", "authors": "Ada Lovelace", "conference": "NeurIPS", "year": 2024},
+    ])
+    session.commit()
+
+    assert titles(session, q="graph neur") == ["Graph Neural Networks"]
+    # Newest first among equally ranked matches
+    assert titles(session, q="lovelace") == ["Protein Folding", "Graph Neural Networks"]
+    assert titles(session, q="neural", min_year=2024) == ["Neural Radiance Fields"]
+    assert titles(session, q="neural", conferences=["ICLR"]) == ["Graph Neural Networks"]
+    # FTS syntax in the query is taken as text
+    assert titles(session, q='protein" OR "graph') == []
+
+
+def test_search_index_follows_updates_and_deletes(engine, session):
+    setup_search(engine)
+    session.execute(insert(Paper), [{"id": 1, "title": "Graph Neural Networks", "conference": "ICLR", "year": 2023}])
+    session.execute(update(Paper).where(Paper.id == 1).values(title="Graph Transformers"))
+    session.commit()
+    assert titles(session, q="neural") == []
+    assert titles(session, q="transformer") == ["Graph Transformers"]
+
+    session.query(Paper).delete()
+    session.commit()
+    assert titles(session, q="graph") == []
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import delete, insert
+
+from database import Paper, PaperStat, stats
+from database.stats import add_papers, conference_names, count_papers, ensure_stats, invalidate_stats, rebuild_stats
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshots():
+    invalidate_stats()
+    yield
+    invalidate_stats()
+
+
+def store(session, conference, year, count):
+    """Insert papers the way Scanner does: rows and paper_stats in one transaction."""
+    first = session.query(Paper).count()
+    session.execute(insert(Paper), [{"title": f"Paper {i}", "conference": conference, "year": year}
+                                    for i in range(first, first + count)])
+    add_papers(session, conference, year, count)
+    session.commit()
+    invalidate_stats()
+
+
+def test_counts_after_insert(session):
+    store(session, "CVPR", 2024, 3)
+    store(session, "ICLR", 2023, 2)
+    store(session, "CVPR", 2024, 1)
+
+    assert count_papers(session) == 6
+    assert count_papers(session, min_year=2024) == 4
+    assert count_papers(session, max_year=2023, conferences=["CVPR", "ICLR"]) == 2
+    assert count_papers(session, conferences=["NDSS"]) == 0
+    assert conference_names(session) == ["CVPR", "ICLR"]
+
+
+def test_counts_after_delete_and_rebuild(session):
+    store(session, "CVPR", 2024, 3)
+    store(session, "ICLR", 2023, 2)
+    session.execute(delete(Paper).where(Paper.conference == "ICLR"))
+    rebuild_stats(session)
+    session.commit()
+    invalidate_stats()
+
+    assert count_papers(session) == 3
+    assert conference_names(session) == ["CVPR"]
+
+
+def test_snapshot_is_reloaded_when_the_generation_moves_on(session, monkeypatch):
+    store(session, "CVPR", 2024, 3)
+    assert count_papers(session) == 3
+    # Written by another process: this one only sees the generation change
+    add_papers(session, "CVPR", 2024, 2)
+    session.commit()
+    assert count_papers(session) == 3
+    monkeypatch.setattr(stats.generation, "current", lambda: "next")
+    assert count_papers(session) == 5
+
+
+def test_ensure_stats_counts_papers_from_before_paper_stats(engine, session):
+    session.execute(insert(Paper), [{"title": f"Paper {i}", "conference": "CVPR", "year": 2020} for i in range(4)])
+    session.commit()
+    assert session.query(PaperStat).count() == 0
+    ensure_stats(engine)
+    assert count_papers(session) == 4
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+from sqlalchemy import insert
+
+from database import Paper
+from database.normalize import title_key
+from database.prefix import PrefixIndex
+from database.suggest import Suggester
+
+WORDS = ["graph", "graphs", "gradient", "neural", "network", "networks", "net", "vision", "transformer",
+         "transfer", "diffusion", "diffusions", "model", "models", "learning", "learned", "zero"]
+
+
+def random_keys(rng, count):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))) for _ in range(count)]
+
+
+def expected(keys, weights, prefix, limit, words_only=True):
+    """search() by brute force: keys whose text from a word start (words_only=False: the key) starts with prefix."""
+    def starts(key):
+        return [0] + [i + 1 for i, c in enumerate(key) if c == " "] if words_only else [0]
+    matches = [row for row, key in enumerate(keys) if any(key.startswith(prefix, p) for p in starts(key))]
+    return sorted(matches, key=lambda row: (-weights[row], row))[:limit]
+
+
+@pytest.mark.parametrize("added", [5, 400])  # inserted into place / sorted again with the rest
+def test_prefix_index_after_merge_matches_brute_force(added):
+    rng = random.Random(added)
+    keys = random_keys(rng, 300)
+    weights = [float(rng.randint(1, 50)) for _ in keys]
+    index = PrefixIndex(keys, weights)
+
+    new_keys = random_keys(rng, added)
+    new_weights = [float(rng.randint(1, 50)) for _ in new_keys]
+    index.add(new_keys[:added // 2], new_weights[:added // 2])
+    index.add(new_keys[added // 2:], new_weights[added // 2:])
+    index.merge()
+    keys, weights = keys + new_keys, weights + new_weights
+
+    assert len(index) == len(keys)
+    assert [index.key(row) for row in range(len(keys))] == keys
+    for prefix in ["g", "gra", "graphs", "net", "networks ", "diffusion m", "zer", "x", "transformer vision"]:
+        assert index.search(prefix, 10) == expected(keys, weights, prefix, 10), prefix
+
+
+def test_whole_key_prefixes():
+    keys = ["graph", "graphs", "neural graph"]
+    index = PrefixIndex(keys, [1, 2, 3], words_only=False)
+    assert index.search("graph", 5) == expected(keys, [1, 2, 3], "graph", 5, words_only=False) == [1, 0]
+
+
+def store(session, titles, first_id):
+    session.execute(insert(Paper), [{"id": i, "title": title, "title_key": title_key(title),
+                                     "conference": "CVPR", "year": 2024} for i, title in enumerate(titles, first_id)])
+    session.commit()
+
+
+def test_suggester_refresh_adds_only_new_papers(session):
+    store(session, ["Graph Neural Networks", "Graph Transformers", "Schrödinger Bridges"], 1)
+    suggester = Suggester()
+    assert suggester.refresh(session) == 3
+    assert suggester.suggest("graph")["paper_ids"] == [2, 1]
+    assert suggester.suggest("schro")["keywords"] == ["Schrödinger"]
+    assert suggester.suggest("trans")["keywords"] == ["Transformers"]
+
+    store(session, ["Graph Diffusion", "Diffusion Transformers", "Transfer Learning"], 4)
+    assert suggester.refresh(session) == 3
+    assert suggester.refresh(session) == 0
+    assert len(suggester) == 6
+    assert suggester.suggest("graph")["paper_ids"] == [4, 2, 1]
+    # "transformers" is now in two titles, "transfer" in one
+    assert suggester.suggest("trans")["keywords"] == ["Transformers", "Transfer"]
+    # Only the last word is completed
+    assert suggester.suggest("graph diff")["keywords"] == ["Diffusion"]
+    assert suggester.suggest("graph diffusion ")["keywords"] == []